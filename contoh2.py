@@ -1,16 +1,334 @@
+import os
+import sqlite3
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import streamlit as st
 import pandas as pd
 import numpy as np
-from scipy.stats import pearsonr, spearmanr
+from scipy.stats import pearsonr, rankdata
+
+from survei.approx import SAMPLE_SIZE, approx_correlation, approx_correlation_matrix, approx_describe, sample_positions
+from survei.assets import thumbnails
+from survei.cache import DiskCache, LRUCache, content_hash, make_key
+from survei.charts import binned_counts, choose_render_mode, correlation_heatmap, stratified_sample
+from survei.correlation import correlation_matrix, correlation_table, spearman_from_ranks, spearman_matrix_from_ranks
+from survei.content import ABOUT, PHOTO_WIDTHS, TEAM, TEAM_PAGE, TEAM_PHOTOS
+from survei.dialect import csv_options
+from survei.dtypes import append_rows, optimize_dtypes
+from survei.excel import OPENPYXL_AVAILABLE, read_sheets, sheet_names
+from survei.grouped import group_codes, group_columns
+from survei.instrument import StageTimer, enable_json_logging
+from survei.jobs import JobTable, process_pool
+from survei.pipeline import describe, numeric_columns
+from survei.preview import FILTER_OPERATORS, column_summary, filter_mask, page_count, page_slice, sort_positions
+from survei.reliability import covariance, default_scale, reliability, reverse_items
+from survei.resampling import matrix_tasks, pair_tasks
+from survei.store import DatasetStore, column_kind, filter_frame, filter_operators, filter_parameter
+from survei.streaming import stream_describe
 
 # =========================================================
 # CEK APAKAH openpyxl TERSEDIA
 # =========================================================
-try:
-    import openpyxl
-    OPENPYXL_AVAILABLE = True
-except ImportError:
-    OPENPYXL_AVAILABLE = False
+# OPENPYXL_AVAILABLE (survei.excel) hanya mencari paketnya tanpa mengimpor;
+# openpyxl baru diimpor saat file Excel diunggah.
+
+# =========================================================
+# CACHE HASIL PARSING DAN ANALISIS (BERSAMA UNTUK SEMUA SESI)
+# =========================================================
+# Batas memori cache (MB) dan umur maksimum entri (menit, 0 = tanpa batas),
+# bisa diatur lewat environment variable
+PARSE_CACHE_MB = int(os.environ.get("SURVEI_PARSE_CACHE_MB", "1024"))
+CACHE_TTL_MINUTES = float(os.environ.get("SURVEI_CACHE_TTL_MIN", "240"))
+# Lokasi dan batas ukuran (MB, 0 = cache disk dimatikan) cache Arrow di disk,
+# dipakai bersama antar proses. Isinya data responden, jadi hanya bisa dibaca
+# pengguna OS yang menjalankan server (lihat DiskCache)
+DISK_CACHE_DIR = os.environ.get("SURVEI_CACHE_DIR", os.path.join(tempfile.gettempdir(), "survei-cache"))
+DISK_CACHE_MB = int(os.environ.get("SURVEI_DISK_CACHE_MB", "4096"))
+# File CSV di atas ukuran ini (MB) otomatis memakai mode streaming
+STREAMING_THRESHOLD_MB = int(os.environ.get("SURVEI_STREAMING_MB", "200"))
+# Jumlah proses pool job latar belakang (dipakai bersama semua sesi) dan interval cek progres (detik)
+JOB_WORKERS = int(os.environ.get("SURVEI_JOB_WORKERS", str(os.cpu_count() or 1)))
+JOB_POLL_SECONDS = 0.5
+# Dataset dengan baris sebanyak ini atau lebih memakai mode progresif secara default
+PROGRESSIVE_ROWS = int(os.environ.get("SURVEI_PROGRESSIVE_ROWS", "1000000"))
+# File SQLite dataset tersimpan (tetap ada setelah server dimulai ulang), batas
+# ukurannya (MB, 0 = penyimpanan dimatikan) dan umur dataset sejak terakhir
+# dibuka (hari, 0 = tanpa batas)
+STORE_PATH = os.environ.get("SURVEI_STORE_PATH", os.path.join(os.path.expanduser("~"), ".survei", "datasets.sqlite"))
+STORE_MB = int(os.environ.get("SURVEI_STORE_MB", "2048"))
+STORE_DAYS = float(os.environ.get("SURVEI_STORE_DAYS", "30"))
+
+
+@st.cache_resource
+def get_parse_cache():
+    # Satu cache per proses, dipakai bersama oleh semua sesi. Kunci selalu
+    # diawali hash isi dataset, jadi pengguna yang membuka file yang sama
+    # memakai hasil parsing dan analisis yang sama.
+    return LRUCache(PARSE_CACHE_MB * 1024 * 1024, ttl_seconds=CACHE_TTL_MINUTES * 60)
+
+
+def format_bytes(nbytes):
+    # Ukuran memori yang mudah dibaca (B/KB/MB/GB)
+    for unit in ("B", "KB", "MB"):
+        if abs(nbytes) < 1024:
+            return f"{nbytes:.1f} {unit}"
+        nbytes /= 1024
+    return f"{nbytes:.1f} GB"
+
+
+@st.cache_resource
+def get_disk_cache():
+    return DiskCache(DISK_CACHE_DIR, DISK_CACHE_MB * 1024 * 1024)
+
+
+@st.cache_resource
+def get_thumbnails():
+    # Foto tim diperkecil sekali per proses (dan disimpan di disk untuk proses berikutnya)
+    return thumbnails(TEAM_PHOTOS, tuple(PHOTO_WIDTHS.values()), os.path.join(DISK_CACHE_DIR, "thumbnails"))
+
+
+def upload_digest(uploaded_file):
+    # Hash isi file hanya dihitung sekali per unggahan (per file_id)
+    file_id = getattr(uploaded_file, "file_id", None) or (uploaded_file.name, uploaded_file.size)
+    digests = st.session_state.setdefault("_upload_digests", {})
+    if file_id not in digests:
+        digests.clear()
+        digests[file_id] = content_hash(uploaded_file.getvalue())
+    return digests[file_id]
+
+
+def read_upload(uploaded_file, reader, **options):
+    # Parsing hanya dijalankan jika kombinasi isi file + opsi belum ada di cache.
+    # Kunci cache dikembalikan juga sebagai penanda versi dataset.
+    key = make_key(upload_digest(uploaded_file), reader, **options)
+
+    def load():
+        # Sesi lain (atau proses lain) mungkin sudah menyimpan hasilnya di disk
+        df = get_disk_cache().get(key)
+        if df is None:
+            uploaded_file.seek(0)
+            if reader == "csv":
+                df = pd.read_csv(uploaded_file, **options)
+            elif reader == "excel":
+                df = read_sheets(uploaded_file.getvalue(), **options)
+            else:
+                df = pd.read_excel(uploaded_file, **options)
+            # Perkecil tipe data (Likert -> int8, teks berulang -> category, dst.)
+            df = optimize_dtypes(df)
+            get_disk_cache().put(key, df)
+        return df
+
+    # Sesi yang mengunggah file sama secara bersamaan menunggu parsing pertama
+    return get_parse_cache().get_or_compute(key, load), key
+
+
+def upload_csv_options(uploaded_file):
+    # Format CSV (pemisah, desimal, encoding, header) dari 64 KB pertama, sekali per unggahan
+    key = make_key(upload_digest(uploaded_file), "csv-dialect")
+    return get_parse_cache().get_or_compute(key, lambda: csv_options(uploaded_file))
+
+
+def upload_sheet_names(uploaded_file):
+    # Nama sheet Excel, dibaca sekali per unggahan
+    key = make_key(upload_digest(uploaded_file), "excel-sheets")
+    return get_parse_cache().get_or_compute(key, lambda: sheet_names(uploaded_file.getvalue()))
+
+
+def stream_upload(uploaded_file):
+    # Statistik deskriptif CSV per potongan tanpa membuat DataFrame penuh
+    key = make_key(upload_digest(uploaded_file), "csv-stream")
+    cache = get_parse_cache()
+    summary = cache.get(key)
+    if summary is None:
+        uploaded_file.seek(0)
+        total = max(uploaded_file.size, 1)
+        progress = st.progress(0.0)
+
+        def on_progress(rows):
+            label = "baris dibaca" if language == "Indonesia" else "rows read"
+            progress.progress(min(uploaded_file.tell() / total, 1.0), text=f"{rows:,} {label}")
+
+        # Parser pyarrow tidak mendukung pembacaan per potongan
+        options = {name: value for name, value in upload_csv_options(uploaded_file).items() if name != "engine"}
+        summary = stream_describe(uploaded_file, on_progress=on_progress, **options)
+        progress.empty()
+        cache.put(key, summary)
+    return summary
+
+
+def cached_column_summary(dataset_key, df):
+    # Ringkasan tipe data dan data kosong per kolom untuk pratinjau
+    return get_parse_cache().get_or_compute((dataset_key, "column-summary"), lambda: column_summary(df))
+
+
+def preview_positions(dataset_key, df, sort_col, ascending, filter_col, operator, filter_value):
+    # Posisi baris pratinjau setelah diurutkan/disaring; hasil disimpan di cache
+    cache = get_parse_cache()
+
+    def compute():
+        if sort_col is None:
+            positions = np.arange(len(df))
+        else:
+            positions = cache.get_or_compute(
+                (dataset_key, "sort", sort_col, ascending),
+                lambda: sort_positions(df[sort_col], ascending)
+            )
+        if filter_col is not None and filter_value != "":
+            mask = filter_mask(df[filter_col], operator, filter_value)
+            positions = positions[mask[positions]]
+        return positions
+
+    key = (dataset_key, "preview-rows", sort_col, ascending, filter_col, operator, filter_value)
+    return cache.get_or_compute(key, compute)
+
+
+def cached_group_columns(dataset_key, df):
+    # Kolom kategori yang bisa dipakai untuk pengelompokan
+    return get_parse_cache().get_or_compute((dataset_key, "group-columns"), lambda: group_columns(df))
+
+
+def cached_sample(dataset_key, df, by=()):
+    # Posisi baris sampel untuk hasil perkiraan; berstrata menurut kolom ``by`` jika ada
+    def compute():
+        strata = group_codes(df, list(by))[0] if by else None
+        return sample_positions(len(df), strata=strata)
+
+    return get_parse_cache().get_or_compute((dataset_key, "sample", tuple(by)), compute)
+
+
+# ``cache`` bisa diberikan langsung agar fungsi di bawah aman dipanggil dari
+# thread job (di luar script Streamlit)
+def cached_ranks(dataset_key, df, column, cache=None):
+    # Peringkat satu kolom, dihitung sekali per versi dataset (NaN tetap NaN)
+    def compute():
+        return rankdata(df[column].to_numpy(dtype=float, na_value=np.nan), nan_policy="omit")
+
+    cache = get_parse_cache() if cache is None else cache
+    return cache.get_or_compute((dataset_key, "rank", column), compute)
+
+
+def dataset_correlation_matrix(dataset_key, df, columns, method, missing, cache=None):
+    # Matriks korelasi semua pasangan (hasilnya disimpan oleh pemanggil, lihat progressive_result)
+    values = df[columns].to_numpy(dtype=float, na_value=np.nan)
+    complete = not np.isnan(values).any()
+    if method == "Spearman" and (missing == "pairwise" or complete):
+        # Spearman dari peringkat kolom yang sudah ada di cache; pasangan dengan
+        # pola data hilang berbeda diranking ulang pada baris lengkapnya
+        ranks = np.column_stack([cached_ranks(dataset_key, df, column, cache) for column in columns])
+        return spearman_matrix_from_ranks(ranks)
+    return correlation_matrix(values, method=method.lower(), missing=missing)
+
+
+def cached_covariance(dataset_key, df, columns):
+    # Kovarians item (baris lengkap) untuk analisis reliabilitas, sekali per kumpulan kolom
+    return get_parse_cache().get_or_compute(
+        (dataset_key, "covariance", tuple(columns)),
+        lambda: covariance(df[columns].to_numpy(dtype=float, na_value=np.nan))
+    )
+
+
+@st.cache_resource
+def get_job_executor():
+    # Satu process pool per server; script Streamlit tidak ikut terblokir
+    return process_pool(JOB_WORKERS)
+
+
+@st.cache_resource
+def get_thread_executor():
+    # Thread untuk hasil pasti mode progresif: memakai DataFrame yang sama tanpa disalin
+    return ThreadPoolExecutor(max_workers=JOB_WORKERS)
+
+
+def session_jobs():
+    # Tabel job milik sesi ini (satu job aktif per slot)
+    return st.session_state.setdefault("_jobs", JobTable())
+
+
+@st.cache_resource
+def get_dataset_store():
+    return DatasetStore(STORE_PATH, STORE_MB * 1024 * 1024, STORE_DAYS * 86400 if STORE_DAYS > 0 else None)
+
+
+@st.cache_resource
+def get_store_futures():
+    # Penyimpanan dataset yang sedang/sudah berjalan, per kunci dataset
+    return {}
+
+
+def store_upload(dataset_key, name, df):
+    # Simpan dataset unggahan ke penyimpanan lokal di thread latar belakang, sekali per dataset.
+    # Sesi yang menyimpan dicatat agar hanya sesi itu yang bisa menghapusnya.
+    futures = get_store_futures()
+    key = repr(dataset_key)
+    if key not in futures:
+        futures[key] = get_thread_executor().submit(get_dataset_store().ingest, key, name, df)
+        st.session_state.setdefault("_stored_keys", set()).add(key)
+    return futures[key]
+
+
+def cached_subset(dataset_key, df, columns, filters):
+    # Responden dan variabel terpilih dari dataset yang sudah di memori
+    key = (dataset_key, "subset", tuple(columns), tuple(filters))
+    return get_parse_cache().get_or_compute(key, lambda: filter_frame(df, filters, columns)), key
+
+
+def stored_subset(store_key, version, columns, filters):
+    # Query ke penyimpanan lokal: hanya baris dan kolom terpilih yang dibaca.
+    # Versi naik setiap ada batch baru; jika subset yang sama dari versi
+    # sebelumnya masih di cache, hanya baris batch baru yang dibaca lalu
+    # ditambahkan di bawahnya (tanpa membaca ulang seluruh tabel).
+    cache = get_parse_cache()
+    key = ("store", store_key, version, tuple(columns), tuple(filters))
+    
+    def load():
+        store = get_dataset_store()
+        older = sorted(
+            (cached for cached in cache.keys()
+             if len(cached) == 5 and cached[:2] == key[:2] and cached[3:] == key[3:] and cached[2] < version),
+            reverse=True
+        )
+        for cached in older:
+            previous = cache.get(cached)
+            if previous is None:
+                continue
+            try:
+                df = append_rows(previous, store.query(store_key, columns, filters, since_version=cached[2]))
+            except ValueError:
+                break
+            # Subset versi lama tidak akan dibaca lagi
+            cache.discard(cached)
+            return df
+        return store.query(store_key, columns, filters)
+    
+    return cache.get_or_compute(key, load), key
+
+
+def stored_accumulator(store_key, version):
+    # Akumulator statistik dataset tersimpan (deskriptif dan korelasi Pearson tanpa membaca data)
+    cache = get_parse_cache()
+    key = ("store", store_key, version, "accumulator")
+    for cached in cache.keys():
+        # Akumulator versi lama tidak akan dibaca lagi
+        if len(cached) == 4 and cached[:2] == key[:2] and cached[3] == key[3] and cached[2] < version:
+            cache.discard(cached)
+    return cache.get_or_compute(key, lambda: get_dataset_store().accumulator(store_key))
+
+
+def read_batch(uploaded_file):
+    # Batch responden baru (CSV atau sheet pertama Excel), tidak disimpan di cache
+    uploaded_file.seek(0)
+    file_name = uploaded_file.name.lower()
+    if file_name.endswith(".csv"):
+        df = pd.read_csv(uploaded_file, **csv_options(uploaded_file))
+    elif file_name.endswith(".xlsx"):
+        data = uploaded_file.getvalue()
+        df = read_sheets(data, sheet_names(data)[:1])
+    else:
+        df = pd.read_excel(uploaded_file)
+    return optimize_dtypes(df)
+
 
 # =========================================================
 # KONFIGURASI HALAMAN
@@ -35,6 +353,38 @@ menu = st.sidebar.radio(
     ("Tentang Aplikasi", "Profil Tim", "Analisis Data")
 )
 
+# =========================================================
+# PANEL DEBUG PERFORMA
+# =========================================================
+# Waktu, CPU dan memori per tahap; juga ditulis sebagai log JSON ke stderr
+debug_perf = st.sidebar.checkbox(
+    "🐞 Panel debug performa" if language == "Indonesia" else "🐞 Performance debug panel",
+    value=os.environ.get("SURVEI_DEBUG_PERF") == "1"
+)
+
+if debug_perf:
+    enable_json_logging()
+    perf_panel = st.sidebar.expander("⏱️ Waktu per tahap" if language == "Indonesia" else "⏱️ Time per stage", expanded=True).empty()
+
+    def show_perf(timer):
+        perf_panel.dataframe(pd.DataFrame(timer.records), hide_index=True)
+
+    perf = StageTimer(enabled=True, on_record=show_perf, page=menu)
+
+    # Statistik cache bersama (semua sesi di proses server ini)
+    with st.sidebar.expander("🗄️ Cache bersama" if language == "Indonesia" else "🗄️ Shared cache"):
+        cache_stats = get_parse_cache().stats()
+        st.metric("Hit rate", f"{cache_stats['hit_rate']:.0%}")
+        st.caption(
+            f"{cache_stats['entries']} entri, {format_bytes(cache_stats['total_bytes'])} / {format_bytes(cache_stats['budget_bytes'])} · "
+            f"hit {cache_stats['hits']}, miss {cache_stats['misses']}, eviksi {cache_stats['evictions']}, kedaluwarsa {cache_stats['expirations']}"
+            if language == "Indonesia" else
+            f"{cache_stats['entries']} entries, {format_bytes(cache_stats['total_bytes'])} / {format_bytes(cache_stats['budget_bytes'])} · "
+            f"{cache_stats['hits']} hits, {cache_stats['misses']} misses, {cache_stats['evictions']} evictions, {cache_stats['expirations']} expired"
+        )
+else:
+    perf = StageTimer(enabled=False)
+
 # =========================================================
 # VARIABEL TEKS
 # =========================================================
@@ -61,310 +411,869 @@ else:
 st.title(app_title)
 
 # =========================================================
-# HALAMAN TENTANG APLIKASI
+# SEKSI ANALISIS (FRAGMENT)
 # =========================================================
-if menu == "Tentang Aplikasi":
+def fragment_timer(name):
+    # Catatan performa milik fragment; ditampilkan di dalam fragment itu sendiri.
+    # Id rerun diambil dari timer skrip utama agar log fragment bisa dikaitkan dengannya.
+    return StageTimer(enabled=debug_perf, rerun=perf.context["rerun"], page=menu, fragment=name)
+
+
+def show_fragment_perf(timer):
+    if timer.records:
+        with st.expander("⏱️ Waktu per tahap" if language == "Indonesia" else "⏱️ Time per stage"):
+            st.dataframe(pd.DataFrame(timer.records), hide_index=True)
+
+
+@st.fragment(run_every=JOB_POLL_SECONDS)
+def job_progress(slot):
+    # Hanya dipanggil selama job berjalan: progres diperbarui otomatis, lalu
+    # satu rerun penuh saat job selesai/dibatalkan agar hasilnya tampil
+    job = session_jobs().get(slot)
+    if job is None or job.status != "running":
+        st.rerun()
+    label = "selesai" if language == "Indonesia" else "done"
+    st.progress(job.progress, text=f"{job.label}: {job.progress:.0%} {label}")
+    st.button("⏹️ Batalkan" if language == "Indonesia" else "⏹️ Cancel", key=f"cancel-{slot}", on_click=session_jobs().cancel, args=(slot,))
+
+
+def background_result(slot, key, plan, label, executor=None):
+    # Hasil diambil dari cache jika sudah pernah dihitung (oleh sesi mana pun).
+    # Jika belum, ``plan()`` -> (tasks, finish) dikirim sebagai job latar belakang
+    # (default: process pool); selama job berjalan fungsi ini mengembalikan None.
+    cache = get_parse_cache()
+    result = cache.get(key)
+    if result is not None:
+        return result
+    jobs = session_jobs()
+    job = jobs.get(slot)
+    if job is None or job.key != key:
+        tasks, finish = plan()
+        job = jobs.submit(executor or get_job_executor(), slot, key, tasks, finish, label=label)
+    
+    status = job.status
+    if status == "done":
+        result = job.result()
+        cache.put(key, result)
+        return result
+    if status == "running":
+        job_progress(slot)
+    else:
+        if status == "cancelled":
+            st.info("Perhitungan dibatalkan." if language == "Indonesia" else "Computation cancelled.")
+        else:
+            st.error(f"Perhitungan gagal: {job.error}" if language == "Indonesia" else f"Computation failed: {job.error}")
+        st.button("🔁 Jalankan lagi" if language == "Indonesia" else "🔁 Run again", key=f"retry-{slot}", on_click=jobs.discard, args=(slot,))
+    return None
+
+
+def progressive_result(slot, key, exact, approximate, label, enabled):
+    # Mode progresif: hasil perkiraan dari sampel ditampilkan selama ``exact()``
+    # berjalan di thread job, lalu diganti hasil pasti. Mengembalikan
+    # (hasil, perkiraan?).
+    if not enabled:
+        return get_parse_cache().get_or_compute(key, exact), False
+    result = background_result(
+        slot, key, lambda: ([(exact, ())], lambda results: results[0]), label, executor=get_thread_executor()
+    )
+    if result is not None:
+        return result, False
+    return get_parse_cache().get_or_compute(key + ("approx",), approximate), True
+
+
+def approx_notice(n_sample):
+    # Penanda bahwa nilai yang tampil masih perkiraan
+    st.caption(
+        f"≈ Nilai perkiraan dari sampel acak {n_sample:,} baris (batas galat 95%); akan diganti hasil pasti." if language == "Indonesia"
+        else f"≈ Approximate values from a random sample of {n_sample:,} rows (95% error bounds); exact results will replace them."
+    )
+
+
+def drop_stale_jobs(slots, active_slots):
+    # Job yang tidak lagi dibutuhkan (input berubah / opsi dimatikan) dihentikan
+    jobs = session_jobs()
+    for slot in slots:
+        job = jobs.get(slot)
+        if slot not in active_slots and job is not None and job.status == "running":
+            jobs.discard(slot)
+
+
+def show_jobs():
+    # Tabel job latar belakang milik sesi ini
+    rows = session_jobs().summary()
+    if rows:
+        status_names = (
+            {"running": "berjalan", "done": "selesai", "cancelled": "dibatalkan", "failed": "gagal"} if language == "Indonesia"
+            else {"running": "running", "done": "done", "cancelled": "cancelled", "failed": "failed"}
+        )
+        table = pd.DataFrame(rows)
+        table["status"] = table["status"].map(status_names)
+        with st.expander("🧵 Job Latar Belakang" if language == "Indonesia" else "🧵 Background Jobs"):
+            st.dataframe(table, hide_index=True)
+            if any(row["status"] == "running" for row in rows):
+                st.button(
+                    "⏹️ Batalkan semua job" if language == "Indonesia" else "⏹️ Cancel all jobs",
+                    key="cancel-all-jobs",
+                    on_click=session_jobs().cancel_all
+                )
+
+
+@st.fragment
+def descriptive_section(df, dataset_key, numeric_cols, progressive=False, accumulator=None):
+    # Dijalankan ulang sendiri saat widget di dalamnya berubah (tanpa rerun seluruh skrip)
+    perf = fragment_timer("descriptive")
+    active_slots = set()
+    
+    st.markdown("---")
+    
     if language == "Indonesia":
-        st.header("📌 Tentang Aplikasi")
-        st.write("""
-        Aplikasi ini digunakan untuk menganalisis data survei secara interaktif.
-        
-        **Fitur Utama:**
-        - Upload data dari Excel atau CSV
-        - Analisis statistik deskriptif
-        - Analisis korelasi antar variabel
-        - Antarmuka bilingual (Indonesia/English)
-        
-        **Teknologi yang Digunakan:**
-        - Python
-        - Streamlit
-        - Pandas
-        - NumPy
-        - SciPy
-        """)
+        st.subheader("📊 Analisis Deskriptif")
+        var_label = "Pilih variabel numerik"
     else:
-        st.header("📌 About This Application")
-        st.write("""
-        This application is used to analyze survey data interactively.
+        st.subheader("📊 Descriptive Analysis")
+        var_label = "Select numeric variables"
+    
+    if not numeric_cols:
+        if language == "Indonesia":
+            st.warning("Tidak ditemukan variabel numerik dalam data.")
+        else:
+            st.warning("No numeric variables found in the data.")
+    else:
+        selected_vars = st.multiselect(
+            var_label,
+            numeric_cols,
+            default=numeric_cols[:min(5, len(numeric_cols))]
+        )
         
-        **Main Features:**
-        - Upload data from Excel or CSV
-        - Descriptive statistical analysis
-        - Correlation analysis between variables
-        - Bilingual interface (Indonesia/English)
+        # Statistik per segmen (fakultas, jenis kelamin, angkatan, ...); urutan pilihan = urutan pengelompokan
+        group_by = st.multiselect(
+            "Kelompokkan menurut (opsional)" if language == "Indonesia" else "Group by (optional)",
+            cached_group_columns(dataset_key, df)
+        )
         
-        **Technologies Used:**
-        - Python
-        - Streamlit
-        - Pandas
-        - NumPy
-        - SciPy
-        """)
+        if selected_vars:
+            # Dataset tersimpan tanpa filter: statistik langsung dari akumulator
+            incremental = accumulator is not None and not group_by
+            if progressive and not incremental:
+                active_slots.add("exact-describe")
+            with perf.stage("describe", rows=len(df)):
+                table, approximate = progressive_result(
+                    "exact-describe",
+                    (dataset_key, "describe", tuple(selected_vars), tuple(group_by)),
+                    (lambda: accumulator.describe(selected_vars)) if incremental else (lambda: describe(df, selected_vars, by=group_by)),
+                    lambda: approx_describe(df, selected_vars, cached_sample(dataset_key, df, tuple(group_by)), by=group_by),
+                    "Statistik deskriptif (pasti)" if language == "Indonesia" else "Descriptive statistics (exact)",
+                    progressive and not incremental
+                )
+                table = table.rename(columns={"mean_margin": "± mean (95%)"})
+                if group_by:
+                    table = table.reset_index().rename(columns={"variable": "Variabel" if language == "Indonesia" else "Variable"})
+                    st.dataframe(table, hide_index=True)
+                else:
+                    st.dataframe(table)
+            if approximate:
+                approx_notice(len(cached_sample(dataset_key, df, tuple(group_by))))
+            elif incremental and not accumulator.exact_quantiles(selected_vars):
+                st.caption("Kuartil (25%, 50%, 75%) merupakan nilai perkiraan." if language == "Indonesia" else "Quartiles (25%, 50%, 75%) are approximate.")
+    
+    drop_stale_jobs(["exact-describe"], active_slots)
+    show_fragment_perf(perf)
 
-# =========================================================
-# HALAMAN PROFIL TIM (DENGAN FOTO & KONTRIBUSI)
-# =========================================================
-elif menu == "Profil Tim":
+
+@st.fragment
+def correlation_section(df, dataset_key, numeric_cols, progressive=False, accumulator=None):
+    # Dijalankan ulang sendiri saat widget di dalamnya berubah (tanpa rerun seluruh skrip)
+    perf = fragment_timer("correlation")
+    
+    st.markdown("---")
+    
     if language == "Indonesia":
-        st.header("👥 Profil Tim")
-        st.markdown("Kenali anggota tim pengembang aplikasi ini beserta kontribusi mereka.")
-        
-        # Data tim lengkap dengan foto dan kontribusi
-        members = [
-            {
-                "nama": "Agni Aisyah Putri",
-                "id": "004202400137",
-                "foto": "agni.jpeg",
-                "role": "Ketua Tim & Backend Developer",
-                "kontribusi": [
-                    "Mengembangkan struktur dan logika utama aplikasi",
-                    "Implementasi analisis statistik deskriptif",
-                    "Membuat fungsi korelasi Pearson dan Spearman",
-                    "Menyiapkan dan mengolah data responden",
-                    "Mengelola deployment aplikasi",
-                    "Membuat dokumentasi teknis"
-                ]
-            },
-            {
-                "nama": "Andita Nurul Azizah",
-                "id": "004202400059",
-                "foto": "andita.jpeg",
-                "role": "Frontend Developer & UI Designer",
-                "kontribusi": [
-                    "Mendesain antarmuka pengguna aplikasi",
-                    "Membuat halaman profil tim",
-                    "Implementasi sistem bilingual",
-                    "Mengembangkan layout responsif",
-                    "Membuat Google Form survei",
-                    "Mendesain visualisasi data"
-                ]
-            },
-            {
-                "nama": "Cahyani Dwi Gemawang",
-                "id": "004202400044",
-                "foto": "cahyani.jpeg",
-                "role": "Data Analyst & Documentation",
-                "kontribusi": [
-                    "Analisis data survei responden",
-                    "Menyusun laporan hasil analisis",
-                    "Membuat panduan penggunaan aplikasi",
-                    "Testing dan debugging aplikasi",
-                    "Dokumentasi proyek",
-                    "Presentasi hasil proyek"
-                ]
-            }
-        ]
-        
-        # Pilih mode tampilan
-        st.subheader("📋 Detail Anggota Tim")
-        
-        # Dropdown untuk memilih anggota
-        selected_member_name = st.selectbox(
-            "Pilih anggota untuk melihat detail:",
-            [member["nama"] for member in members]
+        st.subheader("🔗 Analisis Korelasi")
+        x_label = "Variabel X"
+        y_label = "Variabel Y"
+        method_label = "Metode Korelasi"
+        result_title = "📈 Hasil Analisis"
+        interp_title = "📋 Interpretasi Korelasi"
+        mode_label = "Mode Analisis"
+        pair_mode = "Pasangan Variabel"
+        matrix_mode = "Matriks Korelasi"
+        missing_label = "Penanganan Data Hilang"
+        missing_options = {"Pairwise (per pasangan)": "pairwise", "Listwise (hanya baris lengkap)": "listwise"}
+    else:
+        st.subheader("🔗 Correlation Analysis")
+        x_label = "Variable X"
+        y_label = "Variable Y"
+        method_label = "Correlation Method"
+        result_title = "📈 Analysis Result"
+        interp_title = "📋 Correlation Interpretation"
+        mode_label = "Analysis Mode"
+        pair_mode = "Variable Pair"
+        matrix_mode = "Correlation Matrix"
+        missing_label = "Missing Data Handling"
+        missing_options = {"Pairwise (per pair)": "pairwise", "Listwise (complete rows only)": "listwise"}
+    
+    def resampling_options():
+        # Opsi bootstrap/permutasi; hanya dihitung jika dicentang
+        enabled = st.checkbox(
+            "Hitung CI bootstrap 95% dan nilai-p permutasi" if language == "Indonesia"
+            else "Compute 95% bootstrap CI and permutation p-value"
         )
+        if not enabled:
+            return None
+        col_b1, col_b2 = st.columns(2)
+        with col_b1:
+            n_resamples = st.selectbox("Jumlah resample" if language == "Indonesia" else "Number of resamples", [1000, 2000, 5000, 10000], index=1)
+        with col_b2:
+            seed = int(st.number_input("Seed", min_value=0, value=0, step=1))
+        return n_resamples, seed
+    
+    # Slot job yang masih dibutuhkan; job lain yang masih berjalan dihentikan di akhir
+    active_slots = set()
+    
+    if numeric_cols:
+        corr_mode = st.radio(mode_label, [pair_mode, matrix_mode], index=0, horizontal=True)
+    else:
+        corr_mode = None
+    
+    if corr_mode == matrix_mode:
+        # Semua pasangan variabel dihitung sekaligus dalam satu perkalian matriks
+        matrix_vars = st.multiselect(
+            "Variabel untuk matriks korelasi" if language == "Indonesia" else "Variables for the correlation matrix",
+            numeric_cols,
+            default=numeric_cols
+        )
+        # Listwise hanya memakai baris yang lengkap pada variabel yang dipilih
+        missing = missing_options[st.radio(missing_label, list(missing_options), index=0, horizontal=True)]
         
-        # Cari anggota yang dipilih
-        selected_member = next(member for member in members if member["nama"] == selected_member_name)
-        
-        # Tampilkan detail anggota yang dipilih
-        col_foto, col_info = st.columns([1, 2])
+        matrix_method = st.radio(
+            method_label,
+            ["Pearson", "Spearman"],
+            index=0
+        )
         
-        with col_foto:
-            st.image(selected_member["foto"], width=220)
-            st.markdown(f"**Nama:** {selected_member['nama']}")
-            st.markdown(f"**ID:** `{selected_member['id']}`")
-            st.markdown(f"**Peran:** {selected_member['role']}")
+        resampling = resampling_options()
         
-        with col_info:
-            st.markdown("### 📝 Kontribusi")
-            for i, kontrib in enumerate(selected_member["kontribusi"], 1):
-                st.markdown(f"{i}. **{kontrib}**")
+        if len(matrix_vars) < 2:
+            st.warning("Pilih minimal dua variabel" if language == "Indonesia" else "Select at least two variables")
+        else:
+            # Pearson pairwise (atau listwise tanpa data kosong) bisa langsung dari co-moment akumulator
+            incremental = (
+                accumulator is not None and matrix_method == "Pearson"
+                and (missing == "pairwise" or accumulator.complete(matrix_vars))
+            )
+            if progressive and not incremental:
+                active_slots.add("exact-matrix")
+            cache = get_parse_cache()
             
-            # Statistik kontribusi
-            st.markdown("---")
-            col_stat1, col_stat2, col_stat3 = st.columns(3)
-            with col_stat1:
-                st.metric("Total Kontribusi", len(selected_member["kontribusi"]))
-            with col_stat2:
-                st.metric("Peran", selected_member["role"].split("&")[0].strip())
-            with col_stat3:
-                st.metric("Status", "Aktif")
-        
-        st.markdown("---")
-        
-        # Tampilkan semua anggota dalam grid
-        st.subheader("🌟 Semua Anggota Tim")
-        
-        cols = st.columns(3)
-        for idx, member in enumerate(members):
-            with cols[idx]:
-                # Card untuk setiap anggota
-                with st.container():
-                    st.image(member["foto"], width=180)
-                    st.markdown(f"**{member['nama']}**")
-                    st.markdown(f"*{member['role']}*")
-                    st.markdown(f"`{member['id']}`")
-                    
-                    with st.expander(f"Lihat {len(member['kontribusi'])} kontribusi"):
-                        for kontrib in member["kontribusi"]:
-                            st.write(f"• {kontrib}")
-        
-        # Informasi proyek
-        st.markdown("---")
-        st.subheader("📚 Tentang Proyek")
-        
-        col_proj1, col_proj2 = st.columns(2)
+            def approximate_matrix():
+                sample = cached_sample(dataset_key, df)
+                values = df[matrix_vars].iloc[sample].to_numpy(dtype=float, na_value=np.nan)
+                return approx_correlation_matrix(values, len(df), method=matrix_method.lower(), missing=missing)
+            
+            with perf.stage("correlation_matrix", rows=len(df)):
+                matrix_result, approximate = progressive_result(
+                    "exact-matrix",
+                    (dataset_key, "corr-matrix", matrix_method, missing, tuple(matrix_vars)),
+                    (lambda: accumulator.correlation(matrix_vars)) if incremental
+                    else (lambda: dataset_correlation_matrix(dataset_key, df, matrix_vars, matrix_method, missing, cache)),
+                    approximate_matrix,
+                    "Matriks korelasi (pasti)" if language == "Indonesia" else "Correlation matrix (exact)",
+                    progressive and not incremental
+                )
+                r_matrix, p_matrix, n_matrix = matrix_result[:3]
+            n_min = int(n_matrix.min())
+            n_max = int(n_matrix.max())
+            
+            if n_max < 3:
+                st.warning("Data tidak cukup untuk analisis korelasi" if language == "Indonesia" else "Insufficient data for correlation analysis")
+            else:
+                st.markdown(f"### {result_title}")
+                st.caption(
+                    f"{len(matrix_vars) * (len(matrix_vars) - 1) // 2} pasangan, N = {n_min}–{n_max}" if language == "Indonesia"
+                    else f"{len(matrix_vars) * (len(matrix_vars) - 1) // 2} pairs, N = {n_min}–{n_max}"
+                )
+                
+                pairs = correlation_table(matrix_vars, r_matrix, p_matrix, n_matrix)
+                pairs.columns = (
+                    ["Variabel 1", "Variabel 2", "Koefisien Korelasi", "Nilai-p", "N"] if language == "Indonesia"
+                    else ["Variable 1", "Variable 2", "Correlation Coefficient", "P-value", "N"]
+                )
+                # Urutan baris tabel mengikuti nama variabel, jadi nilai diambil per pasangan
+                position = {name: i for i, name in enumerate(matrix_vars)}
+                i = pairs.iloc[:, 0].map(position).to_numpy()
+                j = pairs.iloc[:, 1].map(position).to_numpy()
+                
+                if approximate:
+                    low, high = matrix_result[3:]
+                    pairs.insert(3, "± r (95%)", np.fmax(r_matrix - low, high - r_matrix)[i, j])
+                    approx_notice(len(cached_sample(dataset_key, df)))
+                
+                if resampling is not None:
+                    n_resamples, seed = resampling
+                    active_slots.add("resampling-matrix")
+                    resampled = background_result(
+                        "resampling-matrix",
+                        (dataset_key, "resampling-matrix", matrix_method, missing, tuple(matrix_vars), n_resamples, seed),
+                        lambda: matrix_tasks(
+                            df[matrix_vars].to_numpy(dtype=float, na_value=np.nan),
+                            method=matrix_method.lower(), missing=missing, n_resamples=n_resamples, seed=seed
+                        ),
+                        "Bootstrap & permutasi (matriks)" if language == "Indonesia" else "Bootstrap & permutations (matrix)"
+                    )
+                else:
+                    resampled = None
+                
+                if resampled is not None:
+                    low, high, p_perm = resampled
+                    pairs["CI 95% (bawah)" if language == "Indonesia" else "95% CI (low)"] = low[i, j]
+                    pairs["CI 95% (atas)" if language == "Indonesia" else "95% CI (high)"] = high[i, j]
+                    pairs["Nilai-p Permutasi" if language == "Indonesia" else "Permutation P-value"] = p_perm[i, j]
+                    st.caption(
+                        f"Bootstrap dan permutasi memakai {n_resamples} resample (seed {seed})." if language == "Indonesia"
+                        else f"Bootstrap and permutations use {n_resamples} resamples (seed {seed})."
+                    )
+                st.dataframe(pairs, use_container_width=True, hide_index=True)
+                
+                st.markdown("#### 🌡️ Heatmap Korelasi" if language == "Indonesia" else "#### 🌡️ Correlation Heatmap")
+                with perf.stage("chart", rows=len(matrix_vars)):
+                    st.pyplot(correlation_heatmap(matrix_vars, r_matrix))
+    
+    elif numeric_cols:
+        col1, col2 = st.columns(2)
+        with col1:
+            var_x = st.selectbox(x_label, numeric_cols)
+        with col2:
+            other_cols = [col for col in numeric_cols if col != var_x]
+            if other_cols:
+                var_y = st.selectbox(y_label, other_cols, index=0)
+            else:
+                var_y = None
+                st.warning("Hanya satu variabel numerik tersedia" if language == "Indonesia" else "Only one numeric variable available")
         
-        with col_proj1:
-            st.markdown("""
-            ### 🎯 Tujuan Proyek
-            - Membuat aplikasi analisis data survei yang interaktif
-            - Menerapkan konsep statistik dalam bentuk aplikasi web
-            - Membantu proses pembelajaran analisis data
-            - Menghasilkan produk yang bermanfaat untuk penelitian
-            """)
+        method = st.radio(
+            method_label,
+            ["Pearson", "Spearman"],
+            index=0
+        )
         
-        with col_proj2:
-            st.markdown("""
-            ### 📅 Timeline Proyek
-            - **Perencanaan**: 1 minggu
-            - **Pengembangan**: 2 minggu
-            - **Testing**: 3 hari
-            - **Deployment**: 2 hari
-            - **Dokumentasi**: 2 hari
-            """)
+        resampling = resampling_options()
         
+        if var_x and var_y:
+            # Baris valid dipilih dengan masker NaN, tanpa menyalin DataFrame per pasangan.
+            # Untuk satu pasangan, pairwise dan listwise sama: baris yang terisi di X dan Y.
+            valid = df[var_x].notna().to_numpy() & df[var_y].notna().to_numpy()
+            x = df[var_x][valid]
+            y = df[var_y][valid]
+            
+            if len(x) < 2:
+                st.warning("Data tidak cukup untuk analisis korelasi" if language == "Indonesia" else "Insufficient data for correlation analysis")
+            else:
+                if progressive:
+                    active_slots.add("exact-pair")
+                cache = get_parse_cache()
+                
+                def exact_pair():
+                    if method == "Pearson":
+                        result = pearsonr(x, y)
+                    else:
+                        result = spearman_from_ranks(
+                            cached_ranks(dataset_key, df, var_x, cache),
+                            cached_ranks(dataset_key, df, var_y, cache),
+                            valid
+                        )
+                    return float(result[0]), float(result[1])
+                
+                def approximate_pair():
+                    sample = cached_sample(dataset_key, df)
+                    sample = sample[valid[sample]]
+                    r, low, high, p = approx_correlation(
+                        df[var_x].iloc[sample].to_numpy(dtype=float), df[var_y].iloc[sample].to_numpy(dtype=float),
+                        len(x), method=method.lower()
+                    )
+                    return r, p, low, high
+                
+                with perf.stage("correlation", rows=len(x)):
+                    pair_result, approximate = progressive_result(
+                        "exact-pair",
+                        (dataset_key, "pair-corr", var_x, var_y, method),
+                        exact_pair,
+                        approximate_pair,
+                        "Korelasi (pasti)" if language == "Indonesia" else "Correlation (exact)",
+                        progressive
+                    )
+                corr, p_value = pair_result[:2]
+                
+                # Tampilkan hasil
+                st.markdown(f"### {result_title}")
+                
+                col_res1, col_res2, col_res3 = st.columns(3)
+                with col_res1:
+                    st.metric("Metode" if language == "Indonesia" else "Method", method)
+                if approximate:
+                    # Nilai perkiraan ditandai "≈" dengan batas galat 95% di bawahnya
+                    corr_low, corr_high = pair_result[2:]
+                    with col_res2:
+                        st.metric(
+                            "Koefisien Korelasi" if language == "Indonesia" else "Correlation Coefficient", f"≈ {corr:.4f}",
+                            delta=f"± {max(corr - corr_low, corr_high - corr):.4f}", delta_color="off", delta_arrow="off"
+                        )
+                    with col_res3:
+                        st.metric("Nilai-p" if language == "Indonesia" else "P-value", f"≈ {p_value:.4f}")
+                    approx_notice(len(cached_sample(dataset_key, df)))
+                else:
+                    with col_res2:
+                        st.metric("Koefisien Korelasi" if language == "Indonesia" else "Correlation Coefficient", f"{corr:.4f}")
+                    with col_res3:
+                        st.metric("Nilai-p" if language == "Indonesia" else "P-value", f"{p_value:.4f}")
+                
+                if resampling is not None:
+                    n_resamples, seed = resampling
+                    active_slots.add("resampling-pair")
+                    resampled = background_result(
+                        "resampling-pair",
+                        (dataset_key, "resampling-pair", var_x, var_y, method, n_resamples, seed),
+                        lambda: pair_tasks(
+                            x.to_numpy(dtype=float), y.to_numpy(dtype=float),
+                            method=method.lower(), n_resamples=n_resamples, seed=seed
+                        ),
+                        "Bootstrap & permutasi" if language == "Indonesia" else "Bootstrap & permutations"
+                    )
+                else:
+                    resampled = None
+                
+                if resampled is not None:
+                    ci_low, ci_high, p_perm = resampled
+                    col_ci1, col_ci2 = st.columns(2)
+                    with col_ci1:
+                        st.metric("CI 95% Bootstrap" if language == "Indonesia" else "95% Bootstrap CI", f"[{ci_low:.4f}, {ci_high:.4f}]")
+                    with col_ci2:
+                        st.metric("Nilai-p Permutasi" if language == "Indonesia" else "Permutation P-value", f"{p_perm:.4f}")
+                
+                # Interpretasi
+                st.markdown(f"### {interp_title}")
+                
+                abs_corr = abs(corr)
+                if abs_corr < 0.2:
+                    strength = "Sangat lemah" if language == "Indonesia" else "Very weak"
+                elif abs_corr < 0.4:
+                    strength = "Lemah" if language == "Indonesia" else "Weak"
+                elif abs_corr < 0.6:
+                    strength = "Sedang" if language == "Indonesia" else "Moderate"
+                elif abs_corr < 0.8:
+                    strength = "Kuat" if language == "Indonesia" else "Strong"
+                else:
+                    strength = "Sangat kuat" if language == "Indonesia" else "Very strong"
+                
+                if corr > 0:
+                    direction = "Positif" if language == "Indonesia" else "Positive"
+                elif corr < 0:
+                    direction = "Negatif" if language == "Indonesia" else "Negative"
+                else:
+                    direction = "Tidak ada" if language == "Indonesia" else "No"
+                
+                if p_value < 0.05:
+                    significance = "Signifikan (p < 0.05)" if language == "Indonesia" else "Significant (p < 0.05)"
+                else:
+                    significance = "Tidak signifikan" if language == "Indonesia" else "Not significant"
+                
+                col_int1, col_int2, col_int3 = st.columns(3)
+                with col_int1:
+                    st.metric("Kekuatan" if language == "Indonesia" else "Strength", strength)
+                with col_int2:
+                    st.metric("Arah" if language == "Indonesia" else "Direction", direction)
+                with col_int3:
+                    st.metric("Signifikansi" if language == "Indonesia" else "Significance", significance)
+                
+                # Visualisasi
+                st.markdown("#### 📊 Visualisasi Hubungan")
+                
+                # Grafik disiapkan di server agar ukuran data yang dikirim ke browser terbatas
+                if language == "Indonesia":
+                    render_options = {"Otomatis": "auto", "Semua titik": "raw", "Sampel berstrata": "sample", "Bin 2D (jumlah)": "binned"}
+                    render_label = "Mode tampilan grafik"
+                    count_label = "Jumlah"
+                else:
+                    render_options = {"Automatic": "auto", "All points": "raw", "Stratified sample": "sample", "2D bins (counts)": "binned"}
+                    render_label = "Chart display mode"
+                    count_label = "Count"
+                
+                render_mode = render_options[st.selectbox(render_label, list(render_options))]
+                x_values = x.to_numpy(dtype=float)
+                y_values = y.to_numpy(dtype=float)
+                if render_mode == "auto":
+                    render_mode = choose_render_mode(x_values, y_values)
+                
+                with perf.stage("chart", rows=len(x)):
+                    if render_mode == "binned":
+                        bin_x, bin_y, bin_count = binned_counts(x_values, y_values)
+                        chart_data = pd.DataFrame({
+                            var_x: bin_x,
+                            var_y: bin_y,
+                            count_label: bin_count
+                        })
+                        st.scatter_chart(chart_data, x=var_x, y=var_y, size=count_label)
+                    else:
+                        if render_mode == "sample":
+                            sample_index = stratified_sample(x_values, y_values)
+                            x_values = x_values[sample_index]
+                            y_values = y_values[sample_index]
+                        chart_data = pd.DataFrame({
+                            var_x: x_values,
+                            var_y: y_values
+                        })
+                        st.scatter_chart(chart_data, x=var_x, y=var_y)
+                
+                st.caption(
+                    f"{len(chart_data):,} titik dikirim ke grafik dari {len(x):,} baris" if language == "Indonesia"
+                    else f"{len(chart_data):,} points sent to the chart from {len(x):,} rows"
+                )
+    
+    drop_stale_jobs(["resampling-pair", "resampling-matrix", "exact-pair", "exact-matrix"], active_slots)
+    show_jobs()
+    
+    show_fragment_perf(perf)
+
+
+@st.fragment
+def reliability_section(df, dataset_key, numeric_cols):
+    # Dijalankan ulang sendiri saat widget di dalamnya berubah (tanpa rerun seluruh skrip)
+    perf = fragment_timer("reliability")
+    
+    st.markdown("---")
+    
+    if language == "Indonesia":
+        st.subheader("🧪 Analisis Reliabilitas Skala")
+        item_label, scale_label, reverse_label = "Item", "Skala", "Dibalik"
     else:
-        # ENGLISH VERSION
-        st.header("👥 Team Profile")
-        st.markdown("Meet the team members who developed this application and their contributions.")
-        
-        # Team data with photos and contributions
-        members = [
-            {
-                "name": "Agni Aisyah Putri",
-                "id": "004202400137",
-                "photo": "agni.jpeg",
-                "role": "Team Lead & Backend Developer",
-                "contributions": [
-                    "Developing main application structure and logic",
-                    "Implementing descriptive statistical analysis",
-                    "Creating Pearson and Spearman correlation functions",
-                    "Preparing and processing respondent data",
-                    "Managing application deployment",
-                    "Creating technical documentation"
-                ]
-            },
-            {
-                "name": "Andita Nurul Azizah",
-                "id": "004202400059",
-                "photo": "andita.jpeg",
-                "role": "Frontend Developer & UI Designer",
-                "contributions": [
-                    "Designing application user interface",
-                    "Creating team profile page",
-                    "Implementing bilingual system",
-                    "Developing responsive layout",
-                    "Creating Google Form survey",
-                    "Designing data visualizations"
-                ]
-            },
-            {
-                "name": "Cahyani Dwi Gemawang",
-                "id": "004202400044",
-                "photo": "cahyani.jpeg",
-                "role": "Data Analyst & Documentation",
-                "contributions": [
-                    "Analyzing survey respondent data",
-                    "Compiling analysis result reports",
-                    "Creating application user guide",
-                    "Testing and debugging application",
-                    "Project documentation",
-                    "Project presentation"
-                ]
-            }
-        ]
-        
-        # Select display mode
-        st.subheader("📋 Team Member Details")
-        
-        # Dropdown to select member
-        selected_member_name = st.selectbox(
-            "Select member to view details:",
-            [member["name"] for member in members]
+        st.subheader("🧪 Scale Reliability Analysis")
+        item_label, scale_label, reverse_label = "Item", "Scale", "Reversed"
+    
+    if len(numeric_cols) < 2:
+        st.info("Analisis reliabilitas memerlukan minimal 2 variabel numerik." if language == "Indonesia" else "Reliability analysis requires at least 2 numeric variables.")
+        show_fragment_perf(perf)
+        return
+    
+    st.caption(
+        "Kelompokkan item ke dalam skala (nama skala kosong = item tidak dipakai) dan centang item yang skornya dibalik." if language == "Indonesia"
+        else "Group items into scales (empty scale name = item not used) and tick reverse-coded items."
+    )
+    # Nama skala awal ditebak dari awalan nama item (Q1, Q2, ... -> Q)
+    assignment = st.data_editor(
+        pd.DataFrame({
+            item_label: numeric_cols,
+            scale_label: [default_scale(name) for name in numeric_cols],
+            reverse_label: False,
+        }),
+        hide_index=True,
+        disabled=[item_label]
+    )
+    
+    scales = {}
+    for item, scale, reverse in assignment[[item_label, scale_label, reverse_label]].itertuples(index=False):
+        scale = str(scale).strip() if scale is not None and not pd.isna(scale) else ""
+        if scale:
+            scales.setdefault(scale, []).append((item, bool(reverse)))
+    too_small = [scale for scale, items in scales.items() if len(items) < 2]
+    scales = {scale: items for scale, items in scales.items() if len(items) >= 2}
+    if too_small:
+        st.warning(
+            f"Skala dengan kurang dari 2 item dilewati: {', '.join(too_small)}" if language == "Indonesia"
+            else f"Scales with fewer than 2 items are skipped: {', '.join(too_small)}"
         )
+    if not scales:
+        show_fragment_perf(perf)
+        return
+    
+    with perf.stage("reliability", rows=len(df)):
+        # Tanpa data kosong, satu matriks kovarians semua item dipakai untuk
+        # semua skala; jika ada, setiap skala memakai baris lengkapnya sendiri
+        complete = cached_column_summary(dataset_key, df)["null"][numeric_cols].sum() == 0
+        if complete:
+            cov_all, means_all, n_all = cached_covariance(dataset_key, df, numeric_cols)
+            position = {name: i for i, name in enumerate(numeric_cols)}
         
-        # Find selected member
-        selected_member = next(member for member in members if member["name"] == selected_member_name)
-        
-        # Display selected member details
-        col_photo, col_info = st.columns([1, 2])
-        
-        with col_photo:
-            st.image(selected_member["photo"], width=220)
-            st.markdown(f"**Name:** {selected_member['name']}")
-            st.markdown(f"**ID:** `{selected_member['id']}`")
-            st.markdown(f"**Role:** {selected_member['role']}")
-        
-        with col_info:
-            st.markdown("### 📝 Contributions")
-            for i, contrib in enumerate(selected_member["contributions"], 1):
-                st.markdown(f"{i}. **{contrib}**")
-            
-            # Contribution statistics
-            st.markdown("---")
-            col_stat1, col_stat2, col_stat3 = st.columns(3)
-            with col_stat1:
-                st.metric("Total Contributions", len(selected_member["contributions"]))
-            with col_stat2:
-                st.metric("Role", selected_member["role"].split("&")[0].strip())
-            with col_stat3:
-                st.metric("Status", "Active")
+        summaries = []
+        tables = []
+        for scale, entries in scales.items():
+            items = [item for item, _ in entries]
+            if complete:
+                index = [position[item] for item in items]
+                cov, means, n = cov_all[np.ix_(index, index)], means_all[index], n_all
+            else:
+                cov, means, n = cached_covariance(dataset_key, df, items)
+            cov = reverse_items(cov, [reverse for _, reverse in entries])
+            summary, table = reliability(cov, n, items, means)
+            summaries.append({scale_label: scale, **summary})
+            table.insert(0, scale_label, scale)
+            table.insert(1, reverse_label, [reverse for _, reverse in entries])
+            tables.append(table.reset_index().rename(columns={"item": item_label}))
+    
+    def interpret(alpha):
+        for threshold, label_id, label_en in [
+            (0.9, "Sangat baik", "Excellent"),
+            (0.8, "Baik", "Good"),
+            (0.7, "Dapat diterima", "Acceptable"),
+            (0.6, "Dipertanyakan", "Questionable"),
+        ]:
+            if alpha >= threshold:
+                return label_id if language == "Indonesia" else label_en
+        return "Rendah" if language == "Indonesia" else "Poor"
+    
+    summary_table = pd.DataFrame(summaries)
+    summary_table["interpretasi" if language == "Indonesia" else "interpretation"] = summary_table["alpha"].map(interpret)
+    st.dataframe(summary_table, hide_index=True)
+    
+    with st.expander("📋 Statistik per item" if language == "Indonesia" else "📋 Item statistics"):
+        st.dataframe(pd.concat(tables, ignore_index=True), hide_index=True)
+        st.caption(
+            "Item dengan korelasi item-total terkoreksi < 0,30 atau alpha jika dihapus di atas alpha skala layak ditinjau. Rata-rata memakai skor asli (sebelum dibalik)." if language == "Indonesia"
+            else "Items with a corrected item-total correlation < 0.30, or an alpha-if-deleted above the scale alpha, are worth reviewing. Means use the original (unreversed) scores."
+        )
+    
+    show_fragment_perf(perf)
+
+
+# =========================================================
+# FILTER RESPONDEN DAN DATASET TERSIMPAN
+# =========================================================
+def filter_builder(base_key, kinds):
+    # Kondisi baris (kolom, operator, nilai) dan variabel yang dianalisis.
+    # Mengembalikan (columns, filters); keduanya kosong berarti seluruh dataset.
+    filters = st.session_state.setdefault("_filters", {}).setdefault(base_key, [])
+    names = list(kinds)
+    
+    with st.expander("🔎 Filter Responden & Variabel" if language == "Indonesia" else "🔎 Respondent & Variable Filter", expanded=bool(filters)):
+        columns = st.multiselect(
+            "Variabel yang dianalisis (kosong = semua)" if language == "Indonesia" else "Variables to analyze (empty = all)",
+            names
+        )
         
-        st.markdown("---")
+        col_new1, col_new2, col_new3, col_new4 = st.columns([2, 1, 2, 1], vertical_alignment="bottom")
+        with col_new1:
+            new_col = st.selectbox(
+                "Kolom kondisi" if language == "Indonesia" else "Condition column",
+                names,
+                index=None,
+                placeholder="(pilih kolom)" if language == "Indonesia" else "(choose a column)"
+            )
+        with col_new2:
+            # Operator urutan hanya ditawarkan untuk kolom numerik
+            new_operator = st.selectbox(
+                "Operator kondisi" if language == "Indonesia" else "Condition operator",
+                FILTER_OPERATORS if new_col is None else filter_operators(kinds[new_col])
+            )
+        with col_new3:
+            new_value = st.text_input("Nilai kondisi" if language == "Indonesia" else "Condition value").strip()
+        with col_new4:
+            add_filter = st.button("➕ Tambah" if language == "Indonesia" else "➕ Add")
         
-        # Display all members in grid
-        st.subheader("🌟 All Team Members")
+        if add_filter and new_col is not None and new_value != "":
+            try:
+                filter_parameter(kinds[new_col], new_operator, new_value)
+            except ValueError:
+                st.warning("Nilai untuk kolom numerik harus berupa angka." if language == "Indonesia" else "Value for a numeric column must be a number.")
+            else:
+                if (new_col, new_operator, new_value) not in filters:
+                    filters.append((new_col, new_operator, new_value))
         
-        cols = st.columns(3)
-        for idx, member in enumerate(members):
-            with cols[idx]:
-                # Card for each member
-                with st.container():
-                    st.image(member["photo"], width=180)
-                    st.markdown(f"**{member['name']}**")
-                    st.markdown(f"*{member['role']}*")
-                    st.markdown(f"`{member['id']}`")
-                    
-                    with st.expander(f"View {len(member['contributions'])} contributions"):
-                        for contrib in member["contributions"]:
-                            st.write(f"• {contrib}")
+        if filters:
+            st.markdown("\n".join(f"- `{name}` {operator} `{value}`" for name, operator, value in filters))
+            if st.button("🗑️ Hapus semua kondisi" if language == "Indonesia" else "🗑️ Clear all conditions"):
+                filters.clear()
+                st.rerun()
+    
+    return columns, list(filters)
+
+
+def analysis_sections(df, dataset_key, accumulator=None):
+    # Seksi deskriptif dan korelasi untuk dataset (atau subset) yang sudah dimuat;
+    # ``accumulator`` hanya diberikan jika ``df`` adalah seluruh baris dataset tersimpan
+    numeric_cols = numeric_columns(df)
+    
+    # Mode progresif: perkiraan dari sampel dulu, hasil pasti menyusul. Jika
+    # sampel sudah mencakup semua baris, hasil pasti langsung dihitung.
+    progressive = len(df) > SAMPLE_SIZE and st.checkbox(
+        "⚡ Mode progresif (perkiraan cepat dari sampel, lalu hasil pasti)" if language == "Indonesia"
+        else "⚡ Progressive mode (fast estimate from a sample, then exact results)",
+        value=len(df) >= PROGRESSIVE_ROWS
+    )
+    
+    # ==========================================
+    # ANALISIS DESKRIPTIF
+    # ==========================================
+    descriptive_section(df, dataset_key, numeric_cols, progressive, accumulator)
+    
+    # ==========================================
+    # ANALISIS KORELASI
+    # ==========================================
+    correlation_section(df, dataset_key, numeric_cols, progressive, accumulator)
+    
+    # ==========================================
+    # ANALISIS RELIABILITAS
+    # ==========================================
+    reliability_section(df, dataset_key, numeric_cols)
+
+
+def stored_dataset_analysis(datasets):
+    # Analisis dataset dari penyimpanan lokal tanpa mengunggah ulang; filter
+    # dijalankan di database sehingga hanya subset terpilih yang dimuat
+    labels = {
+        info["key"]: f"{info['name']} · {info['n_rows']:,} " + ("baris" if language == "Indonesia" else "rows")
+        + f" · {time.strftime('%Y-%m-%d %H:%M', time.localtime(info['created']))}"
+        for info in datasets
+    }
+    store_key = st.selectbox(
+        "Pilih dataset tersimpan" if language == "Indonesia" else "Choose a stored dataset",
+        list(labels),
+        format_func=labels.get
+    )
+    info = next(info for info in datasets if info["key"] == store_key)
+    
+    # Batch responden baru: hanya baris batch yang disimpan dan ditambahkan ke akumulator
+    with st.expander("➕ Tambah Batch Responden" if language == "Indonesia" else "➕ Append Respondent Batch"):
+        batch_file = st.file_uploader(
+            "Unggah batch baru (kolom sama dengan dataset)" if language == "Indonesia" else "Upload a new batch (same columns as the dataset)",
+            type=upload_types
+        )
+        if batch_file is not None and st.button("Tambahkan ke dataset" if language == "Indonesia" else "Append to dataset"):
+            try:
+                with perf.stage("append_batch") as stage:
+                    batch = read_batch(batch_file)
+                    info = get_dataset_store().append(store_key, batch, digest=content_hash(batch_file.getvalue()))
+                    stage["rows"] = len(batch)
+                st.success(
+                    f"✅ {len(batch):,} responden ditambahkan, total {info['n_rows']:,}" if language == "Indonesia"
+                    else f"✅ {len(batch):,} respondents appended, {info['n_rows']:,} in total"
+                )
+            except (ValueError, sqlite3.Error) as e:
+                st.error(f"❌ {e}")
+    
+    columns, filters = filter_builder(store_key, info["kinds"])
+    with perf.stage("store_query") as stage:
+        df, dataset_key = stored_subset(store_key, info["version"], columns, filters)
+        stage["rows"] = len(df)
+    
+    st.caption(
+        f"Dimuat dari penyimpanan lokal: {len(df):,} dari {info['n_rows']:,} responden, {len(df.columns)} variabel" if language == "Indonesia"
+        else f"Loaded from local storage: {len(df):,} of {info['n_rows']:,} respondents, {len(df.columns)} variables"
+    )
+    
+    if language == "Indonesia":
+        st.subheader("📋 Data Survei")
+    else:
+        st.subheader("📋 Survey Data")
+    
+    st.dataframe(df.head(50), use_container_width=True)
+    
+    # Hanya sesi yang menyimpan dataset ini yang bisa menghapusnya; dataset lain
+    # dihapus otomatis oleh batas ukuran dan umur penyimpanan
+    if store_key in st.session_state.get("_stored_keys", ()):
+        confirm = st.checkbox(
+            "Saya yakin ingin menghapus dataset ini secara permanen" if language == "Indonesia"
+            else "I am sure I want to delete this dataset permanently"
+        )
+        if st.button("🗑️ Hapus dataset ini dari penyimpanan" if language == "Indonesia" else "🗑️ Delete this dataset from storage", disabled=not confirm):
+            get_dataset_store().remove(store_key)
+            get_store_futures().pop(store_key, None)
+            st.rerun()
+    
+    if df.empty:
+        st.warning("Tidak ada responden yang memenuhi filter." if language == "Indonesia" else "No respondents match the filter.")
+        return
+    
+    # Tanpa filter baris, statistik seluruh dataset diambil dari akumulatornya
+    accumulator = None if filters else stored_accumulator(store_key, info["version"])
+    if accumulator is not None and not set(numeric_columns(df)) <= set(accumulator.columns):
+        accumulator = None
+    analysis_sections(df, dataset_key, accumulator)
+
+
+# =========================================================
+# HALAMAN TENTANG APLIKASI
+# =========================================================
+if menu == "Tentang Aplikasi":
+    about = ABOUT[language]
+    st.header(about["header"])
+    st.write(about["body"])
+
+# =========================================================
+# HALAMAN PROFIL TIM (DENGAN FOTO & KONTRIBUSI)
+# =========================================================
+elif menu == "Profil Tim":
+    # Teks dan data tim dari katalog (dibangun sekali per proses), foto dari thumbnail
+    text = TEAM_PAGE[language]
+    members = TEAM[language]
+    photos = get_thumbnails()
+    
+    st.header(text["header"])
+    st.markdown(text["intro"])
+    
+    # Pilih mode tampilan
+    st.subheader(text["details"])
+    
+    # Dropdown untuk memilih anggota
+    selected_member_name = st.selectbox(
+        text["select"],
+        [member["name"] for member in members]
+    )
+    
+    # Cari anggota yang dipilih
+    selected_member = next(member for member in members if member["name"] == selected_member_name)
+    
+    # Tampilkan detail anggota yang dipilih
+    col_foto, col_info = st.columns([1, 2])
+    
+    with col_foto:
+        st.image(photos[selected_member["photo"], PHOTO_WIDTHS["detail"]], width=PHOTO_WIDTHS["detail"])
+        st.markdown(f"**{text['name']}:** {selected_member['name']}")
+        st.markdown(f"**ID:** `{selected_member['id']}`")
+        st.markdown(f"**{text['role']}:** {selected_member['role']}")
+    
+    with col_info:
+        st.markdown(f"### {text['contributions']}")
+        for i, kontrib in enumerate(selected_member["contributions"], 1):
+            st.markdown(f"{i}. **{kontrib}**")
         
-        # Project information
+        # Statistik kontribusi
         st.markdown("---")
-        st.subheader("📚 About the Project")
-        
-        col_proj1, col_proj2 = st.columns(2)
-        
-        with col_proj1:
-            st.markdown("""
-            ### 🎯 Project Goals
-            - Create interactive survey data analysis application
-            - Implement statistical concepts in web application form
-            - Assist data analysis learning process
-            - Produce useful product for research
-            """)
-        
-        with col_proj2:
-            st.markdown("""
-            ### 📅 Project Timeline
-            - **Planning**: 1 week
-            - **Development**: 2 weeks
-            - **Testing**: 3 days
-            - **Deployment**: 2 days
-            - **Documentation**: 2 days
-            """)
+        col_stat1, col_stat2, col_stat3 = st.columns(3)
+        with col_stat1:
+            st.metric(text["total"], len(selected_member["contributions"]))
+        with col_stat2:
+            st.metric(text["role"], selected_member["role"].split("&")[0].strip())
+        with col_stat3:
+            st.metric("Status", text["status"])
+    
+    st.markdown("---")
+    
+    # Tampilkan semua anggota dalam grid
+    st.subheader(text["all_members"])
+    
+    cols = st.columns(3)
+    for idx, member in enumerate(members):
+        with cols[idx]:
+            # Card untuk setiap anggota
+            with st.container():
+                st.image(photos[member["photo"], PHOTO_WIDTHS["card"]], width=PHOTO_WIDTHS["card"])
+                st.markdown(f"**{member['name']}**")
+                st.markdown(f"*{member['role']}*")
+                st.markdown(f"`{member['id']}`")
+                
+                with st.expander(text["view"].format(count=len(member["contributions"]))):
+                    for kontrib in member["contributions"]:
+                        st.write(f"• {kontrib}")
+    
+    # Informasi proyek
+    st.markdown("---")
+    st.subheader(text["project"])
+    
+    col_proj1, col_proj2 = st.columns(2)
+    
+    with col_proj1:
+        st.markdown(text["goals"])
+    
+    with col_proj2:
+        st.markdown(text["timeline"])
 
 # =========================================================
 # HALAMAN ANALISIS DATA
@@ -394,6 +1303,22 @@ elif menu == "Analisis Data":
             ```
             """)
     
+    # Dataset yang pernah diunggah bisa dibuka langsung dari penyimpanan lokal
+    stored_datasets = get_dataset_store().datasets() if STORE_MB > 0 else []
+    if stored_datasets:
+        source = st.radio(
+            "Sumber data" if language == "Indonesia" else "Data source",
+            ["upload", "store"],
+            format_func=lambda option: {
+                "upload": "Unggah file" if language == "Indonesia" else "Upload a file",
+                "store": "Dataset tersimpan" if language == "Indonesia" else "Stored dataset",
+            }[option],
+            horizontal=True
+        )
+        if source == "store":
+            stored_dataset_analysis(stored_datasets)
+            st.stop()
+    
     # Upload file
     uploaded_file = st.file_uploader(upload_label, type=upload_types)
     
@@ -408,11 +1333,86 @@ elif menu == "Analisis Data":
             file_name = uploaded_file.name.lower()
             
             if file_name.endswith('.csv'):
-                df = pd.read_csv(uploaded_file)
+                streaming_mode = st.checkbox(
+                    "Mode streaming (hemat memori, untuk file sangat besar)" if language == "Indonesia" else "Streaming mode (low memory, for very large files)",
+                    value=uploaded_file.size > STREAMING_THRESHOLD_MB * 1024 * 1024
+                )
+                
+                if streaming_mode:
+                    with perf.stage("parse_stream") as stage:
+                        summary = stream_upload(uploaded_file)
+                        stage["rows"] = summary["n_rows"]
+                    st.success(f"✅ File CSV berhasil dibaca (streaming): {uploaded_file.name}")
+                    
+                    if language == "Indonesia":
+                        st.subheader("📋 Data Survei")
+                        st.caption(f"Pratinjau {len(summary['preview'])} baris pertama")
+                    else:
+                        st.subheader("📋 Survey Data")
+                        st.caption(f"Preview of the first {len(summary['preview'])} rows")
+                    
+                    st.dataframe(summary["preview"], use_container_width=True)
+                    
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        st.metric("Jumlah Data" if language == "Indonesia" else "Total Rows", summary["n_rows"])
+                    with col2:
+                        st.metric("Jumlah Variabel" if language == "Indonesia" else "Total Columns", len(summary["columns"]))
+                    with col3:
+                        st.metric("Format File", "CSV (streaming)")
+                    
+                    st.markdown("---")
+                    
+                    if language == "Indonesia":
+                        st.subheader("📊 Analisis Deskriptif")
+                        var_label = "Pilih variabel numerik"
+                    else:
+                        st.subheader("📊 Descriptive Analysis")
+                        var_label = "Select numeric variables"
+                    
+                    numeric_cols = summary["table"].index.tolist()
+                    
+                    if not numeric_cols:
+                        st.warning("Tidak ditemukan variabel numerik dalam data." if language == "Indonesia" else "No numeric variables found in the data.")
+                    else:
+                        selected_vars = st.multiselect(
+                            var_label,
+                            numeric_cols,
+                            default=numeric_cols[:min(5, len(numeric_cols))]
+                        )
+                        
+                        if selected_vars:
+                            st.dataframe(summary["table"].loc[selected_vars])
+                            st.caption("Kuartil (25%, 50%, 75%) merupakan nilai perkiraan." if language == "Indonesia" else "Quartiles (25%, 50%, 75%) are approximate.")
+                    
+                    st.info("Analisis korelasi memerlukan mode normal (nonaktifkan mode streaming)." if language == "Indonesia" else "Correlation analysis requires normal mode (disable streaming mode).")
+                    st.stop()
+                
+                with perf.stage("parse") as stage:
+                    csv_format = upload_csv_options(uploaded_file)
+                    df, dataset_key = read_upload(uploaded_file, "csv", **csv_format)
+                    stage["rows"] = len(df)
                 file_type = "CSV"
             elif file_name.endswith(('.xlsx', '.xls')):
-                if OPENPYXL_AVAILABLE:
-                    df = pd.read_excel(uploaded_file)
+                if OPENPYXL_AVAILABLE and file_name.endswith('.xlsx'):
+                    available_sheets = upload_sheet_names(uploaded_file)
+                    selected_sheets = st.multiselect(
+                        "Pilih sheet (beberapa sheet digabung)" if language == "Indonesia" else "Select sheets (multiple sheets are combined)",
+                        available_sheets,
+                        default=available_sheets[:1]
+                    )
+                    if not selected_sheets:
+                        st.warning("Pilih minimal satu sheet." if language == "Indonesia" else "Select at least one sheet.")
+                        st.stop()
+                    with perf.stage("parse") as stage:
+                        df, dataset_key = read_upload(uploaded_file, "excel", sheets=tuple(selected_sheets))
+                        stage["rows"] = len(df)
+                    file_type = "Excel"
+                elif OPENPYXL_AVAILABLE:
+                    # Format .xls lama tidak didukung mode read-only openpyxl
+                    with perf.stage("parse") as stage:
+                        df, dataset_key = read_upload(uploaded_file, "xls")
+                        stage["rows"] = len(df)
                     file_type = "Excel"
                 else:
                     st.error("Excel files require openpyxl. Please install it.")
@@ -427,6 +1427,15 @@ elif menu == "Analisis Data":
             
             # Jika berhasil membaca file, lanjutkan analisis
             st.success(f"✅ File {file_type} berhasil dibaca: {uploaded_file.name}")
+            if file_type == "CSV":
+                separator = {"\t": "tab"}.get(csv_format["sep"], csv_format["sep"])
+                no_header = "names" in csv_format
+                st.caption(
+                    f"Format terdeteksi: pemisah '{separator}', desimal '{csv_format['decimal']}', encoding {csv_format['encoding']}"
+                    + (", tanpa baris header" if no_header else "") if language == "Indonesia"
+                    else f"Detected format: delimiter '{separator}', decimal '{csv_format['decimal']}', encoding {csv_format['encoding']}"
+                    + (", no header row" if no_header else "")
+                )
             
             # Tampilkan data
             if language == "Indonesia":
@@ -434,159 +1443,143 @@ elif menu == "Analisis Data":
             else:
                 st.subheader("📋 Survey Data")
             
-            st.dataframe(df, use_container_width=True)
+            # Hanya halaman yang terlihat yang dikirim ke browser
+            all_columns = df.columns.tolist()
+            with st.expander("⚙️ Pengaturan Pratinjau" if language == "Indonesia" else "⚙️ Preview Settings"):
+                preview_cols = st.multiselect(
+                    "Kolom yang ditampilkan" if language == "Indonesia" else "Columns to display",
+                    all_columns,
+                    default=all_columns[:20]
+                )
+                
+                col_sort1, col_sort2 = st.columns([3, 1])
+                with col_sort1:
+                    sort_col = st.selectbox(
+                        "Urutkan berdasarkan" if language == "Indonesia" else "Sort by",
+                        all_columns,
+                        index=None,
+                        placeholder="(tanpa pengurutan)" if language == "Indonesia" else "(no sorting)"
+                    )
+                with col_sort2:
+                    ascending = st.checkbox("Menaik" if language == "Indonesia" else "Ascending", value=True)
+                
+                col_filter1, col_filter2, col_filter3 = st.columns([2, 1, 2])
+                with col_filter1:
+                    filter_col = st.selectbox(
+                        "Filter kolom" if language == "Indonesia" else "Filter column",
+                        all_columns,
+                        index=None,
+                        placeholder="(tanpa filter)" if language == "Indonesia" else "(no filter)"
+                    )
+                with col_filter2:
+                    filter_operator = st.selectbox("Operator", FILTER_OPERATORS)
+                with col_filter3:
+                    filter_value = st.text_input("Nilai" if language == "Indonesia" else "Value").strip()
+            
+            try:
+                positions = preview_positions(dataset_key, df, sort_col, ascending, filter_col, filter_operator, filter_value)
+            except ValueError:
+                st.warning("Nilai filter untuk kolom numerik harus berupa angka." if language == "Indonesia" else "Filter value for a numeric column must be a number.")
+                positions = np.arange(len(df))
+            except TypeError:
+                st.warning("Operator ini tidak berlaku untuk kolom tersebut." if language == "Indonesia" else "This operator does not apply to that column.")
+                positions = np.arange(len(df))
+            
+            col_page1, col_page2 = st.columns(2)
+            with col_page1:
+                page_size = st.selectbox(
+                    "Baris per halaman" if language == "Indonesia" else "Rows per page",
+                    [25, 50, 100, 250, 500],
+                    index=1
+                )
+            with col_page2:
+                page = st.number_input(
+                    "Halaman" if language == "Indonesia" else "Page",
+                    min_value=1,
+                    max_value=page_count(len(positions), page_size),
+                    value=1,
+                    step=1,
+                    # Kunci berubah saat jumlah halaman berubah agar halaman kembali ke 1
+                    key=f"preview_page_{len(positions)}_{page_size}"
+                )
+            
+            with perf.stage("preview", rows=len(positions)):
+                st.dataframe(page_slice(df, positions, page, page_size, preview_cols or None), use_container_width=True)
+            
+            first_row = min((page - 1) * page_size + 1, len(positions))
+            last_row = min(page * page_size, len(positions))
+            st.caption(
+                f"Menampilkan baris {first_row:,}–{last_row:,} dari {len(positions):,}" if language == "Indonesia"
+                else f"Showing rows {first_row:,}–{last_row:,} of {len(positions):,}"
+            )
+            
+            with st.expander("🧾 Ringkasan Kolom" if language == "Indonesia" else "🧾 Column Summary"):
+                st.dataframe(cached_column_summary(dataset_key, df), use_container_width=True)
             
             # Tampilkan info dataset
-            col1, col2, col3 = st.columns(3)
+            col1, col2, col3, col4 = st.columns(4)
             with col1:
                 st.metric("Jumlah Data" if language == "Indonesia" else "Total Rows", len(df))
             with col2:
                 st.metric("Jumlah Variabel" if language == "Indonesia" else "Total Columns", len(df.columns))
             with col3:
                 st.metric("Format File", file_type)
+            with col4:
+                memory_before = df.attrs.get("memory_before")
+                memory_after = df.attrs.get("memory_after")
+                if memory_before and memory_after:
+                    st.metric(
+                        "Memori Data" if language == "Indonesia" else "Data Memory",
+                        format_bytes(memory_after),
+                        delta=(f"-{format_bytes(memory_before - memory_after)} "
+                               + (f"(awal {format_bytes(memory_before)})" if language == "Indonesia" else f"(was {format_bytes(memory_before)})")),
+                        delta_color="inverse"
+                    )
             
-            # ==========================================
-            # ANALISIS DESKRIPTIF
-            # ==========================================
-            st.markdown("---")
-            
-            if language == "Indonesia":
-                st.subheader("📊 Analisis Deskriptif")
-                var_label = "Pilih variabel numerik"
-            else:
-                st.subheader("📊 Descriptive Analysis")
-                var_label = "Select numeric variables"
-            
-            # Pilih kolom numerik
-            numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
-            
-            if not numeric_cols:
-                if language == "Indonesia":
-                    st.warning("Tidak ditemukan variabel numerik dalam data.")
-                else:
-                    st.warning("No numeric variables found in the data.")
-            else:
-                selected_vars = st.multiselect(
-                    var_label,
-                    numeric_cols,
-                    default=numeric_cols[:min(5, len(numeric_cols))]
+            # Simpan ke penyimpanan lokal (hanya jika dipilih) agar bisa dibuka lagi tanpa unggah ulang
+            if STORE_MB > 0 and st.checkbox(
+                "💾 Simpan dataset ini di server (bisa dibuka lagi oleh semua pengguna aplikasi ini)" if language == "Indonesia"
+                else "💾 Save this dataset on the server (can be reopened by every user of this app)",
+                key=f"store-{dataset_key!r}",
+                help=(
+                    (f"Dataset dihapus otomatis setelah {STORE_DAYS:g} hari tidak dibuka." if language == "Indonesia"
+                     else f"The dataset is deleted automatically after {STORE_DAYS:g} days without being opened.")
+                    if STORE_DAYS > 0 else None
                 )
-                
-                if selected_vars:
-                    st.dataframe(df[selected_vars].describe().T)
+            ):
+                future = store_upload(dataset_key, uploaded_file.name, df)
+                if not future.done():
+                    st.caption("⏳ Menyimpan dataset..." if language == "Indonesia" else "⏳ Saving the dataset...")
+                elif future.exception() is not None:
+                    st.warning(
+                        f"⚠️ Dataset tidak bisa disimpan: {future.exception()}" if language == "Indonesia"
+                        else f"⚠️ The dataset could not be saved: {future.exception()}"
+                    )
+                else:
+                    st.caption("✅ Dataset tersimpan" if language == "Indonesia" else "✅ Dataset saved")
             
-            # ==========================================
-            # ANALISIS KORELASI
-            # ==========================================
-            st.markdown("---")
+            # Subset responden/variabel untuk analisis
+            columns, filters = filter_builder(repr(dataset_key), {name: column_kind(df[name]) for name in df.columns})
+            if columns or filters:
+                n_total = len(df)
+                df, dataset_key = cached_subset(dataset_key, df, columns, filters)
+                st.caption(
+                    f"Analisis memakai {len(df):,} dari {n_total:,} responden, {len(df.columns)} variabel" if language == "Indonesia"
+                    else f"Analysis uses {len(df):,} of {n_total:,} respondents, {len(df.columns)} variables"
+                )
+                if df.empty:
+                    st.warning("Tidak ada responden yang memenuhi filter." if language == "Indonesia" else "No respondents match the filter.")
+                    st.stop()
             
-            if language == "Indonesia":
-                st.subheader("🔗 Analisis Korelasi")
-                x_label = "Variabel X"
-                y_label = "Variabel Y"
-                method_label = "Metode Korelasi"
-                result_title = "📈 Hasil Analisis"
-                interp_title = "📋 Interpretasi Korelasi"
-            else:
-                st.subheader("🔗 Correlation Analysis")
-                x_label = "Variable X"
-                y_label = "Variable Y"
-                method_label = "Correlation Method"
-                result_title = "📈 Analysis Result"
-                interp_title = "📋 Correlation Interpretation"
+            analysis_sections(df, dataset_key)
             
-            if numeric_cols:
-                col1, col2 = st.columns(2)
-                with col1:
-                    var_x = st.selectbox(x_label, numeric_cols)
-                with col2:
-                    other_cols = [col for col in numeric_cols if col != var_x]
-                    if other_cols:
-                        var_y = st.selectbox(y_label, other_cols, index=0)
-                    else:
-                        var_y = None
-                        st.warning("Hanya satu variabel numerik tersedia" if language == "Indonesia" else "Only one numeric variable available")
-                
-                method = st.radio(
-                    method_label,
-                    ["Pearson", "Spearman"],
-                    index=0
-                )
-                
-                if var_x and var_y:
-                    data = df[[var_x, var_y]].dropna()
-                    x = data[var_x]
-                    y = data[var_y]
-                    
-                    if len(x) < 2:
-                        st.warning("Data tidak cukup untuk analisis korelasi" if language == "Indonesia" else "Insufficient data for correlation analysis")
-                    else:
-                        if method == "Pearson":
-                            corr, p_value = pearsonr(x, y)
-                        else:
-                            corr, p_value = spearmanr(x, y)
-                        
-                        # Tampilkan hasil
-                        st.markdown(f"### {result_title}")
-                        
-                        col_res1, col_res2, col_res3 = st.columns(3)
-                        with col_res1:
-                            st.metric("Metode" if language == "Indonesia" else "Method", method)
-                        with col_res2:
-                            st.metric("Koefisien Korelasi" if language == "Indonesia" else "Correlation Coefficient", f"{corr:.4f}")
-                        with col_res3:
-                            st.metric("Nilai-p" if language == "Indonesia" else "P-value", f"{p_value:.4f}")
-                        
-                        # Interpretasi
-                        st.markdown(f"### {interp_title}")
-                        
-                        abs_corr = abs(corr)
-                        if abs_corr < 0.2:
-                            strength = "Sangat lemah" if language == "Indonesia" else "Very weak"
-                        elif abs_corr < 0.4:
-                            strength = "Lemah" if language == "Indonesia" else "Weak"
-                        elif abs_corr < 0.6:
-                            strength = "Sedang" if language == "Indonesia" else "Moderate"
-                        elif abs_corr < 0.8:
-                            strength = "Kuat" if language == "Indonesia" else "Strong"
-                        else:
-                            strength = "Sangat kuat" if language == "Indonesia" else "Very strong"
-                        
-                        if corr > 0:
-                            direction = "Positif" if language == "Indonesia" else "Positive"
-                        elif corr < 0:
-                            direction = "Negatif" if language == "Indonesia" else "Negative"
-                        else:
-                            direction = "Tidak ada" if language == "Indonesia" else "No"
-                        
-                        if p_value < 0.05:
-                            significance = "Signifikan (p < 0.05)" if language == "Indonesia" else "Significant (p < 0.05)"
-                        else:
-                            significance = "Tidak signifikan" if language == "Indonesia" else "Not significant"
-                        
-                        col_int1, col_int2, col_int3 = st.columns(3)
-                        with col_int1:
-                            st.metric("Kekuatan" if language == "Indonesia" else "Strength", strength)
-                        with col_int2:
-                            st.metric("Arah" if language == "Indonesia" else "Direction", direction)
-                        with col_int3:
-                            st.metric("Signifikansi" if language == "Indonesia" else "Significance", significance)
-                        
-                        # Visualisasi
-                        st.markdown("#### 📊 Visualisasi Hubungan")
-                        chart_data = pd.DataFrame({
-                            var_x: x,
-                            var_y: y
-                        })
-                        st.scatter_chart(chart_data)
-                        
         except Exception as e:
             if language == "Indonesia":
                 st.error(f"❌ Terjadi kesalahan: {str(e)}")
                 st.info("""
                 **Penyebab mungkin:**
                 1. File rusak atau format tidak sesuai
-                2. Encoding file CSV tidak UTF-8
+                2. Format CSV (encoding/pemisah) tidak terdeteksi dengan benar
                 3. Sheet Excel kosong
                 4. Data tidak konsisten
                 """)
@@ -595,7 +1588,7 @@ elif menu == "Analisis Data":
                 st.info("""
                 **Possible causes:**
                 1. File is corrupted or format mismatch
-                2. CSV encoding is not UTF-8
+                2. CSV format (encoding/delimiter) was not detected correctly
                 3. Excel sheet is empty
                 4. Inconsistent data
                 """)
\ No newline at end of file
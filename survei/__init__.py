@@ -0,0 +1 @@
+"""Modul pendukung aplikasi analisis data survei (``contoh2.py``)."""
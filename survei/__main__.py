@@ -0,0 +1,5 @@
+import sys
+
+from survei.cli import main
+
+sys.exit(main())
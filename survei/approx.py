@@ -0,0 +1,94 @@
+"""Perkiraan cepat dari sampel acak untuk dataset besar.
+
+Hasil perkiraan ditampilkan lebih dulu bersama batas galat 95%, lalu
+diganti hasil pasti setelah perhitungan penuh selesai. Sampel diambil
+acak tanpa pengembalian; jika ada kode strata (misalnya kelompok
+deskriptif), setiap strata mendapat jatah sebanding ukurannya sehingga
+kelompok kecil tetap terwakili.
+"""
+
+import numpy as np
+from scipy import stats
+
+from survei.correlation import correlation_matrix, p_values
+from survei.pipeline import describe
+
+SAMPLE_SIZE = 100_000
+Z_95 = stats.norm.ppf(0.975)
+
+
+def sample_positions(n_rows, size=SAMPLE_SIZE, strata=None, seed=0):
+    """Posisi baris sampel (terurut), paling banyak ``size`` baris.
+
+    ``strata`` adalah kode bilangan bulat per baris (-1 = di luar strata);
+    jatah setiap strata sebanding ukurannya, minimal satu baris.
+    """
+    rng = np.random.default_rng(seed)
+    if size >= n_rows:
+        return np.arange(n_rows)
+    if strata is None:
+        return np.sort(rng.choice(n_rows, size=size, replace=False))
+    strata = np.asarray(strata)
+    inside = np.flatnonzero(strata >= 0)
+    codes = strata[inside]
+    counts = np.bincount(codes)
+    quota = np.where(counts > 0, np.maximum(np.round(counts * size / max(len(inside), 1)), 1), 0)
+    # Urutan acak di dalam setiap strata, lalu ambil sebanyak jatahnya
+    order = np.argsort(codes + rng.random(len(inside)))
+    rank = np.arange(len(inside)) - (np.cumsum(counts) - counts)[codes[order]]
+    return np.sort(inside[order[rank < quota[codes[order]]]])
+
+
+def approx_describe(df, columns, positions, by=()):
+    """Statistik deskriptif dari baris sampel, dengan ``mean_margin`` (± 95%).
+
+    ``count`` diskalakan ke ukuran data penuh. Batas galat rata-rata memakai
+    koreksi populasi hingga karena sampel diambil tanpa pengembalian.
+    """
+    table = describe(df.iloc[positions], columns, by=list(by)).astype(float)
+    fraction = len(positions) / max(len(df), 1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        margin = Z_95 * table["std"] / np.sqrt(table["count"]) * np.sqrt(max(1 - fraction, 0.0))
+    table.insert(table.columns.get_loc("mean") + 1, "mean_margin", margin)
+    table["count"] = (table["count"] / fraction).round()
+    return table
+
+
+def fisher_interval(r, n, method="pearson", confidence=0.95):
+    """Interval kepercayaan korelasi lewat transformasi Fisher z.
+
+    Untuk Spearman galat baku memakai koreksi Fieller (1,06 / (n - 3)).
+    """
+    r = np.asarray(r, dtype=float)
+    n = np.asarray(n, dtype=float)
+    z = np.arctanh(np.clip(r, -0.999999, 0.999999))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        se = np.sqrt((1.06 if method == "spearman" else 1.0) / (n - 3))
+    half = stats.norm.ppf(0.5 + confidence / 2) * se
+    return np.tanh(z - half), np.tanh(z + half)
+
+
+def approx_correlation(x, y, n_total, method="pearson"):
+    """Perkiraan ``(r, low, high, p)`` dari sampel pasangan ``x``/``y``.
+
+    Nilai-p dihitung untuk ``r`` perkiraan dengan ukuran data penuh
+    ``n_total``, bukan ukuran sampel.
+    """
+    if method == "spearman":
+        r = stats.spearmanr(x, y)[0]
+    else:
+        r = stats.pearsonr(x, y)[0]
+    low, high = fisher_interval(r, len(x), method)
+    return float(r), float(low), float(high), float(p_values(r, n_total))
+
+
+def approx_correlation_matrix(values, n_total, method="pearson", missing="pairwise"):
+    """Seperti :func:`approx_correlation` untuk semua pasangan kolom sampel ``values``.
+
+    ``n_total`` adalah jumlah baris data penuh; N tiap pasangan diperkirakan
+    dari proporsi baris lengkap di sampel.
+    """
+    r, _, n = correlation_matrix(values, method=method, missing=missing)
+    low, high = fisher_interval(r, n, method)
+    n_full = np.round(n * n_total / max(len(values), 1))
+    return r, low, high, p_values(r, n_full), n_full
@@ -0,0 +1,58 @@
+"""Thumbnail foto yang diperkecil sekali lalu disimpan di disk.
+
+``st.image`` memperkecil foto ukuran penuh di setiap rerun (decode, resize,
+encode ulang). Thumbnail JPEG yang lebarnya sudah sama dengan lebar
+tampilan dikirim Streamlit apa adanya, tanpa diproses ulang.
+"""
+
+import io
+import os
+import threading
+
+THUMBNAIL_QUALITY = 90
+
+
+def _resize(path, width):
+    from PIL import Image
+
+    with Image.open(path) as image:
+        if image.width > width:
+            height = max(1, round(image.height * width / image.width))
+            image = image.resize((width, height), resample=Image.LANCZOS)
+        if image.mode not in ("RGB", "L"):
+            image = image.convert("RGB")
+        buffer = io.BytesIO()
+        image.save(buffer, format="JPEG", quality=THUMBNAIL_QUALITY, optimize=True)
+        return buffer.getvalue()
+
+
+def thumbnail(path, width, directory):
+    """Isi file JPEG ``path`` yang diperkecil ke lebar ``width`` piksel.
+
+    Hasilnya disimpan di ``directory`` dan dipakai ulang selama foto asli
+    tidak berubah (nama file memuat ukuran dan waktu ubah foto asli).
+    """
+    stat = os.stat(path)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    cached = os.path.join(directory, f"{stem}-{width}w-{stat.st_size}-{int(stat.st_mtime)}.jpg")
+    try:
+        with open(cached, "rb") as handle:
+            return handle.read()
+    except FileNotFoundError:
+        pass
+    data = _resize(path, width)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{cached}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as handle:
+            handle.write(data)
+        os.replace(tmp_path, cached)
+    except OSError:
+        # Direktori tidak bisa ditulis: thumbnail tetap dipakai dari memori
+        pass
+    return data
+
+
+def thumbnails(paths, widths, directory):
+    """Thumbnail setiap foto untuk setiap lebar: ``{(path, width): bytes}``."""
+    return {(path, width): thumbnail(path, width, directory) for path in paths for width in widths}
@@ -0,0 +1,192 @@
+"""Benchmark tahap-tahap halaman "Analisis Data" dengan data sintetis.
+
+Contoh::
+
+    python -m survei.benchmark --rows 10000 100000 --cols 10 100 --output bench.json
+    python -m survei.benchmark --rows 10000 --cols 10 --baseline bench.json
+
+Setiap tahap dicatat waktu tercepat dari ``--repeat`` kali (detik) dan
+puncak alokasi memori (tracemalloc).
+Dengan ``--baseline``, tahap yang lebih lambat dari ``--tolerance`` kali
+laporan sebelumnya ditandai dan perintah keluar dengan kode 1.
+"""
+
+import argparse
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from functools import partial
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+from scipy.stats import pearsonr
+
+from survei.charts import binned_counts, choose_render_mode, stratified_sample
+from survei.correlation import correlation_matrix
+from survei.dialect import csv_options
+from survei.dtypes import optimize_dtypes
+from survei.excel import OPENPYXL_AVAILABLE, read_sheets
+from survei.pipeline import describe, numeric_columns
+from survei.reliability import covariance, reliability
+from survei.synthetic import generate_survey
+
+DEMOGRAPHIC_COLUMNS = 4
+# Excel hanya diuji untuk ukuran kecil (menulis .xlsx besar sangat lambat)
+EXCEL_MAX_CELLS = 1_000_000
+# Jumlah pasangan yang diuji untuk korelasi per pasangan (scipy)
+PAIRWISE_SAMPLE = 50
+
+
+def measure(stage, func, results, repeat=3, trace_memory=True, **labels):
+    """Jalankan ``func``, catat waktu tercepat dari ``repeat`` kali dan puncak memorinya.
+
+    tracemalloc memperlambat kode Python murni, jadi waktu diukur pada
+    eksekusi tanpa tracing; puncak memori diukur pada eksekusi tambahan.
+    """
+    seconds = float("inf")
+    for _ in range(max(repeat, 1)):
+        started = time.perf_counter()
+        value = func()
+        seconds = min(seconds, time.perf_counter() - started)
+    peak = None
+    if trace_memory:
+        tracemalloc.start()
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    results.append({**labels, "stage": stage, "seconds": round(seconds, 6), "peak_bytes": peak})
+    return value
+
+
+def chart_payload_bytes(x, y):
+    """Ukuran JSON data grafik: semua titik vs mode yang dipilih otomatis."""
+    head = pd.DataFrame({"x": x[:10_000], "y": y[:10_000]}).to_json(orient="records")
+    raw_bytes = int(len(head) * len(x) / max(min(len(x), 10_000), 1))
+    mode = choose_render_mode(x, y)
+    if mode == "binned":
+        bin_x, bin_y, count = binned_counts(x, y)
+        frame = pd.DataFrame({"x": bin_x, "y": bin_y, "count": count})
+    elif mode == "sample":
+        index = stratified_sample(x, y)
+        frame = pd.DataFrame({"x": x[index], "y": y[index]})
+    else:
+        frame = pd.DataFrame({"x": x, "y": y})
+    return {"mode": mode, "raw_bytes": raw_bytes, "rendered_bytes": len(frame.to_json(orient="records"))}
+
+
+def run_case(rows, cols, workdir, seed=0, repeat=3, trace_memory=True):
+    """Benchmark semua tahap untuk satu ukuran data; kembalikan daftar hasil."""
+    results = []
+    record = partial(measure, results=results, repeat=repeat, trace_memory=trace_memory, rows=rows, cols=cols)
+    source = generate_survey(rows, max(cols - DEMOGRAPHIC_COLUMNS, 2), seed=seed)
+
+    csv_path = os.path.join(workdir, f"survey_{rows}x{cols}.csv")
+    source.to_csv(csv_path, index=False)
+    df = record("csv_parse", lambda: pd.read_csv(csv_path))
+    # Jalur aplikasi: deteksi format dari sampel byte + parser pyarrow jika tersedia
+    record("csv_parse_detected", lambda: pd.read_csv(csv_path, **csv_options(csv_path)))
+
+    if OPENPYXL_AVAILABLE and rows * cols <= EXCEL_MAX_CELLS:
+        buffer = io.BytesIO()
+        source.to_excel(buffer, index=False)
+        data = buffer.getvalue()
+        record("excel_parse", lambda: read_sheets(data, ["Sheet1"]))
+
+    df = record("optimize_dtypes", lambda: optimize_dtypes(df))
+    columns = record("select_dtypes", lambda: numeric_columns(df))
+    record("describe", lambda: describe(df, columns))
+    record("grouped_describe", lambda: describe(df, columns, by=["fakultas", "jenis_kelamin"]))
+
+    values = df[columns].to_numpy(dtype=float, na_value=np.nan)
+    pairs = list(combinations(range(len(columns)), 2))[:PAIRWISE_SAMPLE]
+
+    def pairwise():
+        for i, j in pairs:
+            valid = ~np.isnan(values[:, i]) & ~np.isnan(values[:, j])
+            pearsonr(values[valid, i], values[valid, j])
+
+    record("pairwise_correlation", pairwise)
+    results[-1]["pairs"] = len(pairs)
+    results[-1]["seconds_per_pair"] = round(results[-1]["seconds"] / max(len(pairs), 1), 6)
+
+    for method in ("pearson", "spearman"):
+        record(f"matrix_{method}", lambda: correlation_matrix(values, method=method))
+        results[-1]["pairs"] = len(columns) * (len(columns) - 1) // 2
+
+    cov, means, n = record("covariance", lambda: covariance(values))
+    record("reliability", lambda: reliability(cov, n, columns, means))
+
+    payload = record("chart_payload", lambda: chart_payload_bytes(values[:, 0], values[:, 1]))
+    results[-1].update(payload)
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Daftar tahap yang lebih lambat dari ``tolerance`` kali baseline."""
+    previous = {(item["rows"], item["cols"], item["stage"]): item["seconds"] for item in baseline["results"]}
+    regressions = []
+    for item in results:
+        before = previous.get((item["rows"], item["cols"], item["stage"]))
+        if before and item["seconds"] > before * tolerance:
+            regressions.append({**item, "baseline_seconds": before, "ratio": round(item["seconds"] / before, 3)})
+    return regressions
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m survei.benchmark", description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000])
+    parser.add_argument("--cols", type=int, nargs="+", default=[10, 100])
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="ulangi setiap tahap dan ambil waktu tercepat")
+    parser.add_argument("--no-memory", action="store_true", help="lewati pengukuran memori (lebih cepat)")
+    parser.add_argument("--output", help="simpan laporan JSON ke file ini")
+    parser.add_argument("--baseline", help="laporan JSON sebelumnya untuk dibandingkan")
+    parser.add_argument("--tolerance", type=float, default=1.25, help="rasio waktu yang dianggap regresi")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for rows in args.rows:
+            for cols in args.cols:
+                case = run_case(rows, cols, workdir, seed=args.seed, repeat=args.repeat, trace_memory=not args.no_memory)
+                for item in case:
+                    memory = "" if item["peak_bytes"] is None else f"{item['peak_bytes'] / 1024 ** 2:>10.1f} MB"
+                    print(f"{rows:>10} x {cols:<5} {item['stage']:<22} {item['seconds']:>10.4f} s {memory}")
+                results.extend(case)
+
+    report = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+        },
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as handle:
+            regressions = compare(results, json.load(handle), args.tolerance)
+        for item in regressions:
+            print(f"REGRESI {item['rows']} x {item['cols']} {item['stage']}: {item['baseline_seconds']} s -> {item['seconds']} s ({item['ratio']}x)", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
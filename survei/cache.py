@@ -0,0 +1,285 @@
+"""Cache hasil parsing (memori dan disk) dengan kunci hash isi file."""
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+# =========================================================
+# CEK APAKAH pyarrow TERSEDIA (untuk cache di disk)
+# =========================================================
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+def content_hash(data):
+    """Hash SHA-256 dari isi file yang diunggah (bytes)."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def make_key(digest, reader, **options):
+    """Kunci cache: hash isi file + nama pembaca + opsi pembaca."""
+    return (digest, reader, tuple(sorted(options.items())))
+
+
+def estimate_nbytes(value):
+    """Perkiraan ukuran objek di memori (byte)."""
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(index=True, deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(index=True, deep=True))
+    if isinstance(value, (tuple, list)):
+        return sum(estimate_nbytes(item) for item in value)
+    if isinstance(value, dict):
+        return sum(estimate_nbytes(item) for item in value.values())
+    nbytes = getattr(value, "nbytes", None)
+    if nbytes is not None:
+        return int(nbytes)
+    return 0
+
+
+class LRUCache:
+    """Cache LRU dengan batas memori total dalam byte.
+
+    Entri yang paling lama tidak dipakai dibuang lebih dulu sampai total
+    ukuran kembali di bawah ``budget_bytes``. Objek yang lebih besar dari
+    anggaran tidak disimpan sama sekali. Jika ``ttl_seconds`` diisi, entri
+    yang disimpan lebih lama dari itu dianggap kedaluwarsa. Nilai yang
+    dikembalikan dipakai bersama, jadi jangan diubah di tempat.
+
+    Aman dipakai dari banyak thread (satu server, banyak sesi). Pada
+    ``get_or_compute``, pemanggil lain dengan kunci yang sama menunggu
+    hasil perhitungan pertama alih-alih menghitung ulang.
+    """
+
+    def __init__(self, budget_bytes, ttl_seconds=None):
+        self.budget_bytes = int(budget_bytes)
+        self.ttl_seconds = ttl_seconds or None
+        self._items = OrderedDict()
+        self._sizes = {}
+        self._stored = {}
+        self._total = 0
+        self._lock = threading.Lock()
+        self._pending = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        return len(self._items)
+
+    def discard(self, key):
+        """Hapus ``key`` dari cache (tidak apa-apa jika tidak ada)."""
+        with self._lock:
+            if key in self._items:
+                self._discard(key)
+
+    def keys(self):
+        """Salinan daftar kunci (urutan LRU tidak berubah)."""
+        with self._lock:
+            return list(self._items)
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._items and not self._expired(key)
+
+    @property
+    def total_bytes(self):
+        return self._total
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._items and self._expired(key):
+                self._discard(key)
+                self.expirations += 1
+            if key not in self._items:
+                self.misses += 1
+                return default
+            self.hits += 1
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def put(self, key, value, nbytes=None):
+        if nbytes is None:
+            nbytes = estimate_nbytes(value)
+        with self._lock:
+            if key in self._items:
+                self._discard(key)
+            if nbytes > self.budget_bytes:
+                return False
+            self._items[key] = value
+            self._sizes[key] = nbytes
+            self._stored[key] = time.monotonic()
+            self._total += nbytes
+            self._expire()
+            while self._total > self.budget_bytes:
+                self._discard(next(iter(self._items)))
+                self.evictions += 1
+            return True
+
+    def get_or_compute(self, key, compute):
+        value = self.get(key)
+        if value is not None:
+            return value
+        with self._lock:
+            pending, owner_thread = self._pending.get(key, (None, None))
+            owner = pending is None
+            if owner:
+                pending = threading.Event()
+                self._pending[key] = (pending, threading.get_ident())
+        if not owner and owner_thread == threading.get_ident():
+            # Dipanggil ulang dari dalam compute() untuk kunci yang sama: hitung langsung
+            return compute()
+        if not owner:
+            # Thread lain sedang menghitung kunci yang sama: tunggu hasilnya
+            pending.wait()
+            value = self.get(key)
+            if value is not None:
+                return value
+            return self.get_or_compute(key, compute)
+        try:
+            value = compute()
+            self.put(key, value)
+            return value
+        finally:
+            with self._lock:
+                del self._pending[key]
+            pending.set()
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+            self._sizes.clear()
+            self._stored.clear()
+            self._total = 0
+
+    def stats(self):
+        """Ringkasan isi cache dan penghitung hit/miss/eviksi."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._items),
+                "total_bytes": self._total,
+                "budget_bytes": self.budget_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+    def _expired(self, key):
+        return self.ttl_seconds is not None and time.monotonic() - self._stored[key] > self.ttl_seconds
+
+    def _expire(self):
+        if self.ttl_seconds is None:
+            return
+        for key in [key for key in self._items if self._expired(key)]:
+            self._discard(key)
+            self.expirations += 1
+
+    def _discard(self, key):
+        del self._items[key]
+        del self._stored[key]
+        self._total -= self._sizes.pop(key)
+
+
+def private_directory(directory):
+    """Buat ``directory`` yang hanya bisa dibuka pemiliknya (mode 0700).
+
+    Mengembalikan False jika direktori tidak bisa dibuat atau dimiliki
+    pengguna lain (misalnya sudah dibuat lebih dulu di direktori temp
+    bersama); isinya tidak boleh dipakai dalam kasus itu.
+    """
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if hasattr(os, "getuid"):
+            if os.stat(directory).st_uid != os.getuid():
+                return False
+            os.chmod(directory, 0o700)
+    except OSError:
+        return False
+    return True
+
+
+class DiskCache:
+    """Cache DataFrame di disk dalam format Arrow IPC (Feather v2) tanpa kompresi.
+
+    File dibaca ulang dengan memory-map, sehingga tidak ada parsing CSV/Excel
+    dan beberapa proses worker berbagi data yang sama lewat page cache OS.
+    Total ukuran direktori dibatasi ``budget_bytes``; file yang paling lama
+    tidak dipakai (mtime) dihapus lebih dulu. ``budget_bytes=0`` mematikan
+    cache. File berisi data responden, jadi direktori dibuat dengan mode
+    0700 dan file dengan mode 0600.
+    """
+
+    suffix = ".arrow"
+
+    def __init__(self, directory, budget_bytes):
+        self.directory = directory
+        self.budget_bytes = int(budget_bytes)
+        self.enabled = PYARROW_AVAILABLE and self.budget_bytes > 0 and private_directory(directory)
+
+    def _path(self, key):
+        name = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, name + self.suffix)
+
+    def get(self, key):
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            source = pa.memory_map(path, "r")
+            table = pa.ipc.open_file(source).read_all()
+            os.utime(path)
+        except (FileNotFoundError, pa.ArrowException, OSError):
+            return None
+        return table.to_pandas(split_blocks=True)
+
+    def put(self, key, df):
+        if not self.enabled:
+            return False
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            table = pa.Table.from_pandas(df)
+            # File dibuat lebih dulu dengan mode 0600; OSFile hanya menimpanya
+            os.close(os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600))
+            with pa.OSFile(tmp_path, "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+            os.replace(tmp_path, path)
+        except (pa.ArrowException, TypeError, ValueError, OSError):
+            # Kolom dengan tipe campuran dsb. tidak bisa disimpan; lewati saja
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return False
+        self._evict()
+        return True
+
+    def _evict(self):
+        entries = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(self.suffix):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.budget_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
@@ -0,0 +1,90 @@
+"""Grafik pendukung (matplotlib) untuk halaman analisis data."""
+
+import numpy as np
+from matplotlib.figure import Figure
+
+
+def correlation_heatmap(columns, r, max_labels=40):
+    """Heatmap matriks korelasi; label sumbu disembunyikan jika terlalu banyak."""
+    k = len(columns)
+    size = min(4 + 0.3 * k, 14)
+    fig = Figure(figsize=(size, size * 0.85))
+    ax = fig.subplots()
+    image = ax.imshow(np.ma.masked_invalid(r), cmap="RdBu_r", vmin=-1, vmax=1, interpolation="nearest")
+    if k <= max_labels:
+        ax.set_xticks(range(k), labels=columns, rotation=90, fontsize=8)
+        ax.set_yticks(range(k), labels=columns, fontsize=8)
+    else:
+        ax.set_xticks([])
+        ax.set_yticks([])
+    fig.colorbar(image, ax=ax, fraction=0.046, pad=0.04)
+    fig.tight_layout()
+    return fig
+
+
+# Batas jumlah titik untuk grafik hubungan dua variabel
+RAW_POINT_LIMIT = 5_000
+SAMPLE_POINT_LIMIT = 50_000
+DISCRETE_LEVELS = 15
+
+
+def _bin_index(values, bins):
+    low, high = values.min(), values.max()
+    if high == low:
+        return np.zeros(len(values), dtype=np.intp)
+    index = ((values - low) / (high - low) * bins).astype(np.intp)
+    return np.clip(index, 0, bins - 1)
+
+
+def _bin_centers(values, bins):
+    # Data diskret (misalnya skala Likert) memakai nilai uniknya sebagai bin
+    unique = np.unique(values)
+    if len(unique) <= bins:
+        return unique, np.searchsorted(unique, values)
+    edges = np.linspace(values.min(), values.max(), bins + 1)
+    return (edges[:-1] + edges[1:]) / 2, _bin_index(values, bins)
+
+
+def is_discrete(values, levels=DISCRETE_LEVELS):
+    """True jika kolom hanya berisi sedikit nilai bulat (misalnya Likert)."""
+    return bool(np.all(values == np.round(values))) and len(np.unique(values)) <= levels
+
+
+def choose_render_mode(x, y):
+    """Pilih mode grafik: ``raw``, ``sample`` atau ``binned``."""
+    n = len(x)
+    if n > SAMPLE_POINT_LIMIT or (is_discrete(x) and is_discrete(y)):
+        return "binned"
+    if n > RAW_POINT_LIMIT:
+        return "sample"
+    return "raw"
+
+
+def stratified_sample(x, y, size=RAW_POINT_LIMIT, bins=20, seed=0):
+    """Indeks sampel acak berstrata per sel grid 2D (terurut).
+
+    Setiap sel yang berisi data mendapat kuota sebanding dengan isinya,
+    minimal satu titik, sehingga pencilan di area jarang tetap terlihat.
+    """
+    n = len(x)
+    if n <= size:
+        return np.arange(n)
+    cell = _bin_index(x, bins) * bins + _bin_index(y, bins)
+    counts = np.bincount(cell, minlength=bins * bins)
+    quota = np.where(counts > 0, np.maximum(1, np.floor(counts * size / n)), 0)
+    order = np.lexsort((np.random.default_rng(seed).random(n), cell))
+    sorted_cell = cell[order]
+    position = np.arange(n) - (np.cumsum(counts) - counts)[sorted_cell]
+    return np.sort(order[position < quota[sorted_cell]])
+
+
+def binned_counts(x, y, bins=60):
+    """Jumlah titik per bin 2D: array (pusat x, pusat y, jumlah) yang tidak kosong.
+
+    Ukuran hasil paling banyak ``bins * bins`` berapa pun jumlah barisnya.
+    """
+    x_centers, x_index = _bin_centers(x, bins)
+    y_centers, y_index = _bin_centers(y, bins)
+    counts = np.bincount(x_index * len(y_centers) + y_index, minlength=len(x_centers) * len(y_centers))
+    filled = np.flatnonzero(counts)
+    return x_centers[filled // len(y_centers)], y_centers[filled % len(y_centers)], counts[filled]
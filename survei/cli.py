@@ -0,0 +1,66 @@
+"""Perintah batch: analisis semua file survei dalam satu direktori.
+
+Contoh::
+
+    python -m survei data/gelombang hasil/ --workers 8 --method spearman
+"""
+
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from survei.pipeline import SUPPORTED_EXTENSIONS, analyze_file, write_report
+
+
+def process_file(path, output_root, method, missing):
+    """Analisis satu file dan tulis laporannya; dipanggil di process pool."""
+    result = analyze_file(path, method=method, missing=missing)
+    write_report(result, os.path.join(output_root, os.path.basename(path)))
+    return result["info"]
+
+
+def find_inputs(input_dir):
+    return sorted(
+        os.path.join(input_dir, name)
+        for name in os.listdir(input_dir)
+        if name.lower().endswith(SUPPORTED_EXTENSIONS)
+    )
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m survei", description="Analisis batch file data survei.")
+    parser.add_argument("input_dir", help="direktori berisi file CSV/Excel")
+    parser.add_argument("output_dir", help="direktori tujuan laporan (satu subdirektori per nama file)")
+    parser.add_argument("--method", choices=["pearson", "spearman"], default="pearson")
+    parser.add_argument("--missing", choices=["pairwise", "listwise"], default="pairwise")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="jumlah proses paralel")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if not os.path.isdir(args.input_dir):
+        parser.error(f"direktori tidak ditemukan: {args.input_dir}")
+    paths = find_inputs(args.input_dir)
+    if not paths:
+        print(f"Tidak ada file {'/'.join(SUPPORTED_EXTENSIONS)} di {args.input_dir}", file=sys.stderr)
+        return 1
+
+    failed = 0
+    with ProcessPoolExecutor(max_workers=max(1, args.workers)) as executor:
+        futures = {
+            executor.submit(process_file, path, args.output_dir, args.method, args.missing): path
+            for path in paths
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                info = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"GAGAL {path}: {e}", file=sys.stderr)
+            else:
+                print(f"OK    {path}: {info['rows']} baris, {info['seconds']} detik")
+    return 1 if failed else 0
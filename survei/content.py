@@ -0,0 +1,206 @@
+"""Teks statis halaman "Tentang Aplikasi" dan "Profil Tim" dalam dua bahasa.
+
+Katalog ini hanya dibangun sekali saat modul diimpor (sekali per proses),
+bukan di setiap rerun skrip Streamlit. Kunci luar adalah nilai pilihan
+bahasa di sidebar (``"Indonesia"``/``"English"``).
+"""
+
+from types import MappingProxyType
+
+ABOUT = MappingProxyType({
+    "Indonesia": MappingProxyType({
+        "header": "📌 Tentang Aplikasi",
+        "body": """
+        Aplikasi ini digunakan untuk menganalisis data survei secara interaktif.
+
+        **Fitur Utama:**
+        - Upload data dari Excel atau CSV
+        - Analisis statistik deskriptif
+        - Analisis korelasi antar variabel
+        - Antarmuka bilingual (Indonesia/English)
+
+        **Teknologi yang Digunakan:**
+        - Python
+        - Streamlit
+        - Pandas
+        - NumPy
+        - SciPy
+        """,
+    }),
+    "English": MappingProxyType({
+        "header": "📌 About This Application",
+        "body": """
+        This application is used to analyze survey data interactively.
+
+        **Main Features:**
+        - Upload data from Excel or CSV
+        - Descriptive statistical analysis
+        - Correlation analysis between variables
+        - Bilingual interface (Indonesia/English)
+
+        **Technologies Used:**
+        - Python
+        - Streamlit
+        - Pandas
+        - NumPy
+        - SciPy
+        """,
+    }),
+})
+
+TEAM_PAGE = MappingProxyType({
+    "Indonesia": MappingProxyType({
+        "header": "👥 Profil Tim",
+        "intro": "Kenali anggota tim pengembang aplikasi ini beserta kontribusi mereka.",
+        "details": "📋 Detail Anggota Tim",
+        "select": "Pilih anggota untuk melihat detail:",
+        "name": "Nama",
+        "role": "Peran",
+        "contributions": "📝 Kontribusi",
+        "total": "Total Kontribusi",
+        "status": "Aktif",
+        "all_members": "🌟 Semua Anggota Tim",
+        "view": "Lihat {count} kontribusi",
+        "project": "📚 Tentang Proyek",
+        "goals": """
+            ### 🎯 Tujuan Proyek
+            - Membuat aplikasi analisis data survei yang interaktif
+            - Menerapkan konsep statistik dalam bentuk aplikasi web
+            - Membantu proses pembelajaran analisis data
+            - Menghasilkan produk yang bermanfaat untuk penelitian
+            """,
+        "timeline": """
+            ### 📅 Timeline Proyek
+            - **Perencanaan**: 1 minggu
+            - **Pengembangan**: 2 minggu
+            - **Testing**: 3 hari
+            - **Deployment**: 2 hari
+            - **Dokumentasi**: 2 hari
+            """,
+    }),
+    "English": MappingProxyType({
+        "header": "👥 Team Profile",
+        "intro": "Meet the team members who developed this application and their contributions.",
+        "details": "📋 Team Member Details",
+        "select": "Select member to view details:",
+        "name": "Name",
+        "role": "Role",
+        "contributions": "📝 Contributions",
+        "total": "Total Contributions",
+        "status": "Active",
+        "all_members": "🌟 All Team Members",
+        "view": "View {count} contributions",
+        "project": "📚 About the Project",
+        "goals": """
+            ### 🎯 Project Goals
+            - Create interactive survey data analysis application
+            - Implement statistical concepts in web application form
+            - Assist data analysis learning process
+            - Produce useful product for research
+            """,
+        "timeline": """
+            ### 📅 Project Timeline
+            - **Planning**: 1 week
+            - **Development**: 2 weeks
+            - **Testing**: 3 days
+            - **Deployment**: 2 days
+            - **Documentation**: 2 days
+            """,
+    }),
+})
+
+# Data anggota tim; "photo" adalah nama file foto asli di folder aplikasi
+TEAM = MappingProxyType({
+    "Indonesia": (
+        MappingProxyType({
+            "name": "Agni Aisyah Putri",
+            "id": "004202400137",
+            "photo": "agni.jpeg",
+            "role": "Ketua Tim & Backend Developer",
+            "contributions": (
+                "Mengembangkan struktur dan logika utama aplikasi",
+                "Implementasi analisis statistik deskriptif",
+                "Membuat fungsi korelasi Pearson dan Spearman",
+                "Menyiapkan dan mengolah data responden",
+                "Mengelola deployment aplikasi",
+                "Membuat dokumentasi teknis",
+            ),
+        }),
+        MappingProxyType({
+            "name": "Andita Nurul Azizah",
+            "id": "004202400059",
+            "photo": "andita.jpeg",
+            "role": "Frontend Developer & UI Designer",
+            "contributions": (
+                "Mendesain antarmuka pengguna aplikasi",
+                "Membuat halaman profil tim",
+                "Implementasi sistem bilingual",
+                "Mengembangkan layout responsif",
+                "Membuat Google Form survei",
+                "Mendesain visualisasi data",
+            ),
+        }),
+        MappingProxyType({
+            "name": "Cahyani Dwi Gemawang",
+            "id": "004202400044",
+            "photo": "cahyani.jpeg",
+            "role": "Data Analyst & Documentation",
+            "contributions": (
+                "Analisis data survei responden",
+                "Menyusun laporan hasil analisis",
+                "Membuat panduan penggunaan aplikasi",
+                "Testing dan debugging aplikasi",
+                "Dokumentasi proyek",
+                "Presentasi hasil proyek",
+            ),
+        }),
+    ),
+    "English": (
+        MappingProxyType({
+            "name": "Agni Aisyah Putri",
+            "id": "004202400137",
+            "photo": "agni.jpeg",
+            "role": "Team Lead & Backend Developer",
+            "contributions": (
+                "Developing main application structure and logic",
+                "Implementing descriptive statistical analysis",
+                "Creating Pearson and Spearman correlation functions",
+                "Preparing and processing respondent data",
+                "Managing application deployment",
+                "Creating technical documentation",
+            ),
+        }),
+        MappingProxyType({
+            "name": "Andita Nurul Azizah",
+            "id": "004202400059",
+            "photo": "andita.jpeg",
+            "role": "Frontend Developer & UI Designer",
+            "contributions": (
+                "Designing application user interface",
+                "Creating team profile page",
+                "Implementing bilingual system",
+                "Developing responsive layout",
+                "Creating Google Form survey",
+                "Designing data visualizations",
+            ),
+        }),
+        MappingProxyType({
+            "name": "Cahyani Dwi Gemawang",
+            "id": "004202400044",
+            "photo": "cahyani.jpeg",
+            "role": "Data Analyst & Documentation",
+            "contributions": (
+                "Analyzing survey respondent data",
+                "Compiling analysis result reports",
+                "Creating application user guide",
+                "Testing and debugging application",
+                "Project documentation",
+                "Project presentation",
+            ),
+        }),
+    ),
+})
+
+# Foto yang dipakai halaman profil dan lebar tampilannya (px)
+TEAM_PHOTOS = tuple(dict.fromkeys(member["photo"] for member in TEAM["Indonesia"]))
+PHOTO_WIDTHS = {"detail": 220, "card": 180}
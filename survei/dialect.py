@@ -0,0 +1,133 @@
+"""Deteksi format CSV (encoding, pemisah, desimal, header) dari sampel byte awal.
+
+Ekspor CSV dari Excel berbahasa Indonesia biasanya memakai ``;`` sebagai
+pemisah kolom, ``,`` sebagai pemisah desimal dan encoding Windows-1252.
+Dengan membaca beberapa puluh KB pertama saja, opsi ``pd.read_csv`` yang
+tepat bisa ditentukan sebelum parsing, sehingga file cukup dibaca sekali.
+"""
+
+import codecs
+import csv
+import re
+
+from survei.cache import PYARROW_AVAILABLE
+
+SAMPLE_BYTES = 64 * 1024
+DELIMITERS = (",", ";", "\t", "|")
+# Encoding dicoba berurutan; latin-1 selalu berhasil sehingga jadi cadangan terakhir
+ENCODINGS = ("utf-8", "cp1252", "latin-1")
+SAMPLE_LINES = 50
+
+_DOT_DECIMAL = re.compile(r"^[+-]?\d*\.\d+$")
+_COMMA_DECIMAL = re.compile(r"^[+-]?\d*,\d+$")
+_NUMBER = re.compile(r"^[+-]?(\d+([.,]\d*)?|[.,]\d+)([eE][+-]?\d+)?$")
+
+
+def read_sample(source, size=SAMPLE_BYTES):
+    """Byte awal dari path atau objek file (posisi file dikembalikan ke awal)."""
+    if isinstance(source, str):
+        with open(source, "rb") as handle:
+            return handle.read(size)
+    if isinstance(source, bytes):
+        return source[:size]
+    position = source.tell()
+    try:
+        return source.read(size)
+    finally:
+        source.seek(position)
+
+
+def detect_encoding(sample):
+    """Encoding yang bisa membaca sampel; karakter terpotong di akhir sampel diabaikan."""
+    if sample.startswith(codecs.BOM_UTF8):
+        return "utf-8-sig"
+    if sample.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return "utf-16"
+    for encoding in ENCODINGS:
+        try:
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+            return encoding
+        except UnicodeDecodeError:
+            continue
+    return "latin-1"
+
+
+def _lines(text):
+    # Baris terakhir tanpa akhir baris bisa terpotong oleh batas sampel, jadi dibuang
+    lines = text.splitlines()
+    if len(lines) > 1 and not text.endswith(("\n", "\r")):
+        lines = lines[:-1]
+    return [line for line in lines[:SAMPLE_LINES] if line.strip()]
+
+
+def detect_delimiter(lines):
+    """Pemisah yang memberi jumlah kolom paling konsisten (dan lebih dari satu)."""
+    best, best_score = ",", (0, 0)
+    for delimiter in DELIMITERS:
+        widths = [len(row) for row in csv.reader(lines, delimiter=delimiter)]
+        if not widths:
+            continue
+        common = max(set(widths), key=widths.count)
+        if common < 2:
+            continue
+        score = (widths.count(common), common)
+        if score > best_score:
+            best, best_score = delimiter, score
+    return best
+
+
+def detect_decimal(rows):
+    """``","`` jika angka di sampel lebih sering memakai koma desimal daripada titik."""
+    comma = dot = 0
+    for row in rows:
+        for field in row:
+            field = field.strip()
+            if _COMMA_DECIMAL.match(field):
+                comma += 1
+            elif _DOT_DECIMAL.match(field):
+                dot += 1
+    return "," if comma > dot else "."
+
+
+def detect_header(rows):
+    """True jika baris pertama tampak seperti nama kolom.
+
+    Baris pertama dianggap data jika ada kolom yang berisi angka di baris
+    pertama dan juga angka di baris-baris berikutnya.
+    """
+    if len(rows) < 2:
+        return True
+    first, rest = rows[0], rows[1:]
+    for i, field in enumerate(first):
+        column = [row[i].strip() for row in rest if i < len(row) and row[i].strip()]
+        if column and _NUMBER.match(field.strip()) and all(_NUMBER.match(value) for value in column):
+            return False
+    return True
+
+
+def sniff_csv(sample):
+    """Opsi ``pd.read_csv`` (sep, decimal, encoding, header/names) dari sampel byte."""
+    encoding = detect_encoding(sample)
+    text = codecs.getincrementaldecoder(encoding)(errors="replace").decode(sample, final=False)
+    lines = _lines(text)
+    delimiter = detect_delimiter(lines)
+    rows = list(csv.reader(lines, delimiter=delimiter))
+    # Kolom pemisah "," tidak mungkin juga memakai "," sebagai desimal
+    decimal = detect_decimal(rows[1:]) if delimiter != "," else "."
+    options = {"sep": delimiter, "decimal": decimal, "encoding": encoding}
+    if rows and not detect_header(rows):
+        options["header"] = None
+        options["names"] = tuple(f"kolom_{i + 1}" for i in range(max(len(row) for row in rows)))
+    return options
+
+
+def csv_options(source, use_pyarrow=True):
+    """Opsi ``pd.read_csv`` lengkap untuk ``source`` (path, bytes atau objek file).
+
+    Jika pyarrow tersedia, parser CSV multi-thread milik pyarrow dipakai.
+    """
+    options = sniff_csv(read_sample(source))
+    if use_pyarrow and PYARROW_AVAILABLE:
+        options["engine"] = "pyarrow"
+    return options
+
@@ -0,0 +1,111 @@
+"""Penyesuaian tipe data hasil survei agar hemat memori.
+
+Jawaban skala Likert disimpan sebagai integer kecil (int8/uint8, versi
+nullable jika ada data kosong), teks dengan sedikit nilai unik menjadi
+``category`` dan kolom benar/salah menjadi ``boolean``.
+"""
+
+import numpy as np
+import pandas as pd
+
+BOOLEAN_TOKENS = {"true": True, "false": False}
+# Teks dianggap kategori jika nilai uniknya tidak lebih dari batas ini
+# dan tidak lebih dari separuh jumlah baris
+CATEGORY_MAX_UNIQUE = 1000
+CATEGORY_MAX_RATIO = 0.5
+
+_INTEGER_TYPES = [
+    (np.uint8, "UInt8"),
+    (np.int8, "Int8"),
+    (np.uint16, "UInt16"),
+    (np.int16, "Int16"),
+    (np.uint32, "UInt32"),
+    (np.int32, "Int32"),
+]
+
+
+def _smallest_integer(low, high, nullable):
+    for numpy_type, nullable_type in _INTEGER_TYPES:
+        info = np.iinfo(numpy_type)
+        if info.min <= low and high <= info.max:
+            return nullable_type if nullable else np.dtype(numpy_type)
+    return None
+
+
+def _optimize_numeric(series):
+    if series.hasnans:
+        values = series.to_numpy(dtype=float, na_value=np.nan)
+        observed = values[~np.isnan(values)]
+    else:
+        observed = series.to_numpy()
+    if observed.size == 0 or not np.all(observed == np.round(observed)):
+        return series
+    dtype = _smallest_integer(observed.min(), observed.max(), nullable=series.hasnans)
+    if dtype is None:
+        return series
+    if series.hasnans:
+        return series.astype("Float64").astype(dtype)
+    return series.astype(dtype)
+
+
+def _optimize_text(series):
+    present = series.dropna()
+    if present.empty:
+        return series
+    unique = pd.unique(present)
+    lowered = {str(value).strip().lower() for value in unique}
+    if lowered <= set(BOOLEAN_TOKENS):
+        return series.map(lambda value: BOOLEAN_TOKENS[str(value).strip().lower()], na_action="ignore").astype("boolean")
+    if len(unique) <= CATEGORY_MAX_UNIQUE and len(unique) <= CATEGORY_MAX_RATIO * len(series):
+        return series.astype("category")
+    return series
+
+
+def optimize_series(series):
+    """Kembalikan ``series`` dengan tipe data sekecil mungkin tanpa kehilangan nilai."""
+    dtype = series.dtype
+    if pd.api.types.is_bool_dtype(dtype) or isinstance(dtype, pd.CategoricalDtype):
+        return series
+    if pd.api.types.is_numeric_dtype(dtype):
+        return _optimize_numeric(series)
+    if pd.api.types.is_object_dtype(dtype) or pd.api.types.is_string_dtype(dtype):
+        return _optimize_text(series)
+    return series
+
+
+def optimize_dtypes(df):
+    """Jalankan ``optimize_series`` untuk setiap kolom.
+
+    Ukuran memori sebelum dan sesudah (byte) dicatat di
+    ``df.attrs["memory_before"]`` dan ``df.attrs["memory_after"]``.
+    """
+    before = int(df.memory_usage(index=True, deep=True).sum())
+    if len(df.columns):
+        optimized = pd.concat([optimize_series(df.iloc[:, i]) for i in range(df.shape[1])], axis=1)
+        optimized.columns = df.columns
+    else:
+        optimized = df.copy()
+    optimized.attrs["memory_before"] = before
+    optimized.attrs["memory_after"] = int(optimized.memory_usage(index=True, deep=True).sum())
+    return optimized
+
+
+def append_rows(df, rows):
+    """Baris ``rows`` (kolom sama) ditambahkan di bawah ``df`` dengan tipe ``df`` dipertahankan.
+
+    Kolom ``category`` tetap ``category`` (kategori baru digabung); kolom
+    lain mengikuti aturan ``pd.concat`` (mis. uint8 + int16 -> int16).
+    """
+    if rows.empty:
+        return df
+    columns = {}
+    for name in df.columns:
+        top, bottom = df[name], rows[name]
+        if isinstance(top.dtype, pd.CategoricalDtype):
+            categories = top.cat.categories.union(pd.Index(bottom.dropna().unique()), sort=False)
+            top = top.cat.set_categories(categories)
+            bottom = pd.Series(pd.Categorical(bottom, categories=categories))
+        elif isinstance(bottom.dtype, pd.CategoricalDtype):
+            bottom = bottom.astype(top.dtype)
+        columns[name] = pd.concat([top, bottom], ignore_index=True)
+    return pd.DataFrame(columns, columns=df.columns)
@@ -0,0 +1,62 @@
+"""Pembacaan file Excel (.xlsx) secara streaming dengan openpyxl mode read-only.
+
+``openpyxl`` baru diimpor saat file Excel benar-benar dibaca, sehingga
+tidak memperlambat start aplikasi.
+"""
+
+import importlib.util
+import io
+import os
+
+import pandas as pd
+
+from survei.jobs import process_pool
+
+OPENPYXL_AVAILABLE = importlib.util.find_spec("openpyxl") is not None
+
+
+def _open_workbook(data):
+    import openpyxl
+
+    return openpyxl.load_workbook(io.BytesIO(data), read_only=True, data_only=True)
+
+
+def sheet_names(data):
+    """Daftar nama sheet tanpa membaca isi sheet."""
+    workbook = _open_workbook(data)
+    try:
+        return list(workbook.sheetnames)
+    finally:
+        workbook.close()
+
+
+def read_sheet(data, sheet):
+    """Baca satu sheet baris demi baris; baris pertama dipakai sebagai header."""
+    workbook = _open_workbook(data)
+    try:
+        rows = workbook[sheet].iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return pd.DataFrame()
+        columns = [f"Unnamed: {i}" if name is None else str(name) for i, name in enumerate(header)]
+        records = [row for row in rows if any(value is not None for value in row)]
+    finally:
+        workbook.close()
+    df = pd.DataFrame.from_records(records, columns=columns)
+    return df.infer_objects()
+
+
+def read_sheets(data, sheets, max_workers=None):
+    """Baca beberapa sheet (paralel di process pool) lalu gabungkan barisnya.
+
+    Jika lebih dari satu sheet, kolom ``sheet`` ditambahkan sebagai penanda
+    asal baris.
+    """
+    sheets = list(sheets)
+    if len(sheets) == 1:
+        return read_sheet(data, sheets[0])
+    workers = min(len(sheets), max_workers or os.cpu_count() or 1)
+    with process_pool(workers) as executor:
+        frames = list(executor.map(read_sheet, [data] * len(sheets), sheets))
+    combined = pd.concat(frames, keys=sheets, names=["sheet", None])
+    return combined.reset_index(level=0).reset_index(drop=True)
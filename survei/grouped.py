@@ -0,0 +1,143 @@
+"""Statistik deskriptif per kelompok (segmen demografi) dalam satu lintasan.
+
+Setiap kolom pengelompokan diubah menjadi kode bilangan bulat (kode
+kategori dipakai langsung jika kolomnya sudah ``category``), lalu kode
+beberapa kolom digabung menjadi satu kode kelompok. Jumlah, rata-rata dan
+simpangan baku dihitung dengan ``np.bincount``; kuantil diambil dari satu
+pengurutan (kelompok, nilai) per variabel, tanpa ``describe()`` per subset.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Kolom teks/bilangan bulat dengan nilai unik lebih banyak dari ini tidak ditawarkan untuk pengelompokan
+MAX_GROUP_LEVELS = 50
+PERCENTILES = (0.25, 0.5, 0.75)
+
+
+def group_columns(df, max_levels=MAX_GROUP_LEVELS):
+    """Kolom yang cocok untuk pengelompokan dengan paling banyak ``max_levels`` nilai unik.
+
+    Kategori, boolean, teks dan bilangan bulat (mis. angkatan atau kode
+    fakultas); kolom pecahan (float) tidak pernah ditawarkan.
+    """
+    columns = []
+    for name in df.columns:
+        dtype = df[name].dtype
+        if pd.api.types.is_float_dtype(dtype) or pd.api.types.is_complex_dtype(dtype):
+            continue
+        if df[name].nunique() <= max_levels:
+            columns.append(name)
+    return columns
+
+
+def _codes(series):
+    """Kode bilangan bulat (-1 untuk data hilang) dan label untuk satu kolom."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(dtype=np.int64), series.cat.categories
+    codes, labels = pd.factorize(series, sort=True)
+    return codes.astype(np.int64), labels
+
+
+def group_codes(df, by):
+    """Satu kode kelompok per baris untuk kombinasi kolom ``by``.
+
+    Mengembalikan ``(codes, index)``: ``codes`` bernilai -1 untuk baris yang
+    salah satu kolom ``by``-nya kosong, dan ``index`` adalah MultiIndex
+    kombinasi yang benar-benar muncul (urutan sesuai kode).
+    """
+    parts = [_codes(df[name]) for name in by]
+    present = np.ones(len(df), dtype=bool)
+    for codes, _ in parts:
+        present &= codes >= 0
+    shape = tuple(max(len(labels), 1) for _, labels in parts)
+    combined = np.ravel_multi_index(tuple(np.where(present, codes, 0) for codes, _ in parts), shape)
+    observed, inverse = np.unique(combined[present], return_inverse=True)
+    codes = np.full(len(df), -1, dtype=np.int64)
+    codes[present] = inverse
+    levels = np.unravel_index(observed, shape)
+    index = pd.MultiIndex.from_arrays(
+        [np.asarray(labels)[level] for (_, labels), level in zip(parts, levels)],
+        names=list(by)
+    )
+    return codes, index
+
+
+def _sorted_by_group(values, codes, n_groups, integer):
+    # Nilai terurut per kelompok. Untuk nilai bulat (mis. Likert) kunci
+    # kelompok * rentang + nilai cukup diurutkan sebagai satu array int64,
+    # jauh lebih cepat daripada lexsort dua kunci.
+    if integer and len(values):
+        low = values.min()
+        span = int(values.max() - low) + 1
+        if n_groups * span < 2 ** 62:
+            key = codes * span + (values - low).astype(np.int64)
+            key.sort()
+            return (key % span + low).astype(float)
+    return values[np.lexsort((values, codes))]
+
+
+def _group_quantiles(values, codes, n_groups, quantiles, integer=False):
+    # Urutkan sekali per (kelompok, nilai); kuantil tiap kelompok diambil
+    # dengan interpolasi linear seperti ``Series.quantile``
+    counts = np.bincount(codes, minlength=n_groups)
+    ordered = _sorted_by_group(values, codes, n_groups, integer)
+    starts = np.cumsum(counts) - counts
+    out = np.full((n_groups, len(quantiles)), np.nan)
+    has_data = counts > 0
+    for i, q in enumerate(quantiles):
+        position = starts[has_data] + q * (counts[has_data] - 1)
+        low = np.floor(position).astype(np.int64)
+        high = np.ceil(position).astype(np.int64)
+        out[has_data, i] = ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+    return out
+
+
+def grouped_describe(df, columns, by, percentiles=PERCENTILES):
+    """Statistik deskriptif setiap variabel di setiap kelompok ``by``.
+
+    Hasilnya satu baris per (kelompok, variabel) dengan kolom seperti
+    ``describe()``: count, mean, std, min, persentil, max. Baris yang
+    kolom ``by``-nya kosong tidak ikut dihitung.
+    """
+    columns = list(columns)
+    by = list(by)
+    codes, index = group_codes(df, by)
+    n_groups = len(index)
+    quantiles = (0.0, *percentiles, 1.0)
+    names = ["min", *[f"{q * 100:g}%" for q in percentiles], "max"]
+    in_group = codes >= 0
+
+    blocks = []
+    for name in columns:
+        integer = pd.api.types.is_integer_dtype(df[name].dtype)
+        values = df[name].to_numpy(dtype=float, na_value=np.nan)
+        valid = in_group & ~np.isnan(values)
+        group = codes[valid]
+        values = values[valid]
+        count = np.bincount(group, minlength=n_groups).astype(float)
+        # Pusatkan dengan rata-rata keseluruhan agar jumlah kuadrat stabil
+        center = values.mean() if len(values) else 0.0
+        shifted = values - center
+        total = np.bincount(group, weights=shifted, minlength=n_groups)
+        squares = np.bincount(group, weights=shifted * shifted, minlength=n_groups)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mean = total / count
+            var = (squares - total * mean) / (count - 1)
+        stats = {
+            "count": count,
+            "mean": np.where(count > 0, mean + center, np.nan),
+            "std": np.where(count > 1, np.sqrt(np.maximum(var, 0.0)), np.nan),
+        }
+        for label, column in zip(names, _group_quantiles(values, group, n_groups, quantiles, integer).T):
+            stats[label] = column
+        block = pd.DataFrame(stats, index=index)
+        block["variable"] = name
+        blocks.append(block.set_index("variable", append=True))
+
+    if not blocks:
+        return pd.DataFrame()
+    # Urutan baris: kelompok dulu, lalu variabel sesuai urutan pilihan
+    result = pd.concat(blocks)
+    order = np.lexsort((np.repeat(np.arange(len(columns)), n_groups), np.tile(np.arange(n_groups), len(columns))))
+    return result.iloc[order]
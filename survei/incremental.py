@@ -0,0 +1,193 @@
+"""Akumulator statistik yang bisa digabung untuk menambah batch responden.
+
+Statistik deskriptif dan korelasi Pearson dataset tersimpan dihitung dari
+akumulator, bukan dari seluruh baris. Menambah satu batch cukup memperbarui
+akumulator dengan baris batch itu (rumus Welford/Chan), jadi biayanya
+sebanding dengan ukuran batch, bukan ukuran dataset.
+
+- count/mean/M2/min/max per kolom: :class:`survei.streaming.RunningStats`.
+- Kuartil: frekuensi setiap nilai (tepat, cocok untuk skala Likert); jika
+  nilai uniknya terlalu banyak, dipakai :class:`~survei.streaming.QuantileSketch`
+  (perkiraan).
+- Korelasi: co-moment per pasangan kolom pada baris yang terisi di
+  keduanya (:class:`CoMoments`), sama seperti mode pairwise
+  :func:`survei.correlation.correlation_matrix`.
+
+Korelasi Spearman tidak bisa diperbarui bertahap karena peringkat seluruh
+data berubah setiap ada baris baru.
+"""
+
+import numpy as np
+import pandas as pd
+
+from survei.correlation import p_values
+from survei.streaming import DESCRIBE_COLUMNS, QuantileSketch, RunningStats
+
+# Kolom dengan nilai unik lebih banyak dari ini memakai sketsa kuantil (perkiraan)
+MAX_DISTINCT = 10_000
+# Baris per blok saat memperbarui akumulator (membatasi memori matriks sementara)
+CHUNK_ROWS = 100_000
+PERCENTILES = (0.25, 0.5, 0.75)
+
+
+class CoMoments:
+    """Rata-rata, M2 dan co-moment per pasangan kolom, bisa digabung (rumus Chan).
+
+    Elemen ``[i, j]`` dihitung dari baris yang terisi di kolom ``i`` dan
+    ``j``: ``n`` jumlah baris, ``mean``/``m2`` untuk kolom ``i`` dan ``c``
+    jumlah perkalian simpangan kolom ``i`` dan ``j``.
+    """
+
+    def __init__(self, n_columns):
+        shape = (n_columns, n_columns)
+        self.n = np.zeros(shape)
+        self.mean = np.zeros(shape)
+        self.m2 = np.zeros(shape)
+        self.c = np.zeros(shape)
+
+    def update(self, block):
+        """Tambahkan blok 2D (baris x kolom) bertipe float; NaN = data hilang."""
+        block = np.asarray(block, dtype=float)
+        present = ~np.isnan(block)
+        mask = present.astype(float)
+        # Pusatkan per kolom di dalam blok agar penjumlahan kuadrat stabil
+        count = mask.sum(axis=0)
+        total = np.where(present, block, 0.0).sum(axis=0)
+        center = np.divide(total, count, out=np.zeros_like(total), where=count > 0)
+        x = np.where(present, block - center, 0.0)
+
+        other = CoMoments(block.shape[1])
+        other.n = mask.T @ mask
+        sums = x.T @ mask
+        with np.errstate(divide="ignore", invalid="ignore"):
+            has_data = other.n > 0
+            other.mean = np.where(has_data, sums / other.n, 0.0) + center[:, None]
+            other.m2 = np.where(has_data, (x * x).T @ mask - sums * sums / other.n, 0.0)
+            other.c = np.where(has_data, x.T @ x - sums * sums.T / other.n, 0.0)
+        self.merge(other)
+
+    def merge(self, other):
+        total = self.n + other.n
+        delta = other.mean - self.mean
+        with np.errstate(divide="ignore", invalid="ignore"):
+            share = np.where(total > 0, other.n / total, 0.0)
+        weight = self.n * share
+        self.m2 = self.m2 + other.m2 + delta * delta * weight
+        self.c = self.c + other.c + delta * delta.T * weight
+        self.mean = self.mean + delta * share
+        self.n = total
+
+    def correlation(self, index=None):
+        """``(r, p, n)`` Pearson pairwise untuk kolom pada posisi ``index``."""
+        if index is not None:
+            grid = np.ix_(index, index)
+            n, m2, c = self.n[grid], self.m2[grid], self.c[grid]
+        else:
+            n, m2, c = self.n, self.m2, self.c
+        with np.errstate(divide="ignore", invalid="ignore"):
+            r = c / np.sqrt(m2 * m2.T)
+        r = np.clip(r, -1.0, 1.0)
+        r[n < 2] = np.nan
+        np.fill_diagonal(r, np.where(np.isnan(np.diag(r)), np.nan, 1.0))
+        return r, p_values(r, n), n
+
+
+def _merge_counts(left, right):
+    if left is None or right is None:
+        return None
+    values, inverse = np.unique(np.concatenate([left[0], right[0]]), return_inverse=True)
+    counts = np.bincount(inverse, weights=np.concatenate([left[1], right[1]]), minlength=len(values))
+    if len(values) > MAX_DISTINCT:
+        return None
+    return values, counts.astype(np.int64)
+
+
+def _count_quantiles(values, counts, quantiles):
+    # Interpolasi linear seperti ``Series.quantile`` langsung dari frekuensi nilai
+    n = counts.sum()
+    cumulative = np.cumsum(counts)
+    position = np.asarray(quantiles) * (n - 1)
+    low = values[np.searchsorted(cumulative, np.floor(position), side="right")]
+    high = values[np.searchsorted(cumulative, np.ceil(position), side="right")]
+    return low + (high - low) * (position - np.floor(position))
+
+
+class DatasetAccumulator:
+    """Semua akumulator untuk kolom numerik satu dataset.
+
+    Dibuat sekali dari data awal, lalu diperbarui dengan :meth:`update`
+    setiap ada batch baru.
+    """
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.n_rows = 0
+        self.stats = RunningStats(len(self.columns))
+        self.moments = CoMoments(len(self.columns))
+        self.sketches = [QuantileSketch(seed=i) for i in range(len(self.columns))]
+        self.counts = [(np.empty(0), np.empty(0, dtype=np.int64)) for _ in self.columns]
+
+    def update(self, df):
+        """Tambahkan baris ``df`` (harus memuat semua kolom akumulator)."""
+        values = df[self.columns].to_numpy(dtype=float, na_value=np.nan)
+        for start in range(0, len(values), CHUNK_ROWS):
+            block = values[start:start + CHUNK_ROWS]
+            self.stats.update(block)
+            self.moments.update(block)
+            for i, column in enumerate(block.T):
+                column = column[~np.isnan(column)]
+                self.sketches[i].update(column)
+                if self.counts[i] is not None:
+                    self.counts[i] = _merge_counts(self.counts[i], np.unique(column, return_counts=True))
+        self.n_rows += len(values)
+
+    @property
+    def nbytes(self):
+        """Perkiraan ukuran akumulator di memori (untuk anggaran cache)."""
+        arrays = [self.stats.count, self.stats.mean, self.stats.m2, self.stats.min, self.stats.max,
+                  self.moments.n, self.moments.mean, self.moments.m2, self.moments.c]
+        arrays += [level for sketch in self.sketches for level in sketch.levels]
+        arrays += [array for counts in self.counts if counts is not None for array in counts]
+        return sum(array.nbytes for array in arrays)
+
+    def _index(self, columns):
+        position = {name: i for i, name in enumerate(self.columns)}
+        return [position[name] for name in columns]
+
+    def exact_quantiles(self, columns):
+        """True jika kuartil semua ``columns`` dihitung tepat (bukan dari sketsa)."""
+        return all(self.counts[i] is not None for i in self._index(columns))
+
+    def complete(self, columns):
+        """True jika ``columns`` tidak punya data kosong (pairwise = listwise)."""
+        return bool(np.all(self.stats.count[self._index(columns)] == self.n_rows))
+
+    def describe(self, columns=None):
+        """Tabel bergaya ``df.describe().T`` untuk ``columns``."""
+        columns = self.columns if columns is None else list(columns)
+        index = self._index(columns)
+        quantiles = np.full((len(index), len(PERCENTILES)), np.nan)
+        for row, i in enumerate(index):
+            if self.stats.count[i] == 0:
+                continue
+            if self.counts[i] is not None:
+                quantiles[row] = _count_quantiles(*self.counts[i], PERCENTILES)
+            else:
+                quantiles[row] = self.sketches[i].quantiles(PERCENTILES)
+        count = self.stats.count[index]
+        has_data = count > 0
+        table = pd.DataFrame({
+            "count": count,
+            "mean": np.where(has_data, self.stats.mean[index], np.nan),
+            "std": self.stats.std[index],
+            "min": np.where(has_data, self.stats.min[index], np.nan),
+            "25%": quantiles[:, 0],
+            "50%": quantiles[:, 1],
+            "75%": quantiles[:, 2],
+            "max": np.where(has_data, self.stats.max[index], np.nan),
+        }, index=pd.Index(columns))
+        return table[DESCRIBE_COLUMNS]
+
+    def correlation(self, columns):
+        """``(r, p, n)`` Pearson pairwise, sama seperti ``correlation_matrix``."""
+        return self.moments.correlation(self._index(columns))
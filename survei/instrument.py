@@ -0,0 +1,88 @@
+"""Pencatatan waktu dan memori per tahap untuk setiap rerun aplikasi.
+
+Setiap tahap mencatat waktu nyata (wall), waktu CPU, jumlah baris yang
+diproses dan selisih memori (RSS; None jika platform tidak menyediakannya,
+misalnya Windows). Saat dinonaktifkan, ``stage()`` hanya
+mengembalikan context manager kosong sehingga hampir tanpa biaya.
+"""
+
+import json
+import logging
+import os
+import time
+import uuid
+from contextlib import contextmanager, nullcontext
+
+try:
+    import resource
+except ImportError:
+    # Windows tidak punya modul ``resource``
+    resource = None
+
+logger = logging.getLogger("survei.perf")
+
+_PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss():
+    """Memori resident proses saat ini (byte), atau None jika tidak tersedia."""
+    try:
+        with open("/proc/self/statm") as handle:
+            return int(handle.read().split()[1]) * _PAGE_SIZE
+    except (OSError, IndexError, ValueError):
+        if resource is None:
+            return None
+        # Bukan Linux: pakai puncak RSS sebagai pendekatan
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def enable_json_logging(stream=None):
+    """Tampilkan log ``survei.perf`` (satu objek JSON per baris) ke stderr."""
+    if not any(getattr(handler, "_survei_perf", False) for handler in logger.handlers):
+        handler = logging.StreamHandler(stream)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        handler._survei_perf = True
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        logger.propagate = False
+
+
+class StageTimer:
+    """Kumpulan catatan tahap untuk satu rerun.
+
+    ``on_record(timer)`` dipanggil setelah setiap tahap selesai, misalnya
+    untuk memperbarui panel debug. Setiap catatan juga dikirim ke logger
+    ``survei.perf`` sebagai satu baris JSON. ``rerun`` adalah id rerun
+    (baru jika tidak diberikan); timer fragment memakai id rerun induknya
+    agar catatannya bisa digabung dengan catatan skrip utama.
+    """
+
+    def __init__(self, enabled=False, on_record=None, rerun=None, **context):
+        self.enabled = enabled
+        self.on_record = on_record
+        self.context = {"rerun": rerun or uuid.uuid4().hex[:12], **context}
+        self.records = []
+
+    def stage(self, name, rows=None):
+        if not self.enabled:
+            return nullcontext({})
+        return self._measure(name, rows)
+
+    @contextmanager
+    def _measure(self, name, rows):
+        record = {"stage": name, "rows": rows}
+        rss_start = current_rss()
+        # CPU thread skrip saja, agar sesi lain di server yang sama tidak ikut terhitung
+        cpu_start = time.thread_time()
+        wall_start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["wall_ms"] = round((time.perf_counter() - wall_start) * 1000, 3)
+            record["cpu_ms"] = round((time.thread_time() - cpu_start) * 1000, 3)
+            rss_end = current_rss()
+            record["memory_delta"] = None if rss_start is None or rss_end is None else rss_end - rss_start
+            self.records.append(record)
+            logger.info(json.dumps({**self.context, **record}, default=str))
+            if self.on_record is not None:
+                self.on_record(self)
@@ -0,0 +1,134 @@
+"""Job latar belakang yang bisa dibatalkan untuk analisis yang lama.
+
+Satu job adalah daftar tugas kecil ``(fungsi, argumen)`` yang dikirim ke
+executor bersama (misalnya process pool milik server). Script Streamlit
+tidak menunggu hasilnya: progres dibaca dari jumlah tugas yang selesai.
+Membatalkan job membatalkan semua tugas yang belum mulai, sehingga CPU
+berhenti terpakai paling lambat setelah tugas yang sedang berjalan selesai.
+"""
+
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+_PENDING = object()
+# Worker dijalankan sebagai proses baru (spawn), bukan fork: fork dari server
+# Streamlit yang punya banyak thread bisa menyalin lock yang sedang dipegang
+# thread lain sehingga worker macet
+_MP_CONTEXT = multiprocessing.get_context("spawn")
+
+
+def process_pool(max_workers):
+    """Process pool dengan worker spawn, untuk job dan pembacaan paralel."""
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=_MP_CONTEXT)
+
+
+class Job:
+    """Sekumpulan future untuk satu analisis beserta fungsi penggabungnya."""
+
+    def __init__(self, key, futures, finish, label=None):
+        self.key = key
+        self.label = label
+        self.futures = futures
+        self.finish = finish
+        self.started = time.time()
+        self.finished = None
+        self.cancelled = False
+        self._result = _PENDING
+        self._error = None
+
+    @property
+    def progress(self):
+        if not self.futures:
+            return 1.0
+        return sum(future.done() for future in self.futures) / len(self.futures)
+
+    @property
+    def status(self):
+        if self.cancelled:
+            return "cancelled"
+        if not all(future.done() for future in self.futures):
+            return "running"
+        if self.finished is None:
+            self.finished = time.time()
+        if self.error is not None:
+            return "failed"
+        return "done"
+
+    @property
+    def error(self):
+        if self._error is None:
+            for future in self.futures:
+                if future.done() and not future.cancelled() and future.exception() is not None:
+                    self._error = future.exception()
+                    break
+        return self._error
+
+    def cancel(self):
+        self.cancelled = True
+        for future in self.futures:
+            future.cancel()
+
+    def result(self):
+        """Hasil gabungan; hanya boleh dipanggil setelah ``status == "done"``."""
+        if self._result is _PENDING:
+            self._result = self.finish([future.result() for future in self.futures])
+        return self._result
+
+
+class JobTable:
+    """Job milik satu sesi, paling banyak satu job per slot.
+
+    Slot adalah nama tempat hasil ditampilkan (misalnya ``"resampling-pair"``).
+    Mengirim job dengan kunci berbeda ke slot yang sama membatalkan job lama,
+    jadi pekerjaan untuk input yang sudah diganti pengguna tidak diteruskan.
+    """
+
+    def __init__(self):
+        self.jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, executor, slot, key, tasks, finish, label=None):
+        """Kirim job ke ``executor`` kecuali slot sudah memegang job dengan kunci yang sama."""
+        with self._lock:
+            job = self.jobs.get(slot)
+            if job is not None and job.key == key:
+                return job
+            if job is not None:
+                job.cancel()
+            futures = [executor.submit(func, *args) for func, args in tasks]
+            job = self.jobs[slot] = Job(key, futures, finish, label=label)
+            return job
+
+    def get(self, slot):
+        return self.jobs.get(slot)
+
+    def cancel(self, slot):
+        job = self.jobs.get(slot)
+        if job is not None:
+            job.cancel()
+
+    def discard(self, slot):
+        with self._lock:
+            job = self.jobs.pop(slot, None)
+        if job is not None:
+            job.cancel()
+
+    def cancel_all(self):
+        for job in list(self.jobs.values()):
+            job.cancel()
+
+    def summary(self):
+        """Satu dict per job: slot, label, status, progres (0-1) dan durasi (detik)."""
+        rows = []
+        for slot, job in self.jobs.items():
+            end = job.finished or time.time()
+            rows.append({
+                "slot": slot,
+                "label": job.label,
+                "status": job.status,
+                "progress": round(job.progress, 3),
+                "seconds": round(end - job.started, 1),
+            })
+        return rows
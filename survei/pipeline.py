@@ -0,0 +1,94 @@
+"""API analisis tanpa Streamlit: muat -> tipe data -> deskriptif -> korelasi.
+
+Dipakai oleh aplikasi Streamlit maupun perintah batch (``python -m survei``).
+"""
+
+import json
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from survei.correlation import correlation_matrix, correlation_table
+from survei.dialect import csv_options
+from survei.dtypes import optimize_dtypes
+from survei.excel import read_sheets, sheet_names
+from survei.grouped import grouped_describe
+
+SUPPORTED_EXTENSIONS = (".csv", ".xlsx", ".xls")
+
+
+def load_file(path, sheets=None):
+    """Baca file CSV/Excel dari disk dan perkecil tipe datanya.
+
+    Untuk .xlsx, ``sheets=None`` berarti sheet pertama saja.
+    """
+    name = path.lower()
+    if name.endswith(".csv"):
+        df = pd.read_csv(path, **csv_options(path))
+    elif name.endswith(".xlsx"):
+        with open(path, "rb") as handle:
+            data = handle.read()
+        df = read_sheets(data, sheets or sheet_names(data)[:1])
+    elif name.endswith(".xls"):
+        df = pd.read_excel(path)
+    else:
+        raise ValueError(f"Format file tidak didukung: {path}")
+    return optimize_dtypes(df)
+
+
+def numeric_columns(df):
+    return df.select_dtypes(include=[np.number]).columns.tolist()
+
+
+def describe(df, columns=None, by=None):
+    """Statistik deskriptif (bergaya ``df.describe().T``) kolom numerik.
+
+    Dengan ``by`` (daftar kolom), statistik dihitung per kelompok; lihat
+    :func:`survei.grouped.grouped_describe`.
+    """
+    columns = numeric_columns(df) if columns is None else list(columns)
+    if by:
+        return grouped_describe(df, columns, by)
+    return df[columns].describe().T
+
+
+def correlate(df, columns=None, method="pearson", missing="pairwise"):
+    """Tabel korelasi semua pasangan kolom numerik (r, nilai-p, N)."""
+    columns = numeric_columns(df) if columns is None else list(columns)
+    values = df[columns].to_numpy(dtype=float, na_value=np.nan)
+    r, p, n = correlation_matrix(values, method=method, missing=missing)
+    return correlation_table(columns, r, p, n)
+
+
+def analyze_file(path, method="pearson", missing="pairwise", sheets=None):
+    """Jalankan seluruh pipeline untuk satu file dan kembalikan hasilnya (dict)."""
+    started = time.perf_counter()
+    df = load_file(path, sheets=sheets)
+    columns = numeric_columns(df)
+    result = {
+        "describe": describe(df, columns) if columns else pd.DataFrame(),
+        "correlation": correlate(df, columns, method=method, missing=missing) if len(columns) >= 2 else pd.DataFrame(),
+        "info": {
+            "file": os.path.basename(path),
+            "rows": len(df),
+            "columns": len(df.columns),
+            "numeric_columns": len(columns),
+            "memory_before": df.attrs.get("memory_before"),
+            "memory_after": df.attrs.get("memory_after"),
+            "method": method,
+            "missing": missing,
+        },
+    }
+    result["info"]["seconds"] = round(time.perf_counter() - started, 4)
+    return result
+
+
+def write_report(result, output_dir):
+    """Simpan hasil ``analyze_file`` ke ``output_dir`` (CSV + summary.json)."""
+    os.makedirs(output_dir, exist_ok=True)
+    result["describe"].to_csv(os.path.join(output_dir, "describe.csv"))
+    result["correlation"].to_csv(os.path.join(output_dir, "correlation.csv"), index=False)
+    with open(os.path.join(output_dir, "summary.json"), "w", encoding="utf-8") as handle:
+        json.dump(result["info"], handle, indent=2)
@@ -0,0 +1,61 @@
+"""Pratinjau data per halaman: urut, saring dan potong di sisi server."""
+
+import numpy as np
+import pandas as pd
+
+FILTER_OPERATORS = ["=", "≠", ">", "≥", "<", "≤", "contains"]
+
+
+def column_summary(df):
+    """Ringkasan per kolom: tipe data, jumlah terisi dan jumlah kosong."""
+    nulls = df.isna().sum()
+    return pd.DataFrame({
+        "dtype": df.dtypes.astype(str),
+        "non_null": len(df) - nulls,
+        "null": nulls,
+    })
+
+
+def sort_positions(series, ascending=True):
+    """Posisi baris (bukan label indeks) setelah diurutkan; NaN di akhir."""
+    ordered = series.reset_index(drop=True).sort_values(ascending=ascending, na_position="last", kind="stable")
+    return ordered.index.to_numpy()
+
+
+def filter_mask(series, operator, value):
+    """Masker boolean baris yang memenuhi ``series <operator> value``.
+
+    Untuk kolom numerik ``value`` diubah ke angka (``ValueError`` jika
+    gagal); operator ``contains`` selalu membandingkan sebagai teks. Baris
+    kosong tidak pernah terpilih, termasuk untuk operator ``≠``.
+    """
+    if operator == "contains":
+        return series.astype(str).str.contains(str(value), case=False, regex=False).to_numpy(dtype=bool)
+    if pd.api.types.is_numeric_dtype(series):
+        value = float(value)
+    compare = {
+        "=": series.eq,
+        "≠": series.ne,
+        ">": series.gt,
+        "≥": series.ge,
+        "<": series.lt,
+        "≤": series.le,
+    }[operator]
+    return (compare(value) & series.notna()).fillna(False).to_numpy(dtype=bool)
+
+
+def page_slice(df, positions, page, page_size, columns=None):
+    """Ambil satu halaman baris (dan kolom terpilih) dari ``df``.
+
+    Hanya baris pada halaman tersebut yang disalin, sehingga biaya
+    pratinjau tidak bergantung pada ukuran file.
+    """
+    start = (page - 1) * page_size
+    window = positions[start:start + page_size]
+    if columns is None:
+        return df.iloc[window]
+    return df.iloc[window, df.columns.get_indexer(columns)]
+
+
+def page_count(n_rows, page_size):
+    return max(1, int(np.ceil(n_rows / page_size)))
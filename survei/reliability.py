@@ -0,0 +1,101 @@
+"""Reliabilitas skala kuesioner (Cronbach's alpha) dari satu matriks kovarians.
+
+Alpha, alpha jika item dihapus dan korelasi item-total terkoreksi semuanya
+bisa dinyatakan lewat elemen matriks kovarians item: varians skor total
+adalah jumlah seluruh elemen, kovarians item dengan skor total adalah
+jumlah barisnya. Jadi setelah matriks kovarians dihitung sekali, statistik
+setiap item didapat dengan operasi vektor tanpa menghitung ulang skor total
+per item. Item yang dibalik (reverse-coded) cukup membalik tanda baris dan
+kolomnya.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+_TRAILING_NUMBER = re.compile(r"[\s_.\-]*\d+[a-zA-Z]?$")
+
+
+def default_scale(name):
+    """Tebakan nama skala dari nama item: awalan tanpa nomor (``"KEP_3"`` -> ``"KEP"``).
+
+    Nama tanpa nomor di akhir (misalnya ``"usia"``) dianggap bukan item skala
+    dan menghasilkan string kosong.
+    """
+    name = str(name)
+    prefix = _TRAILING_NUMBER.sub("", name)
+    return prefix if prefix != name else ""
+
+
+def covariance(values):
+    """Matriks kovarians (ddof=1), rata-rata item dan N dari baris yang lengkap.
+
+    Baris dengan data kosong di salah satu kolom dibuang (listwise), seperti
+    pada analisis reliabilitas umumnya.
+    """
+    values = np.asarray(values, dtype=float)
+    values = values[~np.isnan(values).any(axis=1)]
+    n = len(values)
+    means = values.mean(axis=0) if n else np.full(values.shape[1], np.nan)
+    centered = values - means
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = centered.T @ centered / (n - 1)
+    return cov, means, n
+
+
+def reverse_items(cov, reversed_items):
+    """Kovarians setelah item bertanda ``True`` di ``reversed_items`` dibalik skornya."""
+    sign = np.where(np.asarray(reversed_items, dtype=bool), -1.0, 1.0)
+    return cov * np.outer(sign, sign)
+
+
+def cronbach_alpha(cov):
+    k = cov.shape[0]
+    if k < 2:
+        return np.nan
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return k / (k - 1) * (1 - np.trace(cov) / cov.sum())
+
+
+def reliability(cov, n, items, means=None):
+    """Ringkasan skala dan tabel per item dari matriks kovarians ``cov``.
+
+    Mengembalikan ``(summary, table)``. ``summary`` berisi jumlah item, N,
+    alpha, alpha terstandar dan rata-rata korelasi antar item. ``table``
+    berindeks nama item dengan kolom rata-rata (jika ``means`` diberikan),
+    simpangan baku, korelasi item-total terkoreksi dan alpha jika item
+    dihapus.
+    """
+    cov = np.asarray(cov, dtype=float)
+    k = cov.shape[0]
+    var = np.diag(cov)
+    total = cov.sum()
+    # Kovarians item dengan total; total tanpa item i punya varians total - 2*row_i + var_i
+    row = cov.sum(axis=1)
+    rest_var = total - 2 * row + var
+    with np.errstate(divide="ignore", invalid="ignore"):
+        std = np.sqrt(var)
+        corr = cov / np.outer(std, std)
+        mean_r = (corr.sum() - k) / (k * (k - 1)) if k > 1 else np.nan
+        item_total = (row - var) / np.sqrt(var * rest_var)
+        if k > 2:
+            alpha_deleted = (k - 1) / (k - 2) * (1 - (np.trace(cov) - var) / rest_var)
+        else:
+            alpha_deleted = np.full(k, np.nan)
+        standardized = k * mean_r / (1 + (k - 1) * mean_r) if k > 1 else np.nan
+
+    summary = {
+        "items": k,
+        "n": n,
+        "alpha": float(cronbach_alpha(cov)),
+        "alpha_standardized": float(standardized),
+        "mean_inter_item_r": float(mean_r),
+    }
+    columns = {}
+    if means is not None:
+        columns["mean"] = np.asarray(means, dtype=float)
+    columns["std"] = std
+    columns["item_total_r"] = item_total
+    columns["alpha_if_deleted"] = alpha_deleted
+    return summary, pd.DataFrame(columns, index=pd.Index(list(items), name="item"))
@@ -0,0 +1,285 @@
+"""Interval kepercayaan bootstrap dan nilai-p permutasi untuk korelasi.
+
+Resampling dikerjakan per batch sebagai satu operasi array (banyak
+resample sekaligus): untuk satu pasangan berupa array 2D (resample x
+baris), untuk matriks korelasi berupa tensor (resample x kolom x baris)
+yang dihitung dengan satu perkalian matriks bertumpuk. Jumlah resample
+dibagi menjadi beberapa tugas dengan seed turunan
+``numpy.random.SeedSequence``, sehingga hasilnya sama persis di mana pun
+tugas dijalankan (langsung atau sebagai job latar belakang,
+:mod:`survei.jobs`).
+
+Biaya matriks sebanding dengan resample x baris x kolom²: 1000 resample
+untuk 20.000 baris x 20 kolom berarti sekitar 10^10 operasi per metode.
+"""
+
+import numpy as np
+from scipy import stats
+
+from survei.correlation import correlation_matrix, missing_patterns, rank_columns
+
+# Batas elemen array indeks per batch (resample x baris) agar memori terkendali
+BATCH_ELEMENTS = 5_000_000
+# Batas elemen tensor matriks per batch (resample x kolom x baris). Sengaja
+# kecil (2 MB float64) agar tensor muat di cache CPU: operasi elemen demi
+# elemen pada tensor yang lebih besar justru lebih lambat daripada per resample.
+MATRIX_BATCH_ELEMENTS = 262_144
+# Jumlah resample per job (satu job = satu seed turunan)
+JOB_SIZE = 1000
+
+
+def _row_pearson(a, b):
+    """Korelasi Pearson per baris dari dua array 2D (resample x observasi)."""
+    n = a.shape[1]
+    sum_a = a.sum(axis=1)
+    sum_b = b.sum(axis=1)
+    cov = np.einsum("ij,ij->i", a, b) - sum_a * sum_b / n
+    var_a = np.einsum("ij,ij->i", a, a) - sum_a ** 2 / n
+    var_b = np.einsum("ij,ij->i", b, b) - sum_b ** 2 / n
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return cov / np.sqrt(var_a * var_b)
+
+
+def _resample_ranks(groups, n_groups, index):
+    """Peringkat rata-rata di dalam setiap resample tanpa mengurutkan ulang.
+
+    ``groups`` adalah kode urutan nilai unik tiap observasi asli. Peringkat
+    dihitung dari jumlah kemunculan tiap nilai dalam resample (bincount +
+    cumsum), sehingga biayanya linear terhadap ukuran batch.
+    """
+    codes = groups[index]
+    rows = codes.shape[0]
+    offsets = np.arange(rows)[:, None] * n_groups
+    counts = np.bincount((codes + offsets).ravel(), minlength=rows * n_groups).reshape(rows, n_groups)
+    midranks = np.cumsum(counts, axis=1) - (counts - 1) / 2
+    return np.take_along_axis(midranks, codes, axis=1)
+
+
+def _job_sizes(n_resamples):
+    sizes = [JOB_SIZE] * (n_resamples // JOB_SIZE)
+    if n_resamples % JOB_SIZE:
+        sizes.append(n_resamples % JOB_SIZE)
+    return sizes
+
+
+def _plan(worker, args, n_resamples, seed):
+    sizes = _job_sizes(n_resamples)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    return [(worker, (*args, size, job_seed)) for size, job_seed in zip(sizes, seeds)]
+
+
+def _interval(samples, confidence, axis=None):
+    alpha = (1 - confidence) / 2
+    low, high = np.nanquantile(samples, [alpha, 1 - alpha], axis=axis)
+    return low, high
+
+
+def _permutation_p(extreme, n_resamples):
+    return (extreme + 1) / (n_resamples + 1)
+
+
+def _bootstrap_pair_job(x, y, method, size, seed):
+    rng = np.random.default_rng(seed)
+    n = len(x)
+    batch = max(1, BATCH_ELEMENTS // max(n, 1))
+    index_type = np.int32 if n < np.iinfo(np.int32).max else np.int64
+    if method == "spearman":
+        unique_x, groups_x = np.unique(x, return_inverse=True)
+        unique_y, groups_y = np.unique(y, return_inverse=True)
+    else:
+        x = x - x.mean()
+        y = y - y.mean()
+    out = []
+    for start in range(0, size, batch):
+        index = rng.integers(0, n, size=(min(batch, size - start), n), dtype=index_type)
+        if method == "spearman":
+            a = _resample_ranks(groups_x, len(unique_x), index)
+            b = _resample_ranks(groups_y, len(unique_y), index)
+        else:
+            a, b = x[index], y[index]
+        out.append(_row_pearson(a, b))
+    return np.concatenate(out)
+
+
+def _permutation_pair_job(x, y, size, seed):
+    # x dan y sudah dipusatkan; hanya jumlah perkalian silang yang berubah per permutasi
+    rng = np.random.default_rng(seed)
+    batch = max(1, BATCH_ELEMENTS // max(len(y), 1))
+    scale = np.sqrt((x @ x) * (y @ y))
+    out = []
+    for start in range(0, size, batch):
+        shuffled = rng.permuted(np.broadcast_to(y, (min(batch, size - start), len(y))), axis=1)
+        out.append((shuffled @ x) / scale)
+    return np.concatenate(out)
+
+
+def _prepare_permutation(x, y, method):
+    # Untuk Spearman peringkat dihitung sekali; mengacak y tidak mengubah
+    # peringkatnya, jadi setiap permutasi cukup dihitung sebagai Pearson.
+    if method == "spearman":
+        x, y = stats.rankdata(x), stats.rankdata(y)
+    x = x - x.mean()
+    y = y - y.mean()
+    return x, y, _row_pearson(x[None, :], y[None, :])[0]
+
+
+def _count_extreme(null, observed):
+    return np.count_nonzero(np.abs(null) >= np.abs(observed) - 1e-12)
+
+
+def pair_tasks(x, y, method="pearson", n_resamples=2000, confidence=0.95, seed=0):
+    """Bootstrap dan permutasi satu pasangan sebagai daftar tugas.
+
+    ``x`` dan ``y`` adalah array float tanpa NaN dengan panjang sama.
+    Mengembalikan ``(tasks, finish)``. ``tasks`` berisi ``(fungsi, argumen)``
+    yang boleh dijalankan di mana saja; ``finish(hasil)`` menerima hasil
+    tugas dengan urutan yang sama dan mengembalikan ``(low, high, p)``:
+    interval bootstrap persentil dan nilai-p permutasi dua sisi.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    boot = _plan(_bootstrap_pair_job, (x, y, method), n_resamples, seed)
+    centered_x, centered_y, observed = _prepare_permutation(x, y, method)
+    perm = _plan(_permutation_pair_job, (centered_x, centered_y), n_resamples, seed)
+
+    def finish(results):
+        low, high = _interval(np.concatenate(results[:len(boot)]), confidence)
+        null = np.concatenate(results[len(boot):])
+        return float(low), float(high), float(_permutation_p(_count_extreme(null, observed), n_resamples))
+
+    return boot + perm, finish
+
+
+def _stacked_pearson(stacked):
+    """Korelasi Pearson untuk setiap resample dalam ``stacked``.
+
+    ``stacked`` berbentuk (resample x kolom x baris) tanpa NaN; semua
+    resample dihitung dengan satu perkalian matriks bertumpuk.
+    """
+    x = stacked - stacked.mean(axis=2, keepdims=True)
+    cov = np.matmul(x, x.transpose(0, 2, 1))
+    var = np.diagonal(cov, axis1=1, axis2=2)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r = cov / np.sqrt(var[:, :, None] * var[:, None, :])
+    r = np.clip(r, -1.0, 1.0)
+    if stacked.shape[2] < 2:
+        r[:] = np.nan
+    diagonal = np.arange(r.shape[1])
+    r[:, diagonal, diagonal] = np.where(np.isnan(r[:, diagonal, diagonal]), np.nan, 1.0)
+    return r
+
+
+def _pair_blocks(values):
+    """Bagi pasangan kolom menjadi blok tanpa NaN.
+
+    Kolom dikelompokkan menurut pola data hilangnya
+    (:func:`survei.correlation.missing_patterns`). Satu blok memuat kolom
+    kelompok ``g`` dan ``h`` pada baris yang terisi di keduanya, jadi setiap
+    pasangan antar kelompok itu dihitung pada baris pairwise-nya sendiri.
+    Menghasilkan ``(columns, left, right)``: ``columns`` array (kolom x
+    baris) dengan kolom ``left`` lalu ``right`` (sekali saja jika ``g == h``).
+    Pasangan yang diisi blok ini ada di ``r[:len(left), -len(right):]``.
+    """
+    patterns, members = missing_patterns(values)
+    for g in range(len(patterns)):
+        for h in range(g, len(patterns)):
+            rows = np.flatnonzero(patterns[g] & patterns[h])
+            index = members[g] if g == h else np.concatenate([members[g], members[h]])
+            yield np.ascontiguousarray(values[np.ix_(rows, index)].T), members[g], members[h]
+
+
+def _matrix_batch(n_rows, n_columns):
+    return max(1, MATRIX_BATCH_ELEMENTS // max(n_rows * n_columns, 1))
+
+
+def _bootstrap_matrix_job(values, method, size, seed):
+    rng = np.random.default_rng(seed)
+    k = values.shape[1]
+    out = np.full((size, k, k), np.nan)
+    for columns, left, right in _pair_blocks(values):
+        n = columns.shape[1]
+        if n == 0:
+            continue
+        if method == "spearman":
+            # Peringkat dihitung ulang di setiap resample, seperti ``rank_columns`` pada data resample
+            codes = [np.unique(column, return_inverse=True) for column in columns]
+        batch = _matrix_batch(n, len(columns))
+        for start in range(0, size, batch):
+            index = rng.integers(0, n, size=(min(batch, size - start), n))
+            if method == "spearman":
+                stacked = np.stack(
+                    [_resample_ranks(np.ravel(groups), len(unique), index) for unique, groups in codes], axis=1
+                )
+            else:
+                # Disalin menjadi (resample x kolom x baris) yang berurutan di memori:
+                # perkalian matriks bertumpuk pada view yang ditransposisi jauh lebih lambat
+                stacked = np.ascontiguousarray(columns[:, index].transpose(1, 0, 2))
+            r = _stacked_pearson(stacked)[:, :len(left), -len(right):]
+            out[start:start + len(index), left[:, None], right] = r
+            out[start:start + len(index), right[:, None], left] = r.transpose(0, 2, 1)
+    return out
+
+
+def _permutation_matrix_job(values, method, observed, size, seed):
+    # Di blok satu kelompok, kolom kecuali yang pertama diacak sendiri-sendiri,
+    # jadi setiap pasangan mendapat permutasi yang valid (mengacak kolom
+    # pertama juga sama saja dengan mengacak semua kolom dengan permutasi yang sama)
+    rng = np.random.default_rng(seed)
+    extreme = np.zeros(observed.shape, dtype=np.int64)
+    for columns, left, right in _pair_blocks(values):
+        n = columns.shape[1]
+        if n == 0:
+            continue
+        if method == "spearman":
+            # Mengacak tidak mengubah peringkat, jadi cukup dihitung sekali per blok
+            columns = rank_columns(columns.T).T
+        # Kolom dibakukan sekali (rata-rata 0, panjang 1): pengacakan tidak
+        # mengubahnya, jadi r = Z Z^T per permutasi
+        columns = columns - columns.mean(axis=1, keepdims=True)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            columns = columns / np.sqrt((columns * columns).sum(axis=1, keepdims=True))
+        target = np.abs(observed[np.ix_(left, right)]) - 1e-12
+        count = np.zeros(target.shape, dtype=np.int64)
+        batch = _matrix_batch(n, len(columns))
+        fixed, moving = columns[:len(left)], columns[len(left):]
+        for start in range(0, size, batch):
+            if len(moving):
+                # Blok antar kelompok hanya butuh pasangan kiri-kanan: cukup acak kolom kanan
+                shuffled = rng.permuted(np.broadcast_to(moving, (min(batch, size - start), *moving.shape)), axis=2)
+                r = np.matmul(fixed, shuffled.transpose(0, 2, 1))
+            else:
+                shuffled = np.repeat(columns[None], min(batch, size - start), axis=0)
+                shuffled[:, 1:] = rng.permuted(shuffled[:, 1:], axis=2)
+                r = np.matmul(shuffled, shuffled.transpose(0, 2, 1))
+            count += np.count_nonzero(np.abs(np.clip(r, -1.0, 1.0)) >= target, axis=0)
+        extreme[np.ix_(left, right)] = count
+        extreme[np.ix_(right, left)] = count.T
+    return extreme
+
+
+def _complete_rows(values, missing):
+    values = np.asarray(values, dtype=float)
+    if missing == "listwise":
+        values = values[~np.isnan(values).any(axis=1)]
+    return values
+
+
+def matrix_tasks(values, method="pearson", missing="pairwise", n_resamples=1000, confidence=0.95, seed=0):
+    """Seperti :func:`pair_tasks`, untuk semua pasangan kolom sekaligus.
+
+    ``values`` boleh berisi NaN; ``missing`` sama seperti pada
+    :func:`survei.correlation.correlation_matrix`. Pada mode pairwise setiap
+    pasangan di-resample dan diacak hanya pada baris yang terisi di kedua
+    kolomnya, sama seperti :func:`pair_tasks` untuk satu pasangan.
+    ``finish(hasil)`` mengembalikan matriks ``(low, high, p)``.
+    """
+    values = _complete_rows(values, missing)
+    boot = _plan(_bootstrap_matrix_job, (values, method), n_resamples, seed)
+    observed = correlation_matrix(values, method=method, missing="pairwise")[0]
+    perm = _plan(_permutation_matrix_job, (values, method, observed), n_resamples, seed)
+
+    def finish(results):
+        low, high = _interval(np.concatenate(results[:len(boot)]), confidence, axis=0)
+        return low, high, _permutation_p(sum(results[len(boot):]), n_resamples)
+
+    return boot + perm, finish
@@ -0,0 +1,415 @@
+"""Penyimpanan dataset lokal (SQLite) dengan filter yang dijalankan di database.
+
+Setiap dataset yang diunggah disimpan sebagai satu tabel di satu file
+SQLite, sehingga tetap tersedia setelah server dimulai ulang. Saat
+analisis, kondisi baris (``kolom <operator> nilai``) dan daftar kolom
+diterjemahkan ke satu query berparameter: hanya responden dan variabel
+yang dipilih yang dibaca ke memori.
+
+Arti setiap operator sama dengan :func:`survei.preview.filter_mask`,
+jadi :func:`filter_frame` (untuk DataFrame yang sudah di memori) dan
+:meth:`DatasetStore.query` memberi baris yang sama.
+
+Batch responden baru bisa ditambahkan ke dataset tersimpan
+(:meth:`DatasetStore.append`). Setiap dataset menyimpan akumulator
+statistiknya (:class:`survei.incremental.DatasetAccumulator`), yang
+diperbarui hanya dengan baris batch.
+
+Ukuran penyimpanan dibatasi seperti :class:`survei.cache.DiskCache`: dataset
+yang paling lama tidak dibuka dihapus lebih dulu jika total ukurannya
+melebihi ``budget_bytes``, dan dataset yang tidak dibuka selama
+``max_age_seconds`` dihapus.
+"""
+
+import datetime
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import time
+
+import numpy as np
+import pandas as pd
+
+from survei.dtypes import optimize_dtypes
+from survei.incremental import DatasetAccumulator
+from survei.preview import FILTER_OPERATORS, filter_mask
+
+# Operator perbandingan -> SQL; perbandingan dengan NULL selalu gagal,
+# sama seperti baris kosong pada ``filter_mask``
+_SQL_OPERATORS = {"=": "=", "≠": "<>", ">": ">", "≥": ">=", "<": "<", "≤": "<="}
+# Operator urutan hanya berarti untuk angka: di memori kolom kategori
+# menolak perbandingan, sedangkan SQLite membandingkan teks per huruf
+ORDERING_OPERATORS = (">", "≥", "<", "≤")
+# Jumlah baris per INSERT saat menyimpan dataset
+INSERT_CHUNK_ROWS = 10_000
+
+
+def column_kind(series):
+    """Jenis kolom untuk filter: ``"boolean"``, ``"numeric"`` atau ``"text"``."""
+    if pd.api.types.is_bool_dtype(series.dtype):
+        return "boolean"
+    if pd.api.types.is_numeric_dtype(series.dtype):
+        return "numeric"
+    return "text"
+
+
+def filter_operators(kind):
+    """Operator yang boleh dipakai untuk kolom berjenis ``kind``."""
+    if kind == "numeric":
+        return list(FILTER_OPERATORS)
+    return [operator for operator in FILTER_OPERATORS if operator not in ORDERING_OPERATORS]
+
+
+def filter_parameter(kind, operator, value):
+    """Nilai pembanding untuk satu kondisi, dengan aturan yang sama seperti ``filter_mask``.
+
+    Kolom numerik dan boolean membutuhkan angka (``ValueError`` jika gagal);
+    ``contains`` selalu membandingkan sebagai teks. Operator urutan
+    (``>``, ``≥``, ``<``, ``≤``) hanya untuk kolom numerik.
+    """
+    if operator == "contains":
+        return str(value)
+    if operator not in _SQL_OPERATORS:
+        raise ValueError(f"Operator tidak dikenal: {operator}")
+    if operator in ORDERING_OPERATORS and kind != "numeric":
+        raise ValueError(f"Operator {operator} hanya untuk kolom numerik")
+    if kind in ("numeric", "boolean"):
+        return float(value)
+    return str(value)
+
+
+def filter_frame(df, filters, columns=None):
+    """Baris ``df`` yang memenuhi semua ``filters`` (dan hanya ``columns`` jika diberikan).
+
+    ``filters`` adalah daftar ``(kolom, operator, nilai)``.
+    """
+    mask = np.ones(len(df), dtype=bool)
+    for name, operator, value in filters:
+        mask &= filter_mask(df[name], operator, value)
+    subset = df.loc[mask] if len(filters) else df
+    if columns:
+        subset = subset[list(columns)]
+    return subset.reset_index(drop=True)
+
+
+def estimated_bytes(frame):
+    """Perkiraan ukuran ``frame`` di file SQLite (byte).
+
+    Angka dihitung 8 byte per nilai terisi, teks sepanjang isinya, ditambah
+    overhead per baris. Cukup untuk membatasi ukuran penyimpanan tanpa
+    membaca ulang tabel.
+    """
+    total = len(frame) * (len(frame.columns) + 8)
+    for name in frame.columns:
+        series = frame[name]
+        if column_kind(series) == "text":
+            total += int(series.dropna().astype(str).str.len().sum())
+        else:
+            total += 8 * int(series.notna().sum())
+    return total
+
+
+def _bindable(value):
+    # Nilai sel -> tipe yang diterima sqlite3, sama seperti ``to_sql`` saat
+    # dataset pertama kali disimpan (waktu -> teks ISO, skalar NumPy -> Python)
+    if value is None or value is pd.NaT or value is pd.NA:
+        return None
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float) and np.isnan(value):
+        return None
+    if isinstance(value, datetime.datetime):
+        return value.isoformat(" ")
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, datetime.timedelta):
+        return pd.Timedelta(value).value
+    return value
+
+
+def _quote(name):
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def _like_pattern(value):
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def where_clause(filters, kinds):
+    """Klausa ``WHERE`` berparameter dan daftar parameternya untuk ``filters``."""
+    conditions = []
+    params = []
+    for name, operator, value in filters:
+        column = _quote(name)
+        value = filter_parameter(kinds[name], operator, value)
+        if operator == "contains":
+            # LIKE di SQLite tidak membedakan huruf besar/kecil (ASCII); boolean
+            # tersimpan sebagai 0/1, jadi dibandingkan sebagai "True"/"False"
+            if kinds[name] == "boolean":
+                column = f"CASE {column} WHEN 1 THEN 'True' WHEN 0 THEN 'False' END"
+            conditions.append(f"CAST({column} AS TEXT) LIKE ? ESCAPE '\\'")
+            params.append(_like_pattern(value))
+        else:
+            conditions.append(f"{column} {_SQL_OPERATORS[operator]} ?")
+            params.append(value)
+    if not conditions:
+        return "", []
+    return " WHERE " + " AND ".join(conditions), params
+
+
+class DatasetStore:
+    """Dataset tersimpan di satu file SQLite, dikenali lewat kunci dataset.
+
+    Koneksi dibuka per operasi, jadi satu objek aman dipakai bersama oleh
+    semua sesi (thread) Streamlit. Mode WAL membuat pembacaan tidak
+    terhalang penyimpanan dataset lain.
+
+    ``budget_bytes`` membatasi total perkiraan ukuran dataset dan
+    ``max_age_seconds`` umur dataset sejak terakhir dibuka (None = tanpa
+    batas); lihat :meth:`evict`.
+    """
+
+    def __init__(self, path, budget_bytes=None, max_age_seconds=None):
+        self.path = path
+        self.budget_bytes = budget_bytes
+        self.max_age_seconds = max_age_seconds
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as con:
+            # Hanya berlaku untuk file baru: halaman tabel yang dihapus dikembalikan ke sistem
+            con.execute("PRAGMA auto_vacuum=INCREMENTAL")
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute(
+                "CREATE TABLE IF NOT EXISTS datasets ("
+                "key TEXT PRIMARY KEY, name TEXT, table_name TEXT, "
+                "n_rows INTEGER, columns TEXT, created REAL, version INTEGER DEFAULT 0, "
+                "nbytes INTEGER DEFAULT 0, used REAL DEFAULT 0)"
+            )
+            # File dari versi sebelumnya belum punya kolom versi, ukuran dan waktu buka terakhir
+            existing = [row[1] for row in con.execute("PRAGMA table_info(datasets)")]
+            for column, definition in (("version", "INTEGER DEFAULT 0"), ("nbytes", "INTEGER DEFAULT 0"), ("used", "REAL DEFAULT 0")):
+                if column not in existing:
+                    con.execute(f"ALTER TABLE datasets ADD COLUMN {column} {definition}")
+            # Akumulator disimpan dengan pickle; file ini hanya ditulis oleh server sendiri
+            con.execute("CREATE TABLE IF NOT EXISTS accumulators (key TEXT PRIMARY KEY, data BLOB)")
+            con.execute(
+                "CREATE TABLE IF NOT EXISTS batches ("
+                "key TEXT, digest TEXT, n_rows INTEGER, added REAL, version INTEGER, first_rowid INTEGER)"
+            )
+            # Batch dari versi sebelumnya tidak mencatat versi dan rowid pertamanya
+            existing = [row[1] for row in con.execute("PRAGMA table_info(batches)")]
+            for column in ("version", "first_rowid"):
+                if column not in existing:
+                    con.execute(f"ALTER TABLE batches ADD COLUMN {column} INTEGER")
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def _table_name(key):
+        return "ds_" + hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+
+    def __contains__(self, key):
+        return self.info(key) is not None
+
+    def info(self, key):
+        """Metadata satu dataset (nama, jumlah baris, jenis kolom) atau None."""
+        with self._connect() as con:
+            row = con.execute(
+                "SELECT name, table_name, n_rows, columns, created, version, nbytes, used FROM datasets WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        name, table_name, n_rows, columns, created, version, nbytes, used = row
+        return {
+            "key": key,
+            "name": name,
+            "table": table_name,
+            "n_rows": n_rows,
+            "kinds": dict(json.loads(columns)),
+            "created": created,
+            "version": version,
+            "nbytes": nbytes,
+            "used": max(used, created),
+        }
+
+    def datasets(self):
+        """Semua dataset tersimpan, yang terbaru lebih dulu."""
+        with self._connect() as con:
+            keys = [row[0] for row in con.execute("SELECT key FROM datasets ORDER BY created DESC")]
+        return [info for info in map(self.info, keys) if info is not None]
+
+    def ingest(self, key, name, df):
+        """Simpan ``df`` sebagai dataset ``key``; tidak ada yang dilakukan jika sudah tersimpan.
+
+        ``ValueError`` jika perkiraan ukurannya saja sudah melebihi
+        ``budget_bytes``. Setelah disimpan, dataset lain bisa dihapus agar
+        total ukuran kembali di bawah batas.
+        """
+        if key in self:
+            return False
+        nbytes = estimated_bytes(df)
+        if self.budget_bytes is not None and nbytes > self.budget_bytes:
+            raise ValueError("Dataset lebih besar dari batas ukuran penyimpanan")
+        table_name = self._table_name(key)
+        kinds = [[str(column), column_kind(df[column])] for column in df.columns]
+        frame = df.copy(deep=False)
+        frame.columns = [str(column) for column in df.columns]
+        for column in frame.columns:
+            # Kategori disimpan sebagai teks biasa
+            if isinstance(frame[column].dtype, pd.CategoricalDtype):
+                frame[column] = frame[column].astype(object)
+        accumulator = DatasetAccumulator([name for name, kind in kinds if kind == "numeric"])
+        accumulator.update(frame)
+        with self._connect() as con:
+            con.execute(f"DROP TABLE IF EXISTS {_quote(table_name)}")
+            frame.to_sql(table_name, con, index=False, chunksize=INSERT_CHUNK_ROWS)
+            now = time.time()
+            con.execute(
+                "INSERT OR REPLACE INTO datasets (key, name, table_name, n_rows, columns, created, version, nbytes, used) "
+                "VALUES (?, ?, ?, ?, ?, ?, 0, ?, ?)",
+                (key, name, table_name, len(frame), json.dumps(kinds), now, nbytes, now)
+            )
+            con.execute("INSERT OR REPLACE INTO accumulators VALUES (?, ?)", (key, pickle.dumps(accumulator)))
+        self.evict()
+        return True
+
+    def accumulator(self, key):
+        """Akumulator statistik kolom numerik dataset ``key`` (None jika belum ada)."""
+        with self._connect() as con:
+            row = con.execute("SELECT data FROM accumulators WHERE key = ?", (key,)).fetchone()
+        return None if row is None else pickle.loads(row[0])
+
+    def append(self, key, batch, digest=None):
+        """Tambahkan baris ``batch`` ke dataset ``key`` dan perbarui akumulatornya.
+
+        Kolom batch harus sama dengan kolom dataset (urutan boleh berbeda)
+        dan kolom numerik harus tetap numerik; jika tidak, ``ValueError``.
+        ``digest`` (hash isi file batch) mencegah batch yang sama ditambahkan
+        dua kali, dan dataset tidak boleh melebihi ``budget_bytes`` setelah
+        ditambah. Mengembalikan metadata dataset setelah ditambah.
+        """
+        info = self.info(key)
+        kinds = info["kinds"]
+        batch = batch.copy(deep=False)
+        batch.columns = [str(column) for column in batch.columns]
+        missing = [name for name in kinds if name not in batch.columns]
+        extra = [name for name in batch.columns if name not in kinds]
+        if missing or extra:
+            raise ValueError(f"Kolom batch tidak sama dengan dataset (kurang: {missing}, lebih: {extra})")
+        for name, kind in kinds.items():
+            if kind != "text" and column_kind(batch[name]) == "text" and batch[name].notna().any():
+                raise ValueError(f"Kolom {name} harus berisi angka")
+        batch = batch[list(kinds)]
+        nbytes = estimated_bytes(batch)
+        if self.budget_bytes is not None and info["nbytes"] + nbytes > self.budget_bytes:
+            raise ValueError("Dataset akan melebihi batas ukuran penyimpanan")
+
+        rows = [tuple(map(_bindable, row)) for row in batch.astype(object).itertuples(index=False, name=None)]
+        insert = (
+            f"INSERT INTO {_quote(info['table'])} ({', '.join(map(_quote, kinds))}) "
+            f"VALUES ({', '.join('?' * len(kinds))})"
+        )
+        con = self._connect()
+        try:
+            # Kunci tulis sejak awal agar dua penambahan bersamaan tidak saling menimpa akumulator
+            con.execute("BEGIN IMMEDIATE")
+            if digest is not None and con.execute(
+                "SELECT 1 FROM batches WHERE key = ? AND digest = ?", (key, digest)
+            ).fetchone():
+                raise ValueError("Batch ini sudah pernah ditambahkan ke dataset")
+            row = con.execute("SELECT data FROM accumulators WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                # Dataset lama tanpa akumulator: dibangun sekali dari seluruh tabel
+                accumulator = DatasetAccumulator([name for name, kind in kinds.items() if kind == "numeric"])
+                accumulator.update(pd.read_sql_query(f"SELECT * FROM {_quote(info['table'])}", con))
+            else:
+                accumulator = pickle.loads(row[0])
+            accumulator.update(batch)
+            first_rowid = con.execute(f"SELECT COALESCE(MAX(rowid), 0) + 1 FROM {_quote(info['table'])}").fetchone()[0]
+            con.executemany(insert, rows)
+            con.execute(
+                "UPDATE datasets SET n_rows = n_rows + ?, version = version + 1, nbytes = nbytes + ?, used = ? WHERE key = ?",
+                (len(batch), nbytes, time.time(), key)
+            )
+            con.execute("INSERT OR REPLACE INTO accumulators VALUES (?, ?)", (key, pickle.dumps(accumulator)))
+            con.execute(
+                "INSERT INTO batches VALUES (?, ?, ?, ?, (SELECT version FROM datasets WHERE key = ?), ?)",
+                (key, digest, len(batch), time.time(), key, first_rowid)
+            )
+            con.commit()
+        except BaseException:
+            con.rollback()
+            raise
+        finally:
+            con.close()
+        self.evict()
+        return self.info(key)
+
+    def remove(self, key):
+        info = self.info(key)
+        if info is None:
+            return
+        with self._connect() as con:
+            con.execute(f"DROP TABLE IF EXISTS {_quote(info['table'])}")
+            con.execute("DELETE FROM datasets WHERE key = ?", (key,))
+            con.execute("DELETE FROM accumulators WHERE key = ?", (key,))
+            con.execute("DELETE FROM batches WHERE key = ?", (key,))
+            con.commit()
+            con.execute("PRAGMA incremental_vacuum")
+
+    def evict(self):
+        """Hapus dataset kedaluwarsa, lalu yang paling lama tidak dibuka sampai total ukuran <= ``budget_bytes``.
+
+        Mengembalikan kunci dataset yang dihapus.
+        """
+        with self._connect() as con:
+            rows = con.execute("SELECT key, nbytes, MAX(used, created) FROM datasets ORDER BY MAX(used, created)").fetchall()
+        total = sum(nbytes for _, nbytes, _ in rows)
+        oldest = None if self.max_age_seconds is None else time.time() - self.max_age_seconds
+        removed = []
+        for key, nbytes, used in rows:
+            over_budget = self.budget_bytes is not None and total > self.budget_bytes
+            if over_budget or (oldest is not None and used < oldest):
+                self.remove(key)
+                total -= nbytes
+                removed.append(key)
+        return removed
+
+    def _first_rowid(self, con, key, version):
+        # Rowid pertama batch yang ditambahkan setelah ``version``
+        rows = con.execute("SELECT first_rowid FROM batches WHERE key = ? AND version > ?", (key, version)).fetchall()
+        if any(first is None for first, in rows):
+            raise ValueError("Batch lama tidak mencatat posisi barisnya")
+        if not rows:
+            return con.execute(f"SELECT COALESCE(MAX(rowid), 0) + 1 FROM {_quote(self.info(key)['table'])}").fetchone()[0]
+        return min(first for first, in rows)
+
+    def query(self, key, columns=None, filters=(), since_version=None):
+        """DataFrame berisi hanya ``columns`` dari baris yang memenuhi ``filters``.
+
+        Tipe data dioptimalkan ulang seperti saat unggah (Likert -> int8,
+        teks berulang -> category); kolom boolean dikembalikan ke ``boolean``.
+        Dengan ``since_version`` hanya baris yang ditambahkan setelah versi
+        itu yang dibaca (``ValueError`` jika posisinya tidak tercatat).
+        """
+        info = self.info(key)
+        kinds = info["kinds"]
+        columns = list(columns) if columns else list(kinds)
+        where, params = where_clause(filters, kinds)
+        select = ", ".join(_quote(column) for column in columns)
+        with self._connect() as con:
+            if since_version is not None:
+                where = f"{where} AND rowid >= ?" if where else " WHERE rowid >= ?"
+                params = [*params, self._first_rowid(con, key, since_version)]
+            df = pd.read_sql_query(f"SELECT {select} FROM {_quote(info['table'])}{where}", con, params=params)
+            con.execute("UPDATE datasets SET used = ? WHERE key = ?", (time.time(), key))
+        df = optimize_dtypes(df)
+        for column in columns:
+            if kinds[column] == "boolean":
+                df[column] = df[column].astype("boolean")
+        return df
@@ -0,0 +1,169 @@
+"""Statistik deskriptif bertahap (streaming) untuk file CSV besar.
+
+File dibaca per potongan (chunk) sehingga DataFrame penuh tidak pernah
+dibuat. Setiap kolom numerik punya akumulator berjalan (count, mean, std,
+min, max) dan sketsa kuantil yang bisa digabung (mergeable).
+"""
+
+import numpy as np
+import pandas as pd
+
+DESCRIBE_COLUMNS = ["count", "mean", "std", "min", "25%", "50%", "75%", "max"]
+
+
+class RunningStats:
+    """Akumulator count/mean/M2/min/max per kolom (Welford/Chan).
+
+    Semua kolom diproses sekaligus sebagai array; nilai NaN diabaikan.
+    """
+
+    def __init__(self, n_columns):
+        self.count = np.zeros(n_columns)
+        self.mean = np.zeros(n_columns)
+        self.m2 = np.zeros(n_columns)
+        self.min = np.full(n_columns, np.inf)
+        self.max = np.full(n_columns, -np.inf)
+
+    def update(self, block):
+        """Tambahkan blok 2D (baris x kolom) bertipe float."""
+        block = np.asarray(block, dtype=float)
+        valid = ~np.isnan(block)
+        count = valid.sum(axis=0).astype(float)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            mean = np.where(count > 0, np.nansum(block, axis=0) / count, 0.0)
+        m2 = np.nansum((block - mean) ** 2, axis=0)
+        other = RunningStats(block.shape[1])
+        other.count, other.mean, other.m2 = count, mean, m2
+        if block.shape[0]:
+            other.min = np.where(valid, block, np.inf).min(axis=0)
+            other.max = np.where(valid, block, -np.inf).max(axis=0)
+        self.merge(other)
+
+    def merge(self, other):
+        """Gabungkan akumulator lain ke akumulator ini (rumus Chan)."""
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        with np.errstate(invalid="ignore", divide="ignore"):
+            share = np.where(total > 0, other.count / total, 0.0)
+            self.m2 = self.m2 + other.m2 + np.where(total > 0, delta ** 2 * self.count * share, 0.0)
+        self.mean = self.mean + delta * share
+        self.count = total
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+
+    @property
+    def std(self):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return np.where(self.count > 1, np.sqrt(self.m2 / (self.count - 1)), np.nan)
+
+
+class QuantileSketch:
+    """Sketsa kuantil sederhana bergaya KLL yang bisa digabung.
+
+    Setiap level menampung paling banyak ``k`` nilai; level yang penuh
+    diurutkan lalu separuh nilainya (posisi ganjil/genap acak) dinaikkan
+    ke level berikutnya dengan bobot dua kali lipat.
+    """
+
+    def __init__(self, k=1024, seed=0):
+        self.k = k
+        self.levels = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def update(self, values):
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def merge(self, other):
+        for level, items in enumerate(other.levels):
+            if level >= len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self._compress()
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self.k:
+                items = np.sort(items)
+                keep = items[:1] if len(items) % 2 else items[:0]
+                items = items[len(keep):]
+                promoted = items[self._rng.integers(2)::2]
+                self.levels[level] = keep
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def quantiles(self, qs):
+        values = np.concatenate(self.levels)
+        if values.size == 0:
+            return np.full(len(qs), np.nan)
+        weights = np.concatenate([np.full(len(items), 2.0 ** level) for level, items in enumerate(self.levels)])
+        order = np.argsort(values, kind="stable")
+        values = values[order]
+        cumulative = np.cumsum(weights[order])
+        targets = np.asarray(qs) * cumulative[-1]
+        index = np.searchsorted(cumulative, targets, side="left")
+        return values[np.minimum(index, len(values) - 1)]
+
+
+def summary_table(columns, stats, sketches):
+    """Susun tabel bergaya ``df.describe().T`` dari akumulator."""
+    quantiles = np.array([sketch.quantiles([0.25, 0.5, 0.75]) for sketch in sketches]).reshape(len(columns), 3)
+    has_data = stats.count > 0
+    table = pd.DataFrame({
+        "count": stats.count,
+        "mean": np.where(has_data, stats.mean, np.nan),
+        "std": stats.std,
+        "min": np.where(has_data, stats.min, np.nan),
+        "25%": quantiles[:, 0],
+        "50%": quantiles[:, 1],
+        "75%": quantiles[:, 2],
+        "max": np.where(has_data, stats.max, np.nan),
+    }, index=pd.Index(columns))
+    return table[DESCRIBE_COLUMNS]
+
+
+def stream_describe(buffer, chunksize=100_000, on_progress=None, preview_rows=100, **read_options):
+    """Baca CSV per potongan dan hitung statistik deskriptif kolom numerik.
+
+    Kolom numerik ditentukan dari potongan pertama; nilai non-numerik pada
+    potongan berikutnya dianggap hilang. ``on_progress(rows)`` dipanggil
+    setelah setiap potongan selesai diproses.
+
+    Mengembalikan dict berisi ``table`` (bergaya ``describe().T``),
+    ``n_rows``, ``columns`` (semua kolom) dan ``preview`` (baris awal).
+    """
+    columns = None
+    numeric_cols = []
+    stats = None
+    sketches = []
+    preview = None
+    n_rows = 0
+    for chunk in pd.read_csv(buffer, chunksize=chunksize, **read_options):
+        if columns is None:
+            columns = chunk.columns.tolist()
+            numeric_cols = chunk.select_dtypes(include=[np.number]).columns.tolist()
+            stats = RunningStats(len(numeric_cols))
+            sketches = [QuantileSketch(seed=i) for i in range(len(numeric_cols))]
+            preview = chunk.head(preview_rows)
+        block = chunk[numeric_cols].apply(pd.to_numeric, errors="coerce").to_numpy(dtype=float)
+        stats.update(block)
+        for i, sketch in enumerate(sketches):
+            sketch.update(block[:, i])
+        n_rows += len(chunk)
+        if on_progress is not None:
+            on_progress(n_rows)
+    if columns is None:
+        columns, stats = [], RunningStats(0)
+        preview = pd.DataFrame()
+    return {
+        "table": summary_table(numeric_cols, stats, sketches),
+        "n_rows": n_rows,
+        "columns": columns,
+        "preview": preview,
+    }
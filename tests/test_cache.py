@@ -0,0 +1,28 @@
+import os
+import stat
+
+import pandas as pd
+import pytest
+
+from survei.cache import DiskCache
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.mark.skipif(not hasattr(os, "getuid"), reason="izin file POSIX")
+def test_disk_cache_is_private(tmp_path):
+    directory = tmp_path / "survei-cache"
+    cache = DiskCache(str(directory), 1024 * 1024)
+    assert cache.put("key", pd.DataFrame({"Q1": [1, 2, 3]}))
+
+    assert stat.S_IMODE(os.stat(directory).st_mode) == 0o700
+    files = [entry for entry in os.scandir(directory) if entry.name.endswith(DiskCache.suffix)]
+    assert [stat.S_IMODE(entry.stat().st_mode) for entry in files] == [0o600]
+    assert cache.get("key")["Q1"].tolist() == [1, 2, 3]
+
+
+def test_disk_cache_can_be_disabled(tmp_path):
+    cache = DiskCache(str(tmp_path / "survei-cache"), 0)
+
+    assert not cache.put("key", pd.DataFrame({"Q1": [1]}))
+    assert not (tmp_path / "survei-cache").exists()
@@ -0,0 +1,30 @@
+import numpy as np
+from scipy import stats
+
+from survei.correlation import correlation_matrix, rank_columns, spearman_matrix_from_ranks
+
+
+def _survey_with_gaps(seed=0, n=400, k=5, missing=0.2):
+    rng = np.random.default_rng(seed)
+    values = rng.integers(1, 6, size=(n, k)).astype(float)
+    values[:, 1] = np.clip(values[:, 0] + rng.integers(-1, 2, size=n), 1, 5)
+    values[rng.random((n, k)) < missing] = np.nan
+    # Dua kolom dengan pola data hilang yang sama (memakai peringkat kolom langsung)
+    values[:, 3] = np.where(np.isnan(values[:, 2]), np.nan, values[:, 3])
+    return values
+
+
+def test_pairwise_spearman_matches_scipy():
+    values = _survey_with_gaps()
+    r, p, n = correlation_matrix(values, method="spearman", missing="pairwise")
+    from_ranks = spearman_matrix_from_ranks(rank_columns(values))
+
+    for i in range(values.shape[1]):
+        for j in range(i + 1, values.shape[1]):
+            valid = ~np.isnan(values[:, i]) & ~np.isnan(values[:, j])
+            expected = stats.spearmanr(values[valid, i], values[valid, j])
+            assert n[i, j] == valid.sum()
+            np.testing.assert_allclose(r[i, j], expected.statistic, rtol=0, atol=1e-12)
+            np.testing.assert_allclose(p[i, j], expected.pvalue, rtol=0, atol=1e-12)
+    for got, want in zip(from_ranks, (r, p, n)):
+        np.testing.assert_allclose(got, want, rtol=0, atol=1e-12)
@@ -0,0 +1,71 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from survei.cache import estimate_nbytes
+from survei.dtypes import append_rows
+from survei.store import DatasetStore, estimated_bytes
+
+
+def test_append_datetime_column(tmp_path):
+    store = DatasetStore(str(tmp_path / "datasets.sqlite"))
+    first = pd.DataFrame({
+        "waktu": pd.to_datetime(["2024-01-01 08:00:00", "2024-01-02 09:30:00"]),
+        "Q1": [4, 5],
+    })
+    store.ingest("survei", "survei.xlsx", first)
+
+    batch = pd.DataFrame({
+        "waktu": pd.to_datetime(["2024-01-03 10:15:00", None]),
+        "Q1": np.array([3, 2], dtype=np.int8),
+    })
+    info = store.append("survei", batch)
+
+    assert info["n_rows"] == 4
+    assert info["version"] == 1
+    df = store.query("survei")
+    assert df["waktu"].tolist()[:3] == ["2024-01-01 08:00:00", "2024-01-02 09:30:00", "2024-01-03 10:15:00"]
+    assert pd.isna(df["waktu"].iloc[3])
+    assert df["Q1"].tolist() == [4, 5, 3, 2]
+    assert store.accumulator("survei").describe()["count"].tolist() == [4]
+
+
+def test_budget_evicts_least_recently_used(tmp_path):
+    frame = pd.DataFrame({"Q1": np.arange(100, dtype=float)})
+    budget = 2 * estimated_bytes(frame) + 10
+    store = DatasetStore(str(tmp_path / "datasets.sqlite"), budget_bytes=budget)
+    store.ingest("a", "a.csv", frame)
+    store.ingest("b", "b.csv", frame)
+    store.query("a")
+    store.ingest("c", "c.csv", frame)
+
+    assert sorted(info["key"] for info in store.datasets()) == ["a", "c"]
+    with pytest.raises(ValueError):
+        store.ingest("d", "d.csv", pd.concat([frame] * 3))
+
+
+
+def test_query_since_version_reads_only_new_rows(tmp_path):
+    store = DatasetStore(str(tmp_path / "datasets.sqlite"))
+    store.ingest("survei", "survei.csv", pd.DataFrame({"fakultas": ["Teknik", "Hukum"] * 50, "Q1": [1, 5] * 50}))
+    before = store.query("survei")
+    store.append("survei", pd.DataFrame({"fakultas": ["Teknik", "Ekonomi"], "Q1": [4, 2]}))
+    store.append("survei", pd.DataFrame({"fakultas": ["Hukum"], "Q1": [3]}))
+
+    assert store.query("survei", since_version=0)["Q1"].tolist() == [4, 2, 3]
+    assert store.query("survei", since_version=1)["fakultas"].tolist() == ["Hukum"]
+    assert store.query("survei", since_version=2).empty
+    assert store.query("survei", ["Q1"], [("fakultas", "=", "Teknik")], since_version=0)["Q1"].tolist() == [4]
+
+    extended = append_rows(before, store.query("survei", since_version=0))
+    assert isinstance(extended["fakultas"].dtype, pd.CategoricalDtype)
+    pd.testing.assert_frame_equal(extended.astype(object), store.query("survei").astype(object))
+
+
+def test_accumulator_is_sized_for_cache_budget(tmp_path):
+    store = DatasetStore(str(tmp_path / "datasets.sqlite"))
+    columns = [f"Q{i}" for i in range(50)]
+    store.ingest("survei", "survei.csv", pd.DataFrame(np.ones((10, 50)), columns=columns))
+
+    # Empat matriks co-moment k x k sudah jauh di atas nol
+    assert estimate_nbytes(store.accumulator("survei")) >= 4 * 50 * 50 * 8